@@ -68,7 +68,8 @@ print("\n🎉 Basic factorial calculation complete!")
 # =============================================================================
 
 import math
-import time
+import statistics
+import timeit
 from functools import lru_cache
 
 def comprehensive_factorial_calculator():
@@ -164,17 +165,17 @@ def comprehensive_factorial_calculator():
         
         print(f"\n⚡ PERFORMANCE BENCHMARK FOR {n}!:")
         print("-" * 50)
-        print(f"{'Method':<25} {'Time (ms)':<12} {'Result'}")
+        print(f"{'Method':<25} {'Median (ms)':<12} {'Result'}")
         print("-" * 50)
         
         results = {}
         for method_name, method_func in methods:
             try:
-                start_time = time.perf_counter()
-                result = method_func(n)
-                end_time = time.perf_counter()
+                result = method_func(n)  # Warmup run (also fills the memoized cache)
                 
-                execution_time = (end_time - start_time) * 1000  # Convert to milliseconds
+                # Median of repeated runs is far less noisy than a single run
+                timings = timeit.repeat(lambda: method_func(n), repeat=5, number=1)
+                execution_time = statistics.median(timings) * 1000  # Convert to milliseconds
                 results[method_name] = (execution_time, result)
                 
                 # Truncate very long results for display
@@ -0,0 +1,301 @@
+"""
+Day 5 Solution: Vectorized Compound Interest
+============================================
+
+Functions & Variable Scope - vectorized_interest.py
+
+compound_interest() answers one question at a time: one principal, one rate,
+one period, one compounding frequency. Rate-sensitivity grids built by
+calling it in nested loops spend almost all their time in the loops. This
+solution evaluates whole arrays of scenarios in one call using NumPy
+broadcasting.
+
+This solution demonstrates:
+1. Broadcasting: arrays of different shapes combine without loops
+2. Outer-product grids of every scenario combination
+3. Continuous compounding as the limit of ever more frequent compounding
+4. Analytic rate sensitivity instead of re-running with bumped rates
+5. Printing one table instead of one summary per call
+
+Key Formulas:
+- Periodic:   A = P(1 + r/n)^(nt)
+- Continuous: A = P * e^(rt)
+- Sensitivity per percentage point: dA/dr = A * t / (100 + r/n)
+"""
+
+import math
+import time
+from itertools import product
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; scenarios are then computed in plain Python
+    np = None
+
+
+# Use as a compounding frequency for continuous compounding
+CONTINUOUS = math.inf
+
+FREQUENCY_NAMES = {1: "Annual", 2: "Semiannual", 4: "Quarterly", 12: "Monthly",
+                   52: "Weekly", 365: "Daily", CONTINUOUS: "Continuous"}
+
+
+def _check_frequencies(compound_frequency):
+    """Raise ValueError if any compounding frequency is not positive."""
+    if np is not None:
+        if np.any(np.asarray(compound_frequency) <= 0):
+            raise ValueError("Compounding frequency must be positive")
+    elif any(n <= 0 for n in _as_list(compound_frequency)):
+        raise ValueError("Compounding frequency must be positive")
+
+
+def _as_list(values):
+    """Scalars become one-element lists; sequences become lists."""
+    if isinstance(values, (int, float)):
+        return [values]
+    return list(values)
+
+
+def _growth_factor(rate, years, compound_frequency):
+    """(1 + r/n)^(nt) for one scenario, or e^(rt) when n is CONTINUOUS."""
+    rate_decimal = rate / 100
+    if compound_frequency == CONTINUOUS:
+        return math.exp(rate_decimal * years)
+    return (1 + rate_decimal / compound_frequency) ** (compound_frequency * years)
+
+
+def compound_interest_array(principal, rate, years, compound_frequency=1):
+    """
+    Calculate compound interest for many scenarios at once
+
+    Arguments may be numbers or arrays; arrays are broadcast against each
+    other like NumPy arithmetic, so passing 1,000 rates with one principal
+    gives 1,000 results.
+
+    Args:
+        principal (float or array): Initial amounts of money
+        rate (float or array): Annual interest rates (as percentage, e.g., 5 for 5%)
+        years (float or array): Numbers of years
+        compound_frequency (float or array): Compounding periods per year,
+            or CONTINUOUS (default: 1)
+
+    Returns:
+        tuple: (final_amounts, interest_earned) as NumPy arrays, or lists
+        without NumPy (then arrays must all have the same length)
+
+    Raises:
+        ValueError: If a compounding frequency is not positive
+    """
+    _check_frequencies(compound_frequency)
+
+    if np is None:
+        columns = [_as_list(v) for v in (principal, rate, years, compound_frequency)]
+        length = max(len(column) for column in columns)
+        if any(len(column) not in (1, length) for column in columns):
+            raise ValueError("All arrays must have the same length")
+        columns = [column * length if len(column) == 1 else column for column in columns]
+        final_amounts = [p * _growth_factor(r, t, n) for p, r, t, n in zip(*columns)]
+        return final_amounts, [a - p for a, p in zip(final_amounts, columns[0])]
+
+    principal = np.asarray(principal, dtype=float)
+    rate_decimal = np.asarray(rate, dtype=float) / 100
+    years = np.asarray(years, dtype=float)
+    n = np.asarray(compound_frequency, dtype=float)
+
+    continuous = np.isinf(n)
+    # Same formula as compound_interest(); the continuous rows divide by inf
+    # (giving 1 ** inf) and are replaced below
+    with np.errstate(invalid='ignore'):
+        growth = np.power(1 + rate_decimal / n, n * years)
+    if np.any(continuous):
+        growth = np.where(continuous, np.exp(rate_decimal * years), growth)
+
+    final_amounts = principal * growth
+    return final_amounts, final_amounts - principal
+
+
+def interest_grid(principals, rates, years, compound_frequencies=(1,)):
+    """
+    Evaluate every combination of the given scenario values
+
+    Args:
+        principals (sequence): Principal amounts
+        rates (sequence): Annual interest rates (percent)
+        years (sequence): Investment periods in years
+        compound_frequencies (sequence): Compounding frequencies (default: annual)
+
+    Returns:
+        tuple: (final_amounts, interest_earned), each indexed as
+        [principal, rate, years, frequency] - NumPy arrays of shape
+        (len(principals), len(rates), len(years), len(frequencies)), or
+        nested lists without NumPy
+    """
+    if np is None:
+        axes = [_as_list(v) for v in (principals, rates, years, compound_frequencies)]
+        _check_frequencies(axes[3])
+        final_amounts = [[[[p * _growth_factor(r, t, n) for n in axes[3]]
+                           for t in axes[2]] for r in axes[1]] for p in axes[0]]
+        interest = [[[[a - p for a in by_years] for by_years in by_rate]
+                     for by_rate in by_principal]
+                    for p, by_principal in zip(axes[0], final_amounts)]
+        return final_amounts, interest
+
+    # Give each input its own axis; broadcasting then forms the outer product
+    p, r, t, n = np.ix_(*(np.asarray(v, dtype=float).ravel()
+                          for v in (principals, rates, years, compound_frequencies)))
+    return compound_interest_array(p, r, t, n)
+
+
+def rate_sensitivity(principal, rate, years, compound_frequency=1):
+    """
+    Change in final amount per percentage point of interest rate
+
+    Uses the derivative of the compound interest formula, so no second
+    evaluation with a bumped rate is needed:
+    dA/dr = A * t / (100 + r/n), or A * t / 100 when continuous.
+
+    Args:
+        principal (float or array): Initial amounts of money
+        rate (float or array): Annual interest rates (percent)
+        years (float or array): Numbers of years
+        compound_frequency (float or array): Compounding frequencies (default: 1)
+
+    Returns:
+        NumPy array (or list without NumPy) of dollars per percentage point
+    """
+    final_amounts, _ = compound_interest_array(principal, rate, years, compound_frequency)
+
+    if np is None:
+        columns = [_as_list(v) for v in (rate, years, compound_frequency)]
+        length = len(final_amounts)
+        columns = [column * length if len(column) == 1 else column for column in columns]
+        return [a * t / (100 + (0 if n == CONTINUOUS else r / n))
+                for a, r, t, n in zip(final_amounts, *columns)]
+
+    n = np.asarray(compound_frequency, dtype=float)
+    return final_amounts * np.asarray(years, dtype=float) / (100 + np.asarray(rate, dtype=float) / n)
+
+
+def effective_annual_rate(rate, compound_frequency=1):
+    """
+    Effective annual rate (percent) for nominal rates and frequencies
+
+    Args:
+        rate (float or array): Nominal annual rates (percent)
+        compound_frequency (float or array): Compounding frequencies (default: 1)
+
+    Returns:
+        Effective rates in percent (same shape as the broadcast inputs)
+    """
+    final_amounts, _ = compound_interest_array(100, rate, 1, compound_frequency)
+    if np is None:
+        return [amount - 100 for amount in final_amounts]
+    return final_amounts - 100
+
+
+def format_rate_table(principal, rates, years, compound_frequency=1):
+    """
+    Build a table of final amounts with one row per rate and one column per period
+
+    Args:
+        principal (float): Initial amount of money
+        rates (sequence): Annual interest rates (percent)
+        years (sequence): Investment periods in years
+        compound_frequency (float): Compounding frequency (default: 1)
+
+    Returns:
+        str: The formatted table
+    """
+    rates, years = _as_list(rates), _as_list(years)
+    final_amounts, _ = interest_grid([principal], rates, years, [compound_frequency])
+
+    header = "Rate    " + "".join(f"{t:>14}y" for t in years)
+    lines = [header, "-" * len(header)]
+    for i, rate in enumerate(rates):
+        cells = "".join(f"{format_currency(final_amounts[0][i][j][0]):>15}"
+                        for j in range(len(years)))
+        lines.append(f"{rate:>5.2f}%  {cells}")
+    return "\n".join(lines)
+
+
+def format_currency(amount):
+    """
+    Format a number as currency
+    Args:
+        amount (float): Amount to format
+    Returns:
+        str: Formatted currency string
+    """
+    return f"${amount:,.2f}"
+
+
+def main():
+    """Main function to run the exercise"""
+    # compound_interest.py prints a banner when imported, so import it here
+    from compound_interest import compound_interest
+
+    print()
+    print("=== Vectorized Compound Interest ===")
+    print()
+
+    print("=== One Call, Many Frequencies ===")
+    frequencies = [1, 4, 12, 365, CONTINUOUS]
+    final_amounts, interest = compound_interest_array(1000, 5, 10, frequencies)
+    for n, amount, earned in zip(frequencies, final_amounts, interest):
+        print(f"{FREQUENCY_NAMES[n]:12}: {format_currency(amount)} (Interest: {format_currency(earned)})")
+    print()
+
+    print("=== Rate Table for $10,000 (monthly compounding) ===")
+    print(format_rate_table(10000, [3, 4, 5, 6, 7], [5, 10, 20, 30], 12))
+    print()
+
+    print("=== Scenario Grid ===")
+    principals = [1000 * k for k in range(1, 51)]
+    rates = [0.05 * k for k in range(1, 201)]
+    years = list(range(1, 41))
+    grid_frequencies = [1, 4, 12, 365, CONTINUOUS]
+    scenarios = len(principals) * len(rates) * len(years) * len(grid_frequencies)
+
+    start = time.perf_counter()
+    final_grid, _ = interest_grid(principals, rates, years, grid_frequencies)
+    grid_time = time.perf_counter() - start
+
+    # Time the nested loop over the scalar function on the finite frequencies
+    loop_rates = rates[:20]
+    start = time.perf_counter()
+    loop_results = [compound_interest(p, r, t, n)[0]
+                    for p, r, t, n in product(principals, loop_rates, years, grid_frequencies[:-1])]
+    loop_time = (time.perf_counter() - start) * scenarios / len(loop_results)
+
+    # NumPy's pow may differ from Python's in the last bit, so compare closely, not exactly
+    matches = all(math.isclose(final_grid[i][j][k][m], loop_results[index], rel_tol=1e-12)
+                  for index, (i, j, k, m) in enumerate(
+                      product(range(len(principals)), range(len(loop_rates)),
+                              range(len(years)), range(len(grid_frequencies) - 1))))
+    print(f"{scenarios:,} scenarios")
+    print(f"  Loop over compound_interest (extrapolated): {loop_time:.2f}s")
+    print(f"  interest_grid:                              {grid_time:.4f}s")
+    print(f"  Same results as compound_interest: {matches}")
+    print()
+
+    print("=== Rate Sensitivity ($10,000 for 10 years, monthly) ===")
+    sensitivity_rates = [2, 4, 6, 8]
+    for rate, dollars, effective in zip(sensitivity_rates,
+                                        rate_sensitivity(10000, sensitivity_rates, 10, 12),
+                                        effective_annual_rate(sensitivity_rates, 12)):
+        print(f"  {rate}% nominal ({effective:.3f}% effective): "
+              f"+{format_currency(dollars)} per extra percentage point")
+    print()
+
+    print("=== Key Concepts Demonstrated ===")
+    print("✓ Broadcasting replaces nested loops")
+    print("✓ np.ix_ builds outer-product grids")
+    print("✓ Continuous compounding with e^(rt)")
+    print("✓ Derivatives give sensitivities in one pass")
+    print("✓ One table instead of one printout per scenario")
+    print()
+    print("Solution completed!")
+
+
+if __name__ == "__main__":
+    main()
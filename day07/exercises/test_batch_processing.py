@@ -0,0 +1,136 @@
+"""
+Day 7 Tests: Vectorized Batch Processing
+========================================
+
+Code Review & Refactoring - test_batch_processing.py
+
+Checks that BatchDataProcessor.process_batch (solutions/batch_processing.py)
+produces exactly what the scalar DataProcessor.process_numbers produces, and
+that it is at least 20x faster on 10 million values.
+
+Run with:
+    python -m pytest day07/exercises/test_batch_processing.py
+"""
+
+import logging
+import os
+import random
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'solutions'))
+
+import batch_processing  # noqa: E402
+from batch_processing import BatchDataProcessor, check_parity  # noqa: E402
+from refactored_exercises import DataProcessorConfig  # noqa: E402
+
+
+logging.getLogger('refactored_exercises').setLevel(logging.WARNING)
+logging.getLogger('batch_processing').setLevel(logging.WARNING)
+
+CONFIGS = [
+    DataProcessorConfig(),
+    DataProcessorConfig(even_multiplier=2.5, odd_multiplier=3.5, include_negative=True),
+    DataProcessorConfig(include_zero=True),
+    DataProcessorConfig(even_multiplier=-1.0, odd_multiplier=0.5,
+                        include_negative=True, include_zero=True),
+]
+
+EDGE_VALUES = [0, 0.0, -0.0, 2.0, 2.5, -3.0, 1e300, -1e300,
+               float('inf'), float('-inf'), float('nan')]
+
+
+def random_batches(make_value, count=20, seed=42):
+    """Batches of random length built from make_value(rng)."""
+    rng = random.Random(seed)
+    return [[make_value(rng) for _ in range(rng.randint(1, 200))] for _ in range(count)]
+
+
+@pytest.fixture(params=CONFIGS, ids=lambda config: repr(config))
+def processor(request):
+    return BatchDataProcessor(request.param)
+
+
+def test_parity_ints(processor):
+    for data in random_batches(lambda rng: rng.randint(0, 1000)):
+        assert check_parity(processor, data)
+
+
+def test_parity_floats(processor):
+    for data in random_batches(lambda rng: rng.uniform(0, 1000)):
+        assert check_parity(processor, data)
+
+
+def test_parity_negatives(processor):
+    for data in random_batches(lambda rng: rng.choice([rng.randint(-1000, -1),
+                                                       rng.uniform(-1000, 0)])):
+        assert check_parity(processor, data)
+
+
+def test_parity_mixed(processor):
+    def mixed(rng):
+        return rng.choice([rng.randint(-10, 10), rng.uniform(-10, 10), rng.choice(EDGE_VALUES)])
+    for data in random_batches(mixed, count=50):
+        assert check_parity(processor, data)
+
+
+def test_parity_large_batch(processor):
+    # Longer than BLOCK_SIZE, so the batch is processed block by block
+    rng = random.Random(7)
+    data = [rng.choice([rng.randint(-50, 50), rng.uniform(-50, 50)])
+            for _ in range(3 * batch_processing.BLOCK_SIZE + 11)]
+    assert check_parity(processor, data)
+
+
+@pytest.mark.parametrize('data', [
+    [2 ** 70 + 1, 3, -2 ** 65],     # beyond int64: object dtype
+    [2 ** 63 + 1, -1],              # converted to float64 by NumPy
+    [2 ** 53 + 1, 2.0],             # rounded to an even float64
+    [2 ** 60 + 1, 0.5, float('nan')],
+])
+def test_parity_big_ints(processor, data):
+    assert check_parity(processor, data)
+
+
+def test_parity_without_numpy(processor, monkeypatch):
+    monkeypatch.setattr(batch_processing, 'np', None)
+    def mixed(rng):
+        return rng.choice([rng.randint(-10, 10), rng.uniform(-10, 10), rng.choice(EDGE_VALUES)])
+    for data in random_batches(mixed) + [[2 ** 70 + 1, 3], [2 ** 53 + 1, 2.0]]:
+        assert check_parity(processor, data)
+
+
+def test_empty_batch_rejected(processor):
+    with pytest.raises(ValueError):
+        processor.process_batch([])
+
+
+@pytest.mark.parametrize('data', [[1, 'two', 3], [1, None, 3]])
+def test_non_numeric_rejected(processor, data):
+    with pytest.raises(TypeError):
+        processor.process_batch(data)
+
+
+@pytest.mark.skipif(batch_processing.np is None, reason="throughput target assumes NumPy")
+def test_throughput_ten_million_values():
+    np = batch_processing.np
+    size = 10_000_000
+    rng = random.Random(42)
+    data = [rng.randint(-1000, 1000) for _ in range(size)]
+    batch_input = np.array(data)
+    processor = BatchDataProcessor(DataProcessorConfig(include_negative=True))
+
+    start = time.perf_counter()
+    expected = processor.process_numbers(data)
+    scalar_time = time.perf_counter() - start
+
+    batch_times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        result = processor.process_batch(batch_input)
+        batch_times.append(time.perf_counter() - start)
+
+    assert np.array_equal(result, expected)
+    assert scalar_time / min(batch_times) >= 20
@@ -0,0 +1,91 @@
+"""
+Day 7 Tests: Compiled Rule Pipelines
+====================================
+
+Code Review & Refactoring - test_rule_pipeline.py
+
+Checks that PipelineDataProcessor.process_numbers (solutions/rule_pipeline.py)
+produces exactly what DataProcessor.process_numbers produces, on the
+vectorized path, the fused scalar loop and data no NumPy array holds exactly.
+
+Run with:
+    python -m pytest day07/exercises/test_rule_pipeline.py
+"""
+
+import logging
+import math
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'solutions'))
+
+import rule_pipeline  # noqa: E402
+from refactored_exercises import DataProcessor, DataProcessorConfig  # noqa: E402
+from rule_pipeline import PipelineDataProcessor, RulePipeline  # noqa: E402
+
+
+logging.getLogger('refactored_exercises').setLevel(logging.WARNING)
+logging.getLogger('rule_pipeline').setLevel(logging.WARNING)
+
+CONFIGS = [
+    DataProcessorConfig(),
+    DataProcessorConfig(even_multiplier=2.5, odd_multiplier=3.5, include_negative=True),
+    DataProcessorConfig(even_multiplier=-1.0, odd_multiplier=0.5,
+                        include_negative=True, include_zero=True),
+]
+
+EDGE_VALUES = [0, 0.0, -0.0, 2.0, 2.5, -3.0, 1e300, float('inf'), float('-inf'), float('nan')]
+
+
+def same_values(expected, actual):
+    """Element-wise equality that treats NaN as equal to NaN."""
+    return len(expected) == len(actual) and all(
+        x == y or (math.isnan(x) and math.isnan(y)) for x, y in zip(expected, actual))
+
+
+def random_data(seed=42, size=500):
+    rng = random.Random(seed)
+    return [rng.choice([rng.randint(-100, 100), rng.uniform(-100, 100), rng.choice(EDGE_VALUES)])
+            for _ in range(size)]
+
+
+@pytest.fixture(params=CONFIGS, ids=lambda config: repr(config))
+def config(request):
+    return request.param
+
+
+@pytest.mark.parametrize('data', [
+    random_data(),
+    [2 ** 70 + 1, 3, -2 ** 65],     # beyond int64: object dtype
+    [2 ** 53 + 1, 2.0],             # rounded to an even float64
+    [2 ** 63 + 1, -1],              # converted to float64 by NumPy
+])
+def test_parity(config, data):
+    expected = DataProcessor(config).process_numbers(data)
+    assert same_values(expected, PipelineDataProcessor(config).process_numbers(data))
+
+
+def test_parity_without_numpy(config, monkeypatch):
+    monkeypatch.setattr(rule_pipeline, 'np', None)
+    for data in (random_data(seed=7), [2 ** 70 + 1, 3, -2 ** 65], [2 ** 53 + 1, 2.0]):
+        expected = DataProcessor(config).process_numbers(data)
+        assert same_values(expected, PipelineDataProcessor(config).process_numbers(data))
+
+
+def test_fused_loop_matches_vectorized(config):
+    pipeline = RulePipeline.from_config(config)
+    data = random_data(seed=3)
+    assert same_values(pipeline.run_scalar(data), list(pipeline.run_values(data)))
+
+
+def test_non_numeric_rejected(config):
+    with pytest.raises(TypeError):
+        PipelineDataProcessor(config).process_numbers([1, 'two', 3])
+
+
+def test_empty_rejected(config):
+    with pytest.raises(ValueError):
+        PipelineDataProcessor(config).process_numbers([])
@@ -0,0 +1,270 @@
+"""
+Day 7 Solution: Async File Service
+==================================
+
+FileOperations methods are blocking static methods, so calling them from an
+asyncio service stalls the event loop for the duration of every read and
+write. This solution wraps them in an asyncio-facing service: each call runs
+on a dedicated, bounded thread pool, a semaphore caps how many requests may
+be queued at once, and small appends to the same file are coalesced into a
+single write so hundreds of concurrent log writers cost a handful of system
+calls.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Dict, Any, Callable, Iterable, Optional, Tuple
+
+from refactored_exercises import FileOperations
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFileService:
+    """
+    Non-blocking FileOperations for asyncio code.
+
+    Use as an async context manager so pending batched writes are flushed
+    and the thread pool is shut down:
+
+        async with AsyncFileService() as files:
+            text = await files.read_file("data.txt")
+    """
+
+    def __init__(self, max_workers: int = 8, max_concurrency: int = 256,
+                 batch_delay: float = 0.005, max_batch: int = 512):
+        """
+        Args:
+            max_workers: Threads performing blocking file I/O
+            max_concurrency: Requests allowed in flight before callers wait
+            batch_delay: Seconds to collect appends to a file before writing
+            max_batch: Appends that trigger an immediate write
+        """
+        if max_workers < 1 or max_concurrency < 1:
+            raise ValueError("Worker and concurrency limits must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.batch_delay = batch_delay
+        self.max_batch = max_batch
+        self.stats = {'operations': 0, 'appends': 0, 'batched_writes': 0}
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='file-service')
+        # asyncio primitives are created on first use inside the running loop:
+        # before Python 3.10 they bind to the loop current at construction,
+        # so a service built outside its loop would fail
+        self._limit: Optional[asyncio.Semaphore] = None
+        self._pending: Dict[Tuple[str, str], List[Tuple[str, asyncio.Future]]] = {}
+        self._timers: Dict[Tuple[str, str], asyncio.TimerHandle] = {}
+        self._file_locks: Dict[str, asyncio.Lock] = {}
+        self._flushes: Dict[asyncio.Task, str] = {}  # flush task -> absolute path
+
+    async def __aenter__(self) -> 'AsyncFileService':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def _run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking call on the service thread pool."""
+        if self._limit is None:
+            self._limit = asyncio.Semaphore(self.max_concurrency)
+        async with self._limit:
+            self.stats['operations'] += 1
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def read_file(self, filepath: str, encoding: str = 'utf-8') -> str:
+        """Read a whole file (see FileOperations.read_file)."""
+        return await self._run(FileOperations.read_file, filepath, encoding)
+
+    async def write_file(self, filepath: str, content: str, encoding: str = 'utf-8',
+                         append: bool = False) -> None:
+        """Write a file (see FileOperations.write_file); waits for pending appends first."""
+        await self._flush_path(filepath)
+        async with self._lock_for(filepath):
+            await self._run(FileOperations.write_file, filepath, content, encoding, append)
+
+    async def file_exists(self, filepath: str) -> bool:
+        """Check if a file exists."""
+        return await self._run(FileOperations.file_exists, filepath)
+
+    async def get_file_size(self, filepath: str) -> int:
+        """File size in bytes (see FileOperations.get_file_size)."""
+        return await self._run(FileOperations.get_file_size, filepath)
+
+    async def backup_file(self, filepath: str, backup_suffix: str = '.backup') -> str:
+        """Create a backup copy (see FileOperations.backup_file), including pending appends."""
+        await self._flush_path(filepath)
+        async with self._lock_for(filepath):
+            return await self._run(FileOperations.backup_file, filepath, backup_suffix)
+
+    async def read_many(self, filepaths: Iterable[str], encoding: str = 'utf-8') -> List[str]:
+        """Read many files concurrently, returning contents in input order."""
+        return await asyncio.gather(*(self.read_file(path, encoding) for path in filepaths))
+
+    def _lock_for(self, filepath: str) -> asyncio.Lock:
+        key = os.path.abspath(filepath)
+        lock = self._file_locks.get(key)
+        if lock is None:
+            lock = self._file_locks[key] = asyncio.Lock()
+        return lock
+
+    async def append(self, filepath: str, content: str, encoding: str = 'utf-8') -> None:
+        """
+        Append text to a file, batching with other appends to the same file.
+
+        Appends arriving within batch_delay of each other (or max_batch of
+        them) are joined in arrival order and written with one call. The
+        coroutine returns once the batch containing this text is written.
+
+        Raises:
+            OSError: If the batched write fails
+        """
+        key = (os.path.abspath(filepath), encoding)
+        future = asyncio.get_running_loop().create_future()
+        batch = self._pending.setdefault(key, [])
+        batch.append((content, future))
+        self.stats['appends'] += 1
+
+        if len(batch) >= self.max_batch:
+            self._start_flush(key)
+        elif len(batch) == 1:
+            self._timers[key] = asyncio.get_running_loop().call_later(
+                self.batch_delay, self._start_flush, key)
+        await future
+
+    def _start_flush(self, key: Tuple[str, str]) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._flush(key, batch))
+            self._flushes[task] = key[0]
+            task.add_done_callback(self._forget_flush)
+
+    def _forget_flush(self, task: asyncio.Task) -> None:
+        self._flushes.pop(task, None)
+
+    async def _flush_path(self, filepath: str) -> None:
+        """Write the pending appends to one file (in any encoding) and wait for them."""
+        path = os.path.abspath(filepath)
+        for key in [key for key in self._pending if key[0] == path]:
+            self._start_flush(key)
+        tasks = [task for task, target in self._flushes.items() if target == path]
+        if tasks:
+            # Failures are reported to the append callers
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _flush(self, key: Tuple[str, str], batch: List[Tuple[str, asyncio.Future]]) -> None:
+        filepath, encoding = key
+        content = ''.join(text for text, _ in batch)
+        try:
+            # The per-file lock keeps batches for one file in order
+            async with self._lock_for(filepath):
+                await self._run(FileOperations.write_file, filepath, content, encoding, True)
+            self.stats['batched_writes'] += 1
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+    async def flush(self) -> None:
+        """Write all pending appends now and wait for them."""
+        for key in list(self._pending):
+            self._start_flush(key)
+        while self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Flush pending appends and shut down the thread pool."""
+        await self.flush()
+        self._executor.shutdown(wait=True)
+        logger.info(f"File service closed after {self.stats['operations']} operations")
+
+
+async def _measure_loop_lag(stop: asyncio.Event, interval: float = 0.001) -> float:
+    """Largest delay seen by a coroutine that wakes up every interval seconds."""
+    worst = 0.0
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        worst = max(worst, loop.time() - start - interval)
+    return worst
+
+
+async def _demonstrate_service(directory: str) -> None:
+    paths = [os.path.join(directory, f"doc_{i}.txt") for i in range(200)]
+    log_path = os.path.join(directory, "service.log")
+
+    async with AsyncFileService(max_workers=8) as files:
+        stop = asyncio.Event()
+        lag = asyncio.create_task(_measure_loop_lag(stop))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(files.write_file(path, f"document {i}\n" * 500)
+                               for i, path in enumerate(paths)))
+        contents = await files.read_many(paths)
+        sizes = await asyncio.gather(*(files.get_file_size(path) for path in paths))
+        backups = await asyncio.gather(*(files.backup_file(path) for path in paths[:20]))
+        await asyncio.gather(*(files.append(log_path, f"request {i} handled\n")
+                               for i in range(2_000)))
+        elapsed = time.perf_counter() - start
+
+        stop.set()
+        worst_lag = await lag
+
+        log_lines = (await files.read_file(log_path)).splitlines()
+        print(f"Wrote, read and sized {len(paths)} files, backed up {len(backups)}")
+        print(f"  All contents read back: {all(c.startswith(f'document {i}') for i, c in enumerate(contents))}")
+        print(f"  Total bytes: {sum(sizes):,}")
+        print(f"  {files.stats['appends']:,} concurrent appends -> "
+              f"{files.stats['batched_writes']} batched writes, "
+              f"in order: {log_lines == [f'request {i} handled' for i in range(2_000)]}")
+        print(f"  Elapsed: {elapsed:.3f}s, worst event loop stall: {worst_lag * 1000:.1f} ms")
+
+
+def demonstrate_async_service():
+    """Demonstrate concurrent file requests on the async service."""
+    print("1. Async File Service")
+    print("-" * 25)
+
+    logging.getLogger('refactored_exercises').setLevel(logging.WARNING)
+    logger.setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(_demonstrate_service(directory))
+
+    print()
+
+
+def main():
+    """Main function demonstrating the async file service."""
+    print("=== Day 7: Async File Service ===")
+    print()
+
+    demonstrate_async_service()
+
+    print("📚 Key Learning Points:")
+    print("• Blocking calls belong on a thread pool, not the event loop")
+    print("• A semaphore bounds queued work and applies backpressure")
+    print("• Coalescing small writes saves system calls")
+    print("• Per-file locks keep batched writes in order")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+Day 7 Solution: Vectorized Batch Processing
+===========================================
+
+DataProcessor.process_numbers type-checks every element and then calls
+_should_include_number and _process_single_number for each value - several
+Python function calls per number. This solution applies the same
+DataProcessorConfig rules to a whole batch at once: the include rules become
+boolean masks and the even/odd multipliers a lookup table indexed by those
+masks, so the per-value work runs in compiled NumPy loops. Without NumPy the
+batch path still inlines the rules into one comprehension over an array('d').
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import logging
+import math
+import random
+import time
+from array import array
+from typing import List, Union, Sequence
+
+from refactored_exercises import DataProcessor, DataProcessorConfig
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; process_batch falls back to array('d')
+    np = None
+
+
+logger = logging.getLogger(__name__)
+
+Number = Union[int, float]
+
+# Values per block in process_batch; the block's masks and products stay in
+# the CPU cache instead of streaming whole-array temporaries through memory
+BLOCK_SIZE = 1 << 16
+
+# Integers beyond this magnitude are not all representable as float64
+FLOAT_EXACT_LIMIT = 2 ** 53
+
+
+def _has_inexact_ints(data: Sequence[Number]) -> bool:
+    """True if data holds ints that a float64 array would round."""
+    return any(isinstance(x, int) and abs(x) > FLOAT_EXACT_LIMIT for x in data)
+
+
+def exact_array(data: Sequence[Number]):
+    """
+    Convert data to a flat NumPy array that holds every value exactly.
+
+    Returns None when no NumPy dtype does (ints beyond int64, or beyond
+    2**53 next to floats); such data must be processed as Python numbers.
+
+    Raises:
+        TypeError: If data contains non-numeric values
+    """
+    values = np.asarray(data).ravel()
+    if values.dtype.kind == 'O' and all(isinstance(x, (int, float)) for x in values):
+        return None  # ints beyond int64 only fit in Python ints
+    if values.dtype.kind not in 'biuf':
+        raise TypeError("All data elements must be numeric")
+    if (values.dtype.kind == 'f' and isinstance(data, (list, tuple))
+            and np.any(np.abs(values) >= FLOAT_EXACT_LIMIT) and _has_inexact_ints(data)):
+        return None
+    return values
+
+
+def even_mask(values):
+    """Boolean mask of NumPy values with value % 2 == 0 (for positive values)."""
+    if values.dtype.kind != 'f':
+        return (values & 1) == 0  # bit test instead of a per-value modulo
+    # x % 2 == 0 exactly when x / 2 is a finite whole number; the
+    # mask only matters for positive values, whose evens are all >= 2
+    half = values * 0.5
+    return (half >= 1) & (np.floor(half) == half) & (half != np.inf)
+
+
+def multiply_by_parity(values, even_multiplier: float, odd_multiplier: float):
+    """
+    Apply the even/odd multiplier rule to a NumPy array.
+
+    Positive values are multiplied by even_multiplier or odd_multiplier,
+    everything else is returned unchanged, as float64.
+    """
+    # Per-value multiplier picked from a lookup table:
+    # 0 -> 1.0 (non-positive, returned as-is), 1 -> odd, 2 -> even
+    positive = values > 0
+    selector = positive.view(np.int8) + (positive & even_mask(values)).view(np.int8)
+    table = np.array([1.0, odd_multiplier, even_multiplier])
+    result = table[selector]
+    with np.errstate(invalid='ignore'):  # e.g. inf * 0.0 multiplier -> NaN, as in Python
+        result *= values
+    return result
+
+
+class BatchDataProcessor(DataProcessor):
+    """
+    DataProcessor with a vectorized batch mode.
+
+    process_numbers keeps the original per-element behaviour; process_batch
+    applies the same configuration rules to a whole array and returns an
+    array (a float64 ndarray with NumPy, otherwise array('d')). Lists
+    holding ints that no NumPy dtype represents exactly (beyond int64, or
+    beyond 2**53 next to floats) are processed by the scalar path instead.
+    """
+
+    def _as_array(self, data: Sequence[Number]):
+        """
+        Convert input to a flat NumPy array (or array('d')), rejecting non-numeric data.
+
+        Returns None if the array would not hold every value exactly; use
+        _process_scalar for such data.
+        """
+        if np is not None:
+            return exact_array(data)
+        if isinstance(data, array) and data.typecode == 'd':
+            return data
+        try:
+            values = array('d', data)
+        except TypeError:
+            raise TypeError("All data elements must be numeric") from None
+        if isinstance(data, (list, tuple)) and _has_inexact_ints(data):
+            return None
+        return values
+
+    def _process_scalar(self, data: Sequence[Number]):
+        """process_numbers, returning the same array type as _apply_rules."""
+        result = self.process_numbers(list(data))
+        return np.array(result, dtype=np.float64) if np is not None else array('d', result)
+
+    def process_batch(self, data: Sequence[Number]):
+        """
+        Process a batch of numbers with vectorized configuration rules.
+
+        Produces the same values, in the same order, as process_numbers.
+
+        Args:
+            data: List, array('d') or NumPy array of numbers
+
+        Returns:
+            float64 ndarray (NumPy) or array('d') of processed values
+
+        Raises:
+            TypeError: If data contains non-numeric values
+            ValueError: If data is empty
+        """
+        if len(data) == 0:
+            raise ValueError("Data list cannot be empty")
+
+        raw = self._as_array(data)
+        result = self._process_scalar(data) if raw is None else self._apply_rules(raw)
+        logger.info(f"Batch processed {len(data)} numbers, returned {len(result)} results")
+        return result
+
+    def _apply_rules(self, raw):
+        """Apply the configuration rules to an array from _as_array."""
+        config = self.config
+
+        if np is not None:
+            # Integers stay integers for the comparisons and parity test;
+            # the multiply produces float64 either way
+            values = raw.astype(np.float64, copy=False) if raw.dtype.kind == 'f' else raw
+            if len(values) <= BLOCK_SIZE:
+                return self._apply_rules_block(values)
+            result = np.empty(len(values))
+            filled = 0
+            for start in range(0, len(values), BLOCK_SIZE):
+                block = self._apply_rules_block(values[start:start + BLOCK_SIZE])
+                result[filled:filled + len(block)] = block
+                filled += len(block)
+            result = result[:filled]
+        else:
+            include_negative = config.include_negative
+            include_zero = config.include_zero
+            even_multiplier = config.even_multiplier
+            odd_multiplier = config.odd_multiplier
+            result = array('d', (
+                x if x <= 0 else
+                x * (even_multiplier if x % 2 == 0 else odd_multiplier)
+                for x in raw
+                if (include_negative or not x < 0) and (include_zero or x != 0)
+            ))
+
+        return result
+
+    def _apply_rules_block(self, values):
+        """Apply the configuration rules to one block of a NumPy array."""
+        config = self.config
+        result = multiply_by_parity(values, config.even_multiplier, config.odd_multiplier)
+
+        keep = None
+        if not config.include_negative:
+            keep = ~(values < 0)  # NaN is kept, as in the scalar path
+        if not config.include_zero:
+            nonzero = values != 0
+            keep = nonzero if keep is None else keep & nonzero
+        if keep is not None:
+            result = result[keep]
+        return result
+
+
+def check_parity(processor: BatchDataProcessor, data: List[Number]) -> bool:
+    """Check that process_batch matches process_numbers on the same data."""
+    expected = processor.process_numbers(data)
+    actual = processor.process_batch(data)
+    if len(expected) != len(actual):
+        return False
+    for x, y in zip(expected, actual):
+        if math.isnan(x) and math.isnan(y):
+            continue
+        if x != y:
+            return False
+    return True
+
+
+def demonstrate_batch_processing():
+    """Demonstrate batch mode and check it against the scalar path."""
+    print("1. Batch Mode Parity")
+    print("-" * 25)
+
+    configs = [
+        DataProcessorConfig(),
+        DataProcessorConfig(even_multiplier=2.5, odd_multiplier=3.5, include_negative=True),
+        DataProcessorConfig(include_zero=True),
+        DataProcessorConfig(even_multiplier=-1.0, odd_multiplier=0.5,
+                            include_negative=True, include_zero=True),
+    ]
+    test_data = [1, 2, 3, 4, 5, -2, 0, 8, 9]
+    processor = BatchDataProcessor(configs[1])
+    print(f"Original data:  {test_data}")
+    print(f"Scalar path:    {processor.process_numbers(test_data)}")
+    print(f"Batch path:     {list(map(float, processor.process_batch(test_data)))}")
+
+    random.seed(42)
+    edge_values = [0.0, -0.0, 2.0, 2.5, -3.0, float('inf'), float('-inf'), float('nan'), 1e300]
+    all_match = True
+    for config in configs:
+        processor = BatchDataProcessor(config)
+        for _ in range(50):
+            data = [random.choice([random.randint(-10, 10), random.uniform(-10, 10),
+                                   random.choice(edge_values)])
+                    for _ in range(random.randint(1, 50))]
+            all_match = all_match and check_parity(processor, data)
+    print(f"Parity on {len(configs) * 50} random batches (ints, floats, inf, NaN): {all_match}")
+
+    print()
+
+
+def demonstrate_batch_performance():
+    """Compare scalar and batch throughput."""
+    print("2. Scalar vs Batch Throughput")
+    print("-" * 35)
+
+    logging.getLogger('refactored_exercises').setLevel(logging.WARNING)
+    logger.setLevel(logging.WARNING)
+
+    size = 10_000_000
+    random.seed(42)
+    data = [random.randint(-1000, 1000) for _ in range(size)]
+    processor = BatchDataProcessor(DataProcessorConfig(include_negative=True))
+
+    start = time.perf_counter()
+    processor.process_numbers(data)
+    scalar_time = time.perf_counter() - start
+
+    batch_input = np.array(data) if np is not None else array('d', data)
+    start = time.perf_counter()
+    processor.process_batch(batch_input)
+    batch_time = time.perf_counter() - start
+
+    print(f"{size:,} values:")
+    print(f"  process_numbers: {scalar_time:.4f}s ({size / scalar_time / 1e6:.1f}M values/s)")
+    print(f"  process_batch:   {batch_time:.4f}s ({size / batch_time / 1e6:.1f}M values/s)")
+    print(f"  Speedup: {scalar_time / batch_time:.1f}x")
+    print(f"  Backend: {'NumPy' if np is not None else 'array module'}")
+
+    print()
+
+
+def main():
+    """Main function demonstrating vectorized batch processing."""
+    print("=== Day 7: Vectorized Batch Processing ===")
+    print()
+
+    demonstrate_batch_processing()
+    demonstrate_batch_performance()
+
+    print("📚 Key Learning Points:")
+    print("• Per-element method calls dominate the cost of simple rules")
+    print("• Include/exclude rules map naturally onto boolean masks")
+    print("• Branches become a lookup table indexed by the masks")
+    print("• Keep the scalar path as the reference and check parity")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,539 @@
+"""
+Day 7 Solution: Bounded Calculation History
+===========================================
+
+RefactoredCalculator keeps every calculation as a dictionary in a list, so a
+long-running calculator service grows without limit, and a restart loses its
+audit trail. This solution stores calculations as fixed-size binary records
+(34 bytes instead of a dictionary of five objects) in a ring buffer of
+bounded size. When the buffer fills, its records are appended to a binary log
+in one write. Because every record has the same size, record i of the log
+sits at a known offset, so replay can start anywhere, and since timestamps
+never decrease, a time range is found by binary search instead of a scan.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import logging
+import math
+import numbers
+import os
+import struct
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+from typing import Any, List, Dict, Optional, Union, Iterator, Mapping, Sequence, Tuple
+
+from refactored_exercises import RefactoredCalculator
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; queries then unpack records with struct
+    np = None
+
+
+logger = logging.getLogger(__name__)
+
+HistoryEntry = Dict[str, Union[str, float, bool]]
+
+# timestamp, operation code, inexact flags, operand a, operand b, result
+RECORD = struct.Struct('<dBBddd')
+LOG_MAGIC = b'CALCLOG2'
+# 'expression' records ExpressionCalculator formulas: only the result is stored
+OPERATIONS = ('add', 'subtract', 'multiply', 'divide', 'power', 'modulo', 'expression')
+VALUE_FIELDS = ('operand_a', 'operand_b', 'result')
+
+if np is not None:
+    RECORD_DTYPE = np.dtype([('timestamp', '<f8'), ('operation', 'u1'), ('flags', 'u1'),
+                             ('operand_a', '<f8'), ('operand_b', '<f8'), ('result', '<f8')])
+
+
+def _to_double(value: numbers.Number) -> Tuple[float, bool]:
+    """
+    The float stored for a value, and whether it is exact.
+
+    Ints beyond 2**53 are rounded, ints beyond the float range become
+    infinities and complex numbers become NaN; all of these are inexact.
+
+    Raises:
+        TypeError: If value is not a number
+    """
+    if type(value) is float:
+        return value, True
+    if isinstance(value, numbers.Integral):
+        try:
+            stored = float(value)
+        except OverflowError:
+            return (math.inf if value > 0 else -math.inf), False
+        return stored, int(stored) == value
+    if isinstance(value, numbers.Real):
+        stored = float(value)
+        return stored, stored == value
+    if isinstance(value, numbers.Number):
+        return math.nan, False
+    raise TypeError("Only numbers can be recorded")
+
+
+class CalculationHistory:
+    """
+    Ring buffer of calculation records with an optional append-only log.
+
+    Works as the history store of RefactoredCalculator (append, copy, clear).
+    copy() returns the records still in memory; replay, query and indexing
+    reach every record, including those already spilled to the log. Without
+    a log, records evicted from the ring buffer are dropped.
+
+    Values are stored as doubles. Values a double cannot hold (complex
+    results, ints beyond 2**53) are stored approximately with a flag; the
+    original values are returned while the record is in the ring buffer,
+    and afterwards the entry carries 'exact': False. Formula entries from
+    ExpressionCalculator keep only their result and timestamp in the
+    record; the formula and its variables are returned while the record
+    is in the ring buffer.
+    """
+
+    def __init__(self, capacity: int = 1024, log_path: Optional[str] = None,
+                 operations: Sequence[str] = OPERATIONS, durable: bool = False):
+        """
+        Args:
+            capacity: Records kept in memory
+            log_path: Append-only binary log (reopened and continued if it exists)
+            operations: Operation names that can be recorded, in code order;
+                must match between runs sharing a log
+            durable: fsync the log after every spill
+
+        Raises:
+            ValueError: If capacity is invalid or the log has a bad header
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        if len(operations) > 256:
+            raise ValueError("At most 256 operations can be recorded")
+        self.capacity = capacity
+        self.log_path = log_path
+        self.durable = durable
+        self.operations = tuple(operations)
+        self._codes = {name: code for code, name in enumerate(self.operations)}
+
+        self._buffer = bytearray(capacity * RECORD.size)
+        # index -> fields the record cannot hold (original values, formulas)
+        self._originals: Dict[int, Dict[str, Any]] = {}
+        self._count = 0           # records ever appended
+        self._persisted = 0       # records written to the log
+        self._memory_start = 0    # first record copy() returns
+        self._last_timestamp = -math.inf
+        self._lock = threading.RLock()
+        self._log = self._open_log(log_path) if log_path else None
+
+    def _open_log(self, log_path: str):
+        log = open(log_path, 'a+b')
+        try:
+            size = os.fstat(log.fileno()).st_size
+            if size == 0:
+                log.write(LOG_MAGIC)
+                log.flush()
+                return log
+            if os.pread(log.fileno(), len(LOG_MAGIC), 0) != LOG_MAGIC:
+                raise ValueError(f"Not a calculation log: {log_path}")
+
+            records, partial = divmod(size - len(LOG_MAGIC), RECORD.size)
+            if partial:
+                # An interrupted spill left half a record; drop it
+                logger.warning(f"Truncating {partial} trailing bytes in {log_path}")
+                log.truncate(size - partial)
+            self._count = self._persisted = self._memory_start = records
+            if records:
+                last = os.pread(log.fileno(), RECORD.size, size - partial - RECORD.size)
+                self._last_timestamp = RECORD.unpack(last)[0]
+            return log
+        except BaseException:
+            log.close()
+            raise
+
+    def __enter__(self) -> 'CalculationHistory':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of records in memory (what copy() returns)."""
+        return self._count - self._memory_start
+
+    @property
+    def total_count(self) -> int:
+        """Number of records available to replay and query."""
+        return self._count - self._first_index()
+
+    def _first_index(self) -> int:
+        if self._log is not None:
+            return 0
+        return max(self._memory_start, self._count - self.capacity)
+
+    def record(self, operation: str, operand_a: float, operand_b: float, result: float,
+               timestamp: Optional[float] = None) -> int:
+        """
+        Record one calculation.
+
+        Args:
+            operation: Operation name
+            operand_a: First operand
+            operand_b: Second operand
+            result: Result of the calculation
+            timestamp: Seconds since the epoch (default: now). Timestamps
+                earlier than the previous record are raised to it, so records
+                stay in time order even if the clock steps back.
+
+        Returns:
+            Index of the record
+
+        Raises:
+            ValueError: If the operation is unknown
+            TypeError: If a value is not a number
+        """
+        code = self._code(operation)
+        originals = (operand_a, operand_b, result)
+        flags = 0
+        try:
+            values = (float(operand_a), float(operand_b), float(result))
+            exact = values[0] == operand_a and values[1] == operand_b and values[2] == result
+        except (TypeError, ValueError, OverflowError):
+            exact = False
+        if not exact:
+            # Slow path for NaN and values a double cannot hold
+            values = []
+            for bit, value in enumerate(originals):
+                stored, exact = _to_double(value)
+                values.append(stored)
+                if not exact:
+                    flags |= 1 << bit
+
+        return self._store(code, flags, values,
+                           dict(zip(VALUE_FIELDS, originals)) if flags else None, timestamp)
+
+    def record_expression(self, expression: str, variables: Mapping[str, Any], result: float,
+                          timestamp: Optional[float] = None) -> int:
+        """
+        Record one formula evaluation (ExpressionCalculator.evaluate).
+
+        Only the result and timestamp fit in the record; the formula and
+        its variables are returned while the record is in the ring buffer.
+
+        Returns:
+            Index of the record
+
+        Raises:
+            ValueError: If 'expression' is not among the recordable operations
+            TypeError: If the result is not a number
+        """
+        code = self._code('expression')
+        stored, exact = _to_double(result)
+        originals: Dict[str, Any] = {'expression': expression, 'variables': dict(variables)}
+        if not exact:
+            originals['result'] = result
+        return self._store(code, 0 if exact else 1 << VALUE_FIELDS.index('result'),
+                           (math.nan, math.nan, stored), originals, timestamp)
+
+    def _code(self, operation: str) -> int:
+        code = self._codes.get(operation)
+        if code is None:
+            raise ValueError(f"Invalid operation '{operation}'. "
+                             f"Available: {', '.join(self.operations)}")
+        return code
+
+    def _store(self, code: int, flags: int, values: Sequence[float],
+               originals: Optional[Dict[str, Any]], timestamp: Optional[float]) -> int:
+        with self._lock:
+            if timestamp is None:
+                timestamp = time.time()
+            timestamp = max(timestamp, self._last_timestamp)
+            if self._count - self._persisted == self.capacity:
+                self._spill()
+            index = self._count
+            RECORD.pack_into(self._buffer, (index % self.capacity) * RECORD.size,
+                             timestamp, code, flags, *values)
+            if self._originals:
+                self._originals.pop(index - self.capacity, None)  # slot overwritten
+            if originals:
+                self._originals[index] = originals
+            self._count += 1
+            self._last_timestamp = timestamp
+            return index
+
+    def append(self, entry: Mapping[str, Any]) -> None:
+        """
+        Record a RefactoredCalculator or ExpressionCalculator history entry.
+
+        Raises:
+            ValueError: If the entry lacks the fields of either kind of entry
+        """
+        timestamp = entry.get('timestamp')
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp).timestamp()
+        if 'expression' in entry and 'result' in entry:
+            self.record_expression(entry['expression'], entry.get('variables', {}),
+                                   entry['result'], timestamp)
+            return
+        missing = [name for name in ('operation',) + VALUE_FIELDS if name not in entry]
+        if missing:
+            raise ValueError(f"Cannot record history entry without {', '.join(missing)}")
+        self.record(entry['operation'], entry['operand_a'], entry['operand_b'],
+                    entry['result'], timestamp)
+
+    def _ring_bytes(self, start: int, stop: int) -> bytes:
+        """Raw records start..stop, which must all be in the ring buffer."""
+        first, last = start % self.capacity, stop % self.capacity
+        size = RECORD.size
+        if stop - start == 0:
+            return b''
+        if first < last:
+            return bytes(self._buffer[first * size:last * size])
+        return bytes(self._buffer[first * size:]) + bytes(self._buffer[:last * size])
+
+    def _spill(self) -> None:
+        """Append the records not yet in the log, in one write."""
+        if self._log is None:
+            self._persisted = self._count
+            return
+        data = self._ring_bytes(self._persisted, self._count)
+        self._log.write(data)
+        self._log.flush()
+        if self.durable:
+            os.fsync(self._log.fileno())
+        self._persisted = self._count
+
+    def flush(self) -> None:
+        """Write records still only in memory to the log."""
+        with self._lock:
+            if self._log is not None and self._persisted < self._count:
+                self._spill()
+
+    def close(self) -> None:
+        """Flush and close the log."""
+        with self._lock:
+            if self._log is not None:
+                self.flush()
+                self._log.close()
+                self._log = None
+
+    def clear(self) -> None:
+        """Empty the in-memory history; the log keeps every record."""
+        with self._lock:
+            self.flush()
+            self._memory_start = self._count
+            self._persisted = self._count
+            self._originals.clear()
+        logger.info("In-memory calculation history cleared")
+
+    def _raw(self, start: int, stop: int, chunk_size: int = 8192) -> Iterator[bytes]:
+        """Raw records start..stop in chunks, from the log and then memory."""
+        position = start
+        if self._log is not None:
+            log_stop = min(stop, self._persisted)
+            while position < log_stop:
+                end = min(position + chunk_size, log_stop)
+                yield os.pread(self._log.fileno(), (end - position) * RECORD.size,
+                               len(LOG_MAGIC) + position * RECORD.size)
+                position = end
+        while position < stop:
+            end = min(position + chunk_size, stop)
+            yield self._ring_bytes(position, end)
+            position = end
+
+    def _chunks(self, start: Optional[int], stop: Optional[int]) -> Tuple[int, Iterator[bytes]]:
+        """
+        Index of the first record in a range, and the raw records in it,
+        safe to consume without holding the lock.
+
+        With a log, everything is flushed first and records in the log never
+        change, so they are streamed; otherwise the (bounded) range is copied
+        out of the ring buffer.
+        """
+        with self._lock:
+            self.flush()
+            start, stop = self._range(start, stop)
+            if self._log is None:
+                return start, iter(list(self._raw(start, stop)))
+        return start, self._raw(start, stop)
+
+    def _entry(self, values: Tuple, index: int) -> HistoryEntry:
+        timestamp, code, flags, operand_a, operand_b, result = values
+        operation = self.operations[code]
+        if operation == 'expression':
+            entry = {'operation': operation, 'result': result}
+        else:
+            entry = {'operation': operation, 'operand_a': operand_a, 'operand_b': operand_b,
+                     'result': result}
+        entry['timestamp'] = datetime.fromtimestamp(timestamp).isoformat()
+        originals = self._originals.get(index) if self._originals else None
+        if originals is not None:
+            entry.update(originals)
+        elif flags:
+            entry['exact'] = False
+        return entry
+
+    def _range(self, start: Optional[int], stop: Optional[int]) -> Tuple[int, int]:
+        first = self._first_index()
+        start = first if start is None else max(start, first)
+        stop = self._count if stop is None else min(stop, self._count)
+        return start, max(start, stop)
+
+    def __getitem__(self, index: int) -> HistoryEntry:
+        """Record by index (negative indexes count from the newest)."""
+        with self._lock:
+            if index < 0:
+                index += self._count
+            if not self._first_index() <= index < self._count:
+                raise IndexError("History index out of range")
+            data = b''.join(self._raw(index, index + 1))
+            return self._entry(RECORD.unpack(data), index)
+
+    def replay(self, start: Optional[int] = None, stop: Optional[int] = None) -> Iterator[HistoryEntry]:
+        """
+        Yield history entries in order, optionally from index start to stop.
+
+        Entries are read in chunks, so replaying a large log uses little memory.
+        """
+        index, chunks = self._chunks(start, stop)
+        for data in chunks:
+            for values in RECORD.iter_unpack(data):
+                yield self._entry(values, index)
+                index += 1
+
+    def copy(self) -> List[HistoryEntry]:
+        """Entries still in memory, oldest first (RefactoredCalculator.get_history)."""
+        with self._lock:
+            start = max(self._memory_start, self._count - self.capacity)
+            data = self._ring_bytes(start, self._count)
+            return [self._entry(values, index)
+                    for index, values in enumerate(RECORD.iter_unpack(data), start)]
+
+    def _timestamp(self, index: int) -> float:
+        return RECORD.unpack(b''.join(self._raw(index, index + 1)))[0]
+
+    def index_at(self, when: Union[datetime, float]) -> int:
+        """Index of the first record at or after a time (binary search)."""
+        if isinstance(when, datetime):
+            when = when.timestamp()
+
+        class _Timestamps:
+            def __getitem__(_, index: int) -> float:
+                return self._timestamp(index)
+
+        with self._lock:
+            self.flush()
+            return bisect_left(_Timestamps(), when, self._first_index(), self._count)
+
+    def query(self, operation: Optional[str] = None,
+              start_time: Optional[Union[datetime, float]] = None,
+              end_time: Optional[Union[datetime, float]] = None) -> List[HistoryEntry]:
+        """
+        Entries matching an operation and/or time range.
+
+        Args:
+            operation: Operation name to match (default: all)
+            start_time: Earliest timestamp, inclusive (datetime or epoch seconds)
+            end_time: Latest timestamp, exclusive
+
+        Returns:
+            Matching entries, oldest first
+
+        Raises:
+            ValueError: If the operation is unknown
+        """
+        code = None
+        if operation is not None:
+            code = self._codes.get(operation)
+            if code is None:
+                raise ValueError(f"Invalid operation '{operation}'. "
+                                 f"Available: {', '.join(self.operations)}")
+
+        start = self.index_at(start_time) if start_time is not None else None
+        stop = self.index_at(end_time) if end_time is not None else None
+
+        entries = []
+        position, chunks = self._chunks(start, stop)
+        for data in chunks:
+            count = len(data) // RECORD.size
+            if np is not None:
+                records = np.frombuffer(data, dtype=RECORD_DTYPE)
+                indexes = range(position, position + count)
+                if code is not None:
+                    matches = np.flatnonzero(records['operation'] == code)
+                    records, indexes = records[matches], (matches + position).tolist()
+                entries.extend(self._entry(values, index)
+                               for values, index in zip(records.tolist(), indexes))
+            else:
+                entries.extend(self._entry(values, index)
+                               for index, values in enumerate(RECORD.iter_unpack(data), position)
+                               if code is None or values[1] == code)
+            position += count
+        return entries
+
+
+def demonstrate_history():
+    """Demonstrate bounded history with a log and fast queries."""
+    print("1. Bounded Calculation History")
+    print("-" * 35)
+
+    logging.getLogger('refactored_exercises').setLevel(logging.WARNING)
+    logger.setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as directory:
+        log_path = os.path.join(directory, "calculations.log")
+        calls = 100_000
+
+        with CalculationHistory(capacity=1_000, log_path=log_path) as history:
+            calculator = RefactoredCalculator(history=history)
+            start_time = time.time()
+            for i in range(calls):
+                calculator.calculate(OPERATIONS[i % 4], i, (i % 7) + 1)
+            elapsed = time.time() - start_time
+
+            print(f"{calls:,} calculations in {elapsed:.2f}s")
+            print(f"  In memory: {len(calculator.get_history()):,} entries, "
+                  f"{history.capacity * RECORD.size:,} bytes")
+            print(f"  Log file:  {os.path.getsize(log_path):,} bytes, "
+                  f"{history.total_count:,} records")
+
+            start = time.perf_counter()
+            entry = history[12_345]
+            print(f"  Record 12,345: {entry['operation']}({entry['operand_a']}, "
+                  f"{entry['operand_b']}) = {entry['result']}")
+            divisions = history.query('divide')
+            middle = history.query(start_time=start_time + elapsed / 2)
+            print(f"  {len(divisions):,} divisions, {len(middle):,} entries in the second half "
+                  f"({time.perf_counter() - start:.3f}s)")
+
+        with CalculationHistory(capacity=1_000, log_path=log_path) as reopened:
+            replayed = sum(1 for _ in reopened.replay(start=calls - 5))
+            print(f"  After reopening: {reopened.total_count:,} records, "
+                  f"replayed the last {replayed}")
+
+    list_calculator = RefactoredCalculator()
+    for i in range(calls):
+        list_calculator.calculate('add', i, 1)
+    print(f"List history for comparison: {len(list_calculator.history):,} dictionaries kept")
+
+    print()
+
+
+def main():
+    """Main function demonstrating the calculation history."""
+    print("=== Day 7: Bounded Calculation History ===")
+    print()
+
+    demonstrate_history()
+
+    print("📚 Key Learning Points:")
+    print("• A ring buffer keeps memory use constant")
+    print("• Fixed-size records turn an index into a file offset")
+    print("• Batching records into one write is cheaper than one write each")
+    print("• Sorted timestamps allow binary search instead of a full scan")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Day 7 Solution: Parallel Directory Scanner
+==========================================
+
+FileOperations.file_exists and get_file_size look at one path per call, so
+inventorying a tree means walking it and making two system calls per file,
+one file after another. This solution scans directories with os.scandir,
+whose entries already know whether they are files or directories, and spreads
+the directories over a thread pool so their stat calls overlap. Include and
+exclude globs are compiled into one regular expression each, excluded
+directories are never entered, and records are streamed back as each
+directory finishes, optionally with a content hash.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import fnmatch
+import logging
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple
+
+from refactored_exercises import FileOperations
+from backup_engine import file_digest
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FileRecord:
+    """One file found by a scan."""
+    path: str
+    size: int
+    mtime: float
+    digest: Optional[str] = None
+
+
+def _compile_globs(patterns: Optional[Iterable[str]]) -> Optional['re.Pattern']:
+    """One regular expression matching any of the glob patterns."""
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    patterns = list(patterns or [])
+    if not patterns:
+        return None
+    return re.compile('|'.join(f'(?:{fnmatch.translate(pattern)})' for pattern in patterns))
+
+
+class DirectoryScanner:
+    """
+    Recursive file inventory on a thread pool.
+
+    Globs are matched against both the file name and its path relative to
+    the scan root (with '/' separators), so '*.py' and 'src/*.py' both work.
+    Exclude patterns also prune whole directories. When following symbolic
+    links, each directory is scanned once, so link cycles terminate.
+    """
+
+    def __init__(self, include: Optional[Iterable[str]] = None,
+                 exclude: Optional[Iterable[str]] = None, hashes: bool = False,
+                 workers: int = 8, follow_symlinks: bool = False):
+        """
+        Args:
+            include: Globs a file must match (default: every file)
+            exclude: Globs for files and directories to skip
+            hashes: Also compute each file's SHA-256
+            workers: Threads scanning directories
+            follow_symlinks: Follow symbolic links to files and directories
+        """
+        if workers < 1:
+            raise ValueError("Workers must be at least 1")
+        self.include = _compile_globs(include)
+        self.exclude = _compile_globs(exclude)
+        self.hashes = hashes
+        self.workers = workers
+        self.follow_symlinks = follow_symlinks
+
+    @staticmethod
+    def _matches(pattern: 're.Pattern', name: str, relative: str) -> bool:
+        return pattern.match(name) is not None or pattern.match(relative) is not None
+
+    def _scan_directory(self, directory: str, prefix: str
+                        ) -> Tuple[List[FileRecord], List[Tuple[str, str, Optional[Tuple[int, int]]]]]:
+        """
+        Records for the files directly in directory, and its subdirectories
+        as (path, relative prefix, identity) triples. prefix is the
+        directory's path relative to the scan root, ending in '/' (empty for
+        the root); identity is (st_dev, st_ino) when following links, else None.
+        """
+        records, subdirectories = [], []
+        try:
+            entries = os.scandir(directory)
+        except OSError as e:
+            logger.warning(f"Skipping directory {directory}: {e}")
+            return records, subdirectories
+
+        include, exclude = self.include, self.exclude
+        follow = self.follow_symlinks
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if exclude is not None and self._matches(exclude, name, prefix + name):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=follow):
+                        identity = None
+                        if follow:
+                            stat = entry.stat()
+                            identity = (stat.st_dev, stat.st_ino)
+                        subdirectories.append((entry.path, f"{prefix}{name}/", identity))
+                        continue
+                    if not entry.is_file(follow_symlinks=follow):
+                        continue
+                    if include is not None and not self._matches(include, name, prefix + name):
+                        continue
+                    stat = entry.stat(follow_symlinks=follow)
+                    digest = file_digest(entry.path) if self.hashes else None
+                except OSError as e:
+                    logger.warning(f"Skipping {entry.path}: {e}")
+                    continue
+                records.append(FileRecord(entry.path, stat.st_size, stat.st_mtime, digest))
+        return records, subdirectories
+
+    def scan(self, root: str) -> Iterator[FileRecord]:
+        """
+        Stream records for every matching file under root.
+
+        Records for a directory are yielded as soon as it has been scanned,
+        so the order follows completion rather than the tree.
+
+        Args:
+            root: Directory to scan
+
+        Yields:
+            FileRecord for each file
+
+        Raises:
+            FileNotFoundError: If root doesn't exist
+        """
+        if not os.path.isdir(root):
+            raise FileNotFoundError(f"Directory not found: {root}")
+
+        visited = set()
+        if self.follow_symlinks:
+            stat = os.stat(root)
+            visited.add((stat.st_dev, stat.st_ino))
+
+        count = 0
+        with ThreadPoolExecutor(max_workers=self.workers,
+                                thread_name_prefix='scanner') as executor:
+            pending = {executor.submit(self._scan_directory, root, '')}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    records, subdirectories = future.result()
+                    for directory, prefix, identity in subdirectories:
+                        if identity is not None:
+                            if identity in visited:
+                                continue
+                            visited.add(identity)
+                        pending.add(executor.submit(self._scan_directory, directory, prefix))
+                    count += len(records)
+                    yield from records
+        logger.info(f"Scanned {count} files under {root}")
+
+    def inventory(self, root: str) -> Dict[str, FileRecord]:
+        """All records under root, keyed by path relative to root."""
+        start = len(os.path.join(root, ''))
+        return {record.path[start:]: record for record in self.scan(root)}
+
+    def total_size(self, root: str) -> int:
+        """Total size in bytes of the matching files under root."""
+        return sum(record.size for record in self.scan(root))
+
+
+def _create_sample_tree(root: str, directories: int = 40, files_per_directory: int = 250) -> None:
+    for d in range(directories):
+        directory = os.path.join(root, f"project_{d % 4}", f"module_{d}")
+        os.makedirs(directory, exist_ok=True)
+        os.makedirs(os.path.join(directory, "__pycache__"), exist_ok=True)
+        for f in range(files_per_directory):
+            extension = '.py' if f % 3 else '.txt'
+            with open(os.path.join(directory, f"file_{f}{extension}"), 'w') as file:
+                file.write("x" * (f % 50))
+        with open(os.path.join(directory, "__pycache__", "cached.pyc"), 'w') as file:
+            file.write("compiled")
+
+
+def demonstrate_scanner():
+    """Compare per-path FileOperations calls with the parallel scanner."""
+    print("1. Parallel Directory Scan")
+    print("-" * 30)
+
+    logging.getLogger('refactored_exercises').setLevel(logging.WARNING)
+    logger.setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as root:
+        _create_sample_tree(root)
+
+        start = time.perf_counter()
+        serial_total = 0
+        for directory, _, filenames in os.walk(root):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                if FileOperations.file_exists(path):
+                    serial_total += FileOperations.get_file_size(path)
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scanner = DirectoryScanner()
+        scanned_total = scanner.total_size(root)
+        scan_time = time.perf_counter() - start
+
+        print(f"Total size via os.walk + FileOperations: {serial_total:,} bytes in {serial_time:.4f}s")
+        print(f"Total size via DirectoryScanner:         {scanned_total:,} bytes in {scan_time:.4f}s")
+
+        python_files = DirectoryScanner(include=['*.py'], exclude=['__pycache__']).inventory(root)
+        print(f"Python files (excluding __pycache__): {len(python_files):,}")
+
+        hashed = DirectoryScanner(include=['project_0/*/file_1.py'], hashes=True).inventory(root)
+        for path, record in sorted(hashed.items())[:3]:
+            print(f"  {path}: {record.size} bytes, sha256 {record.digest[:12]}...")
+
+    print()
+
+
+def main():
+    """Main function demonstrating the directory scanner."""
+    print("=== Day 7: Parallel Directory Scanner ===")
+    print()
+
+    demonstrate_scanner()
+
+    print("📚 Key Learning Points:")
+    print("• os.scandir entries know their type without an extra stat call")
+    print("• Threads overlap the system calls of independent directories")
+    print("• Pruning excluded directories saves visiting them at all")
+    print("• Generators stream results instead of building huge lists")
+
+
+if __name__ == "__main__":
+    main()
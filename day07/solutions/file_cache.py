@@ -0,0 +1,381 @@
+"""
+Day 7 Solution: File Cache and Change Detection
+===============================================
+
+Pipelines that run repeatedly over the same directory call
+FileOperations.read_file on every file each time, just to find out whether
+anything changed. This solution keeps an LRU cache of file contents and
+content hashes keyed by each file's signature - (device, inode, mtime, size)
+from a single stat call - so unchanged files are served from memory, and
+takes directory snapshots whose comparison with changed_since reports the
+added, modified and removed files without reading the unchanged ones.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, NamedTuple
+
+from refactored_exercises import FileOperations
+from backup_engine import file_digest
+
+
+logger = logging.getLogger(__name__)
+
+
+class FileSignature(NamedTuple):
+    """What a stat call says about a file's identity and version."""
+    device: int
+    inode: int
+    mtime_ns: int
+    size: int
+
+    @classmethod
+    def from_stat(cls, stat: os.stat_result) -> 'FileSignature':
+        return cls(stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def file_signature(filepath: str) -> FileSignature:
+    """
+    Signature of a file from one stat call.
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    return FileSignature.from_stat(os.stat(filepath))
+
+
+@dataclass
+class _CacheEntry:
+    signature: FileSignature
+    trusted: bool
+    content: Optional[str] = None
+    encoding: Optional[str] = None
+    digest: Optional[str] = None
+
+
+@dataclass
+class Snapshot:
+    """Signatures (and optionally hashes) of every file under a directory."""
+    root: str
+    files: Dict[str, FileSignature]
+    taken_at_ns: int
+    digests: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class Changes:
+    """Result of comparing a directory with an earlier snapshot."""
+    added: List[str]
+    modified: List[str]
+    removed: List[str]
+    unchanged: int
+    snapshot: Snapshot
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+
+class FileCache:
+    """
+    LRU cache of file contents and SHA-256 hashes.
+
+    A cached value is used only while the file's signature is unchanged. A
+    file written within racy_window seconds of being cached could change
+    again without its mtime moving (timestamps have limited granularity), so
+    such entries are re-read until they are old enough to be trusted.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_chars: int = 64 * 1024 * 1024,
+                 racy_window: float = 0.05):
+        """
+        Args:
+            max_entries: Number of files to remember
+            max_chars: Total length of cached contents (longer files aren't kept)
+            racy_window: Seconds within which an mtime is too recent to trust
+        """
+        if max_entries < 1:
+            raise ValueError("Cache must hold at least one entry")
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self.racy_window_ns = int(racy_window * 1e9)
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+        self._entries: 'OrderedDict[str, _CacheEntry]' = OrderedDict()
+        self._cached_chars = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _is_racy(self, signature: FileSignature, reference_ns: int) -> bool:
+        return signature.mtime_ns >= reference_ns - self.racy_window_ns
+
+    def _lookup(self, key: str, signature: FileSignature) -> Optional[_CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.signature != signature or not entry.trusted:
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _store(self, key: str, signature: FileSignature, cached_at_ns: int,
+               **values) -> None:
+        trusted = not self._is_racy(signature, cached_at_ns)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._cached_chars -= len(entry.content or '')
+                if entry.signature != signature:
+                    entry = None
+            if entry is None:
+                entry = _CacheEntry(signature, trusted)
+            entry.trusted = trusted
+            for name, value in values.items():
+                setattr(entry, name, value)
+            if entry.content is not None and len(entry.content) > self.max_chars:
+                entry.content = entry.encoding = None
+
+            self._entries[key] = entry
+            self._cached_chars += len(entry.content or '')
+            while len(self._entries) > self.max_entries or self._cached_chars > self.max_chars:
+                _, evicted = self._entries.popitem(last=False)
+                self._cached_chars -= len(evicted.content or '')
+                self.stats['evictions'] += 1
+
+    def read_file(self, filepath: str, encoding: str = 'utf-8') -> str:
+        """
+        FileOperations.read_file, served from the cache when unchanged.
+
+        Args:
+            filepath: Path to the file
+            encoding: File encoding (default: utf-8)
+
+        Returns:
+            File contents as string
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            PermissionError: If no read permission
+            UnicodeDecodeError: If encoding issues
+        """
+        key = os.path.abspath(filepath)
+        signature = file_signature(filepath)
+        entry = self._lookup(key, signature)
+        if entry is not None and entry.content is not None and entry.encoding == encoding:
+            self.stats['hits'] += 1
+            return entry.content
+
+        self.stats['misses'] += 1
+        now_ns = time.time_ns()
+        content = FileOperations.read_file(filepath, encoding)
+        # Only cache what was read if the file didn't change during the read
+        if file_signature(filepath) == signature:
+            self._store(key, signature, now_ns, content=content, encoding=encoding)
+        return content
+
+    def digest(self, filepath: str) -> str:
+        """SHA-256 of a file, cached while the file is unchanged."""
+        key = os.path.abspath(filepath)
+        signature = file_signature(filepath)
+        entry = self._lookup(key, signature)
+        if entry is not None and entry.digest is not None:
+            self.stats['hits'] += 1
+            return entry.digest
+
+        self.stats['misses'] += 1
+        now_ns = time.time_ns()
+        digest = file_digest(filepath)
+        if file_signature(filepath) == signature:
+            self._store(key, signature, now_ns, digest=digest)
+        return digest
+
+    def invalidate(self, filepath: str) -> None:
+        """Forget a file (e.g. after writing it yourself)."""
+        with self._lock:
+            entry = self._entries.pop(os.path.abspath(filepath), None)
+            if entry is not None:
+                self._cached_chars -= len(entry.content or '')
+
+    def clear(self) -> None:
+        """Forget every file."""
+        with self._lock:
+            self._entries.clear()
+            self._cached_chars = 0
+
+    def snapshot(self, root: str, hashes: bool = False) -> Snapshot:
+        """
+        Record the signature of every file under root.
+
+        Args:
+            root: Directory to scan (recursively)
+            hashes: Also record content hashes, so files that were touched
+                but not modified are reported as unchanged later
+
+        Returns:
+            Snapshot to pass to changed_since
+        """
+        taken_at_ns = time.time_ns()
+        files = _scan_signatures(root)
+        digests = {}
+        if hashes:
+            for path in files:
+                try:
+                    digests[path] = self.digest(os.path.join(root, path))
+                except FileNotFoundError:
+                    pass
+        return Snapshot(root, files, taken_at_ns, digests)
+
+    def changed_since(self, snapshot: Snapshot) -> Changes:
+        """
+        Compare the snapshot's directory with its current state.
+
+        Only directory entries are stat-ed; file contents are read solely to
+        hash files whose signature changed (when the snapshot has hashes).
+        Files modified within racy_window of the snapshot are reported as
+        modified unless their hashes show otherwise.
+
+        Returns:
+            Changes, including a new snapshot for the next comparison
+        """
+        taken_at_ns = time.time_ns()
+        current = _scan_signatures(snapshot.root)
+        added, modified = [], []
+        digests = {}
+        unchanged = 0
+
+        for path, signature in current.items():
+            previous = snapshot.files.get(path)
+            if previous is None:
+                added.append(path)
+                continue
+            # A file modified right around the snapshot may keep its mtime
+            same = previous == signature and not self._is_racy(previous, snapshot.taken_at_ns)
+            old_digest = snapshot.digests.get(path)
+            if not same and old_digest is not None and previous.size == signature.size:
+                try:
+                    digests[path] = self.digest(os.path.join(snapshot.root, path))
+                    same = digests[path] == old_digest
+                except FileNotFoundError:
+                    pass
+            elif same and old_digest is not None:
+                digests[path] = old_digest
+            if same:
+                unchanged += 1
+            else:
+                modified.append(path)
+
+        removed = [path for path in snapshot.files if path not in current]
+        if snapshot.digests:
+            for path in added + modified:
+                if path not in digests:
+                    try:
+                        digests[path] = self.digest(os.path.join(snapshot.root, path))
+                    except FileNotFoundError:
+                        pass
+
+        logger.info(f"Scanned {snapshot.root}: {len(added)} added, {len(modified)} modified, "
+                    f"{len(removed)} removed, {unchanged} unchanged")
+        return Changes(sorted(added), sorted(modified), sorted(removed), unchanged,
+                       Snapshot(snapshot.root, current, taken_at_ns, digests))
+
+
+def _scan_signatures(root: str) -> Dict[str, FileSignature]:
+    """Signatures of regular files under root, keyed by relative path."""
+    signatures = {}
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        path = os.path.relpath(entry.path, root)
+                        signatures[path] = FileSignature.from_stat(entry.stat())
+                except FileNotFoundError:
+                    continue  # removed while scanning
+    return signatures
+
+
+def demonstrate_file_cache():
+    """Demonstrate cached reads and incremental change detection."""
+    print("1. Cached Reads and Change Detection")
+    print("-" * 40)
+
+    logging.getLogger('refactored_exercises').setLevel(logging.WARNING)
+    logger.setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for i in range(1_000):
+            path = os.path.join(directory, f"record_{i}.txt")
+            FileOperations.write_file(path, f"record {i}\n" * 200)
+            paths.append(path)
+        time.sleep(0.1)  # let the new files' mtimes age past the racy window
+
+        cache = FileCache()
+        start = time.perf_counter()
+        for path in paths:
+            FileOperations.read_file(path)
+        uncached_time = time.perf_counter() - start
+
+        for path in paths:
+            cache.read_file(path)
+        start = time.perf_counter()
+        for path in paths:
+            cache.read_file(path)
+        cached_time = time.perf_counter() - start
+
+        print(f"Re-reading {len(paths)} unchanged files:")
+        print(f"  FileOperations.read_file: {uncached_time:.4f}s")
+        print(f"  FileCache.read_file:      {cached_time:.4f}s ({cache.stats['hits']} hits)")
+
+        snapshot = cache.snapshot(directory, hashes=True)
+        time.sleep(0.1)
+        FileOperations.write_file(paths[0], "edited\n", append=True)
+        FileOperations.write_file(os.path.join(directory, "new.txt"), "new file\n")
+        os.remove(paths[1])
+        os.utime(paths[2])  # touched, same contents
+
+        start = time.perf_counter()
+        changes = cache.changed_since(snapshot)
+        scan_time = time.perf_counter() - start
+        print(f"Incremental scan in {scan_time:.4f}s:")
+        print(f"  added={changes.added} modified={changes.modified} removed={changes.removed}")
+        print(f"  unchanged={changes.unchanged}")
+        print(f"  Reads after the edit see new content: "
+              f"{cache.read_file(paths[0]).endswith('edited' + chr(10))}")
+
+    print()
+
+
+def main():
+    """Main function demonstrating the file cache."""
+    print("=== Day 7: File Cache and Change Detection ===")
+    print()
+
+    demonstrate_file_cache()
+
+    print("📚 Key Learning Points:")
+    print("• One stat call tells you whether a cached copy is still valid")
+    print("• LRU eviction keeps memory use bounded")
+    print("• Very recent mtimes can't be trusted at timestamp granularity")
+    print("• Hashes separate real edits from files that were only touched")
+
+
+if __name__ == "__main__":
+    main()
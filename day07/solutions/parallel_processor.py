@@ -0,0 +1,264 @@
+"""
+Day 7 Solution: Parallel Data Processing
+========================================
+
+The batch and streaming processors still run on a single core. This solution
+splits a large input into contiguous ranges and processes them in a pool of
+worker processes. The numbers are never pickled: the parent copies the input
+once into a multiprocessing.shared_memory block, every worker reads its range
+from there and writes its results into a shared output block at the same
+offset, and only the range bounds, the DataProcessorConfig and a small
+RunningStatistics partial travel between processes. Partials merge
+associatively and ranges are reassembled in input order.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import logging
+import os
+import random
+import statistics
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Dict, Optional, Sequence, Tuple, Union
+
+from refactored_exercises import DataProcessorConfig
+from batch_processing import BatchDataProcessor
+from streaming_processor import RunningStatistics
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; shared blocks are then read as memoryviews
+    np = None
+
+
+logger = logging.getLogger(__name__)
+
+Number = Union[int, float]
+
+
+def _open_views(input_name: str, output_name: str, dtype: str, length: int):
+    """Attach to the shared blocks and return (blocks, input view, output view)."""
+    blocks = (shared_memory.SharedMemory(name=input_name),
+              shared_memory.SharedMemory(name=output_name))
+    if np is not None:
+        source = np.ndarray((length,), dtype=np.dtype(dtype), buffer=blocks[0].buf)
+        target = np.ndarray((length,), dtype=np.float64, buffer=blocks[1].buf)
+    else:
+        source = blocks[0].buf.cast('d')
+        target = blocks[1].buf.cast('d')
+    return blocks, source, target
+
+
+def _process_range(task: Tuple[str, str, str, int, int, int, DataProcessorConfig]
+                   ) -> Tuple[int, int, RunningStatistics]:
+    """
+    Worker: process data[start:stop] from shared memory.
+
+    Results are written to the output block starting at start (a range never
+    produces more values than it reads), and (start, count, stats) is
+    returned for the parent to reassemble.
+    """
+    input_name, output_name, dtype, length, start, stop, config = task
+    blocks, source, target = _open_views(input_name, output_name, dtype, length)
+    try:
+        processor = BatchDataProcessor(config)
+        chunk = source[start:stop]
+        result = processor._apply_rules(chunk if np is not None else array('d', chunk.tobytes()))
+        count = len(result)
+        target[start:start + count] = result
+        stats = RunningStatistics()
+        stats.update(result)
+        del chunk, result
+        return start, count, stats
+    finally:
+        del source, target
+        for block in blocks:
+            block.close()
+
+
+class ParallelDataProcessor(BatchDataProcessor):
+    """
+    DataProcessor that spreads large batches over worker processes.
+
+    The pool is created on first use and reused until close() (or the end
+    of a with block). Inputs smaller than min_parallel_size are processed
+    in-process, where pool overhead would dominate.
+    """
+
+    def __init__(self, config: Optional[DataProcessorConfig] = None,
+                 workers: Optional[int] = None, chunk_size: int = 1_000_000,
+                 min_parallel_size: int = 200_000):
+        super().__init__(config)
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.min_parallel_size = min_parallel_size
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> 'ParallelDataProcessor':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _ranges(self, length: int) -> List[Tuple[int, int]]:
+        # At least one range per worker so every core gets work
+        size = min(self.chunk_size, -(-length // self.workers))
+        return [(start, min(start + size, length)) for start in range(0, length, size)]
+
+    def process_parallel(self, data: Sequence[Number]) -> Tuple[object, RunningStatistics]:
+        """
+        Process a batch across worker processes.
+
+        Args:
+            data: List, array('d') or NumPy array of numbers
+
+        Returns:
+            (results, stats): processed values in input order (ndarray with
+            NumPy, otherwise array('d')) and their merged RunningStatistics
+
+        Raises:
+            TypeError: If data contains non-numeric values
+            ValueError: If data is empty
+        """
+        if len(data) == 0:
+            raise ValueError("Data list cannot be empty")
+        raw = self._as_array(data)
+        if raw is None:
+            # Ints that no array type holds exactly take the scalar path
+            result = self._process_scalar(data)
+            stats = RunningStatistics()
+            stats.update(result)
+            return result, stats
+        length = len(raw)
+
+        if length < self.min_parallel_size:
+            result = self._apply_rules(raw)
+            stats = RunningStatistics()
+            stats.update(result)
+            return result, stats
+
+        if np is not None:
+            dtype = raw.dtype.str
+            nbytes = raw.nbytes
+        else:
+            dtype = 'd'
+            nbytes = length * raw.itemsize
+
+        source_block = shared_memory.SharedMemory(create=True, size=nbytes)
+        output_block = shared_memory.SharedMemory(create=True, size=length * 8)
+        try:
+            if np is not None:
+                np.ndarray(raw.shape, dtype=raw.dtype, buffer=source_block.buf)[:] = raw
+            else:
+                source_block.buf[:nbytes] = memoryview(raw).cast('B')
+
+            tasks = [(source_block.name, output_block.name, dtype, length, start, stop, self.config)
+                     for start, stop in self._ranges(length)]
+            partials = list(self._get_pool().map(_process_range, tasks))  # map keeps task order
+
+            stats = RunningStatistics()
+            for _, _, partial in partials:
+                stats.merge(partial)
+
+            if np is not None:
+                output = np.ndarray((length,), dtype=np.float64, buffer=output_block.buf)
+                result = np.concatenate([output[start:start + count] for start, count, _ in partials])
+                del output
+            else:
+                output = output_block.buf.cast('d')
+                result = array('d')
+                for start, count, _ in partials:
+                    result.frombytes(output[start:start + count].tobytes())
+                output.release()
+        finally:
+            for block in (source_block, output_block):
+                block.close()
+                block.unlink()
+
+        logger.info(f"Processed {length} numbers in {len(partials)} ranges on "
+                    f"{self.workers} workers, returned {len(result)} results")
+        return result, stats
+
+    def get_statistics_parallel(self, data: Sequence[Number]) -> Dict[str, float]:
+        """Statistics of the processed data, computed in parallel (with median)."""
+        if len(data) == 0:
+            return {}
+        result, stats = self.process_parallel(data)
+        summary = stats.as_dict()
+        if summary:
+            summary['median'] = float(np.median(result)) if np is not None else statistics.median(result)
+        return summary
+
+
+def demonstrate_parallel_processor():
+    """Demonstrate parallel processing and compare it with the other paths."""
+    print("1. Parallel Processing with Shared Memory")
+    print("-" * 45)
+
+    logging.getLogger('refactored_exercises').setLevel(logging.WARNING)
+    logging.getLogger('batch_processing').setLevel(logging.WARNING)
+
+    config = DataProcessorConfig(even_multiplier=2.5, odd_multiplier=3.5, include_negative=True)
+    random.seed(42)
+    data = [random.randint(-1000, 1000) for _ in range(2_000_000)]
+    batch_input = np.array(data) if np is not None else array('d', data)
+
+    with ParallelDataProcessor(config, chunk_size=250_000) as processor:
+        start = time.perf_counter()
+        expected = processor.process_numbers(data)
+        scalar_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = processor.process_batch(batch_input)
+        batch_time = time.perf_counter() - start
+
+        processor.process_parallel(batch_input[:processor.min_parallel_size])  # start the pool
+        start = time.perf_counter()
+        result, stats = processor.process_parallel(batch_input)
+        parallel_time = time.perf_counter() - start
+
+        summary = stats.as_dict()
+        print(f"{len(data):,} values on {processor.workers} worker(s):")
+        print(f"  process_numbers:  {scalar_time:.4f}s")
+        print(f"  process_batch:    {batch_time:.4f}s")
+        print(f"  process_parallel: {parallel_time:.4f}s")
+        print(f"  Same values in the same order: {list(result) == expected == list(batch)}")
+        print(f"  Merged statistics: count={summary['count']:,}, mean={summary['mean']:.4f}, "
+              f"std_dev={summary['std_dev']:.4f}")
+
+    print()
+
+
+def main():
+    """Main function demonstrating parallel data processing."""
+    print("=== Day 7: Parallel Data Processing ===")
+    print()
+
+    demonstrate_parallel_processor()
+
+    print("📚 Key Learning Points:")
+    print("• Processes sidestep the GIL for CPU-bound work")
+    print("• Shared memory avoids pickling large arrays between processes")
+    print("• Each worker writes to its own slice, so no locking is needed")
+    print("• Mergeable partial statistics make the reduction order-independent")
+
+
+if __name__ == "__main__":
+    main()
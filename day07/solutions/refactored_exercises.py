@@ -11,8 +11,11 @@ Date: 2024
 """
 
 import math
+import os
+import re
 import statistics
-from typing import List, Dict, Optional, Union, Tuple, Any, Callable
+import tempfile
+from typing import List, Dict, Optional, Union, Tuple, Any, Callable, Iterable, Iterator, Protocol
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -56,13 +59,30 @@ class BadCalculator:
 
 
 # AFTER: Clean, extensible, with proper error handling
+class HistoryStore(Protocol):
+    """
+    What RefactoredCalculator needs from its history: a list qualifies.
+
+    append() receives dictionaries with operation, operand_a, operand_b,
+    result and timestamp, or (from subclasses such as ExpressionCalculator)
+    expression, variables, result and timestamp; a store that cannot hold
+    an entry raises ValueError.
+    """
+    
+    def append(self, entry: Dict[str, Any]) -> None: ...
+    
+    def copy(self) -> List[Dict[str, Any]]: ...
+    
+    def clear(self) -> None: ...
+
+
 class RefactoredCalculator:
     """
     A well-designed calculator with proper error handling, extensibility,
     and clean architecture.
     """
     
-    def __init__(self):
+    def __init__(self, history: Optional[HistoryStore] = None):
         self.operations = {
             'add': self._add,
             'subtract': self._subtract,
@@ -71,7 +91,9 @@ class RefactoredCalculator:
             'power': self._power,
             'modulo': self._modulo
         }
-        self.history: List[Dict[str, Union[str, float]]] = []
+        # Any HistoryStore works, e.g. a bounded
+        # calculation_history.CalculationHistory
+        self.history: HistoryStore = history if history is not None else []
     
     def _add(self, a: float, b: float) -> float:
         """Add two numbers."""
@@ -404,6 +426,11 @@ def bad_string_utils():
 
 
 # AFTER: Well-organized utility class with comprehensive functionality
+# Patterns are compiled once at import instead of on every call
+NUMBER_PATTERN = re.compile(r'-?\d+\.?\d*')  # Integers and floats (including negative)
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
 class StringUtils:
     """
     Comprehensive string utility class with robust error handling
@@ -490,13 +517,10 @@ class StringUtils:
         Returns:
             List of numbers found in the string
         """
-        import re
         if not isinstance(text, str):
             raise TypeError("Input must be a string")
         
-        # Pattern to match integers and floats (including negative)
-        pattern = r'-?\d+\.?\d*'
-        matches = re.findall(pattern, text)
+        matches = NUMBER_PATTERN.findall(text)
         
         numbers = []
         for match in matches:
@@ -525,8 +549,7 @@ class StringUtils:
             raise TypeError("Input must be a string")
         
         # Replace multiple whitespace with single space and strip
-        import re
-        cleaned = re.sub(r'\s+', ' ', text.strip())
+        cleaned = WHITESPACE_PATTERN.sub(' ', text.strip())
         return cleaned
     
     @staticmethod
@@ -645,6 +668,178 @@ class FileOperations:
             logger.error(f"OS error writing to file {filepath}: {e}")
             raise
     
+    @staticmethod
+    def iter_lines(filepath: str, encoding: str = 'utf-8',
+                   keep_newlines: bool = False) -> Iterator[str]:
+        """
+        Lazily yield the lines of a text file, one at a time.
+        
+        Args:
+            filepath: Path to the file
+            encoding: File encoding (default: utf-8)
+            keep_newlines: If True, keep the trailing newline of each line
+            
+        Yields:
+            Lines of the file
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            PermissionError: If no read permission
+            UnicodeDecodeError: If encoding issues
+        """
+        count = 0
+        try:
+            with open(filepath, 'r', encoding=encoding) as file:
+                for line in file:
+                    count += 1
+                    yield line if keep_newlines else line.rstrip('\n')
+            logger.info(f"Successfully read {count} lines from file: {filepath}")
+        except FileNotFoundError:
+            logger.error(f"File not found: {filepath}")
+            raise
+        except PermissionError:
+            logger.error(f"Permission denied reading file: {filepath}")
+            raise
+        except UnicodeDecodeError as e:
+            logger.error(f"Encoding error reading file {filepath}: {e}")
+            raise
+    
+    @staticmethod
+    def iter_chunks(filepath: str, chunk_size: int = 64 * 1024, binary: bool = False,
+                    encoding: str = 'utf-8') -> Iterator[Union[str, bytes]]:
+        """
+        Lazily yield a file in fixed-size chunks.
+        
+        Args:
+            filepath: Path to the file
+            chunk_size: Characters (text) or bytes (binary) per chunk
+            binary: If True, yield bytes instead of decoded text
+            encoding: File encoding for text mode (default: utf-8)
+            
+        Yields:
+            Chunks of at most chunk_size characters or bytes
+            
+        Raises:
+            ValueError: If chunk_size is not positive
+            FileNotFoundError: If file doesn't exist
+            PermissionError: If no read permission
+            UnicodeDecodeError: If encoding issues (text mode)
+        """
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        
+        mode = 'rb' if binary else 'r'
+        kwargs = {} if binary else {'encoding': encoding}
+        try:
+            with open(filepath, mode, **kwargs) as file:
+                while True:
+                    chunk = file.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+            logger.info(f"Successfully streamed file: {filepath}")
+        except FileNotFoundError:
+            logger.error(f"File not found: {filepath}")
+            raise
+        except PermissionError:
+            logger.error(f"Permission denied reading file: {filepath}")
+            raise
+        except UnicodeDecodeError as e:
+            logger.error(f"Encoding error reading file {filepath}: {e}")
+            raise
+    
+    @staticmethod
+    def read_bytes_into(filepath: str, buffer: Union[bytearray, memoryview],
+                        offset: int = 0) -> int:
+        """
+        Read file bytes directly into a caller-owned buffer (no new bytes object).
+        
+        Reusing one buffer across calls keeps memory constant; pass a
+        memoryview slice to fill only part of a larger buffer.
+        
+        Args:
+            filepath: Path to the file
+            buffer: Writable buffer (bytearray, memoryview, array...)
+            offset: Byte position in the file to start reading from
+            
+        Returns:
+            Number of bytes read (less than len(buffer) only at end of file)
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            PermissionError: If no read permission
+        """
+        view = memoryview(buffer).cast('B')
+        total = 0
+        try:
+            with open(filepath, 'rb', buffering=0) as file:
+                file.seek(offset)
+                while total < len(view):
+                    count = file.readinto(view[total:])
+                    if not count:
+                        break
+                    total += count
+            logger.info(f"Read {total} bytes from file: {filepath}")
+            return total
+        except FileNotFoundError:
+            logger.error(f"File not found: {filepath}")
+            raise
+        except PermissionError:
+            logger.error(f"Permission denied reading file: {filepath}")
+            raise
+        finally:
+            view.release()
+    
+    @staticmethod
+    def write_lines(filepath: str, lines: Iterable[str], encoding: str = 'utf-8',
+                    append: bool = False, batch_size: int = 1000) -> int:
+        """
+        Write lines from any iterable, batching them into few write calls.
+        
+        Lines are joined in batches of batch_size and written as one string,
+        so memory stays bounded by one batch however long the input is.
+        
+        Args:
+            filepath: Path to the file
+            lines: Lines to write (a newline is added after each)
+            encoding: File encoding (default: utf-8)
+            append: If True, append to file instead of overwriting
+            batch_size: Number of lines per write call
+            
+        Returns:
+            Number of lines written
+            
+        Raises:
+            ValueError: If batch_size is not positive
+            PermissionError: If no write permission
+            OSError: If disk space or other OS issues
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        
+        mode = 'a' if append else 'w'
+        count = 0
+        batch: List[str] = []
+        try:
+            with open(filepath, mode, encoding=encoding) as file:
+                for line in lines:
+                    batch.append(line)
+                    if len(batch) >= batch_size:
+                        file.write('\n'.join(batch) + '\n')
+                        count += len(batch)
+                        batch.clear()
+                if batch:
+                    file.write('\n'.join(batch) + '\n')
+                    count += len(batch)
+            logger.info(f"Successfully wrote {count} lines to file: {filepath}")
+            return count
+        except PermissionError:
+            logger.error(f"Permission denied writing to file: {filepath}")
+            raise
+        except OSError as e:
+            logger.error(f"OS error writing to file {filepath}: {e}")
+            raise
+    
     @staticmethod
     def file_exists(filepath: str) -> bool:
         """Check if a file exists."""
@@ -794,6 +989,31 @@ def demonstrate_refactoring():
         print(f"String utilities error: {e}")
     
     print()
+    
+    # 5. Streaming file operations
+    print("5. Streaming File Operations")
+    print("-" * 30)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        log_path = os.path.join(directory, "app.log")
+        try:
+            lines = (f"request {i} served in {i % 7 * 10} ms" for i in range(10_000))
+            written = FileOperations.write_lines(log_path, lines, batch_size=500)
+            slow = sum(1 for line in FileOperations.iter_lines(log_path) if line.endswith("60 ms"))
+            chunks = sum(1 for _ in FileOperations.iter_chunks(log_path, chunk_size=16 * 1024))
+            
+            header = bytearray(16)
+            count = FileOperations.read_bytes_into(log_path, header)
+            
+            print(f"Wrote {written} lines with batched writes")
+            print(f"Slow requests found while streaming lines: {slow}")
+            print(f"File read in {chunks} chunks of 16 KiB")
+            print(f"First {count} bytes read into a reusable buffer: {bytes(header)!r}")
+        
+        except OSError as e:
+            print(f"File operations error: {e}")
+    
+    print()
 
 
 def compare_old_vs_new():
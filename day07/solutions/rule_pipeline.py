@@ -0,0 +1,389 @@
+"""
+Day 7 Solution: Compiled Rule Pipelines
+=======================================
+
+DataProcessor._should_include_number and _process_single_number re-read the
+configuration and branch on it for every element. This solution describes
+the processing as a pipeline of stages - filters, maps and aggregates - that
+is compiled once: the scalar path becomes a single generated loop with the
+built-in rules inlined as expressions, and the vectorized path runs every
+stage that has an array form as whole-array NumPy operations. Custom stages
+slot in alongside the rules from DataProcessorConfig; giving them an array
+form keeps the whole pipeline on the fast path.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import logging
+import math
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Any, Callable, Iterable, Sequence, Union
+
+from refactored_exercises import DataProcessor, DataProcessorConfig
+from batch_processing import exact_array, multiply_by_parity
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; pipelines then run the fused scalar loop
+    np = None
+
+
+logger = logging.getLogger(__name__)
+
+Number = Union[int, float]
+
+
+@dataclass
+class Stage:
+    """
+    One step of a rule pipeline.
+
+    Attributes:
+        name: Label used in describe() and error messages
+        func: Scalar function of one value
+        vector_func: Optional NumPy equivalent applied to a whole array
+        expression: Optional Python expression in x, inlined into the
+            compiled loop instead of calling func; constants are written
+            as {name} placeholders and bound from constants
+        constants: Values for the expression placeholders
+    """
+    name: str
+    func: Optional[Callable] = None
+    vector_func: Optional[Callable] = None
+    expression: Optional[str] = None
+    constants: Dict[str, Any] = field(default_factory=dict)
+
+    kind = 'stage'
+
+
+@dataclass
+class FilterStage(Stage):
+    """Keep values for which func (or the vector mask) is true."""
+    kind = 'filter'
+
+
+@dataclass
+class MapStage(Stage):
+    """Replace every value with func(value)."""
+    kind = 'map'
+
+
+@dataclass
+class AggregateStage(Stage):
+    """Reduce the final values to one number (func takes the whole sequence)."""
+    kind = 'aggregate'
+
+
+BUILTIN_AGGREGATES = {
+    'count': AggregateStage('count', len, len),
+    'sum': AggregateStage('sum', math.fsum, lambda v: float(v.sum())),
+    'mean': AggregateStage('mean', statistics.mean, lambda v: float(v.mean())),
+    'min': AggregateStage('min', min, lambda v: float(v.min())),
+    'max': AggregateStage('max', max, lambda v: float(v.max())),
+    'median': AggregateStage('median', statistics.median, lambda v: float(np.median(v))),
+    'std_dev': AggregateStage(
+        'std_dev', lambda v: statistics.stdev(v) if len(v) > 1 else 0.0,
+        lambda v: float(v.std(ddof=1)) if len(v) > 1 else 0.0),
+}
+
+
+@dataclass
+class PipelineResult:
+    """Output of RulePipeline.run."""
+    values: Any
+    aggregates: Dict[str, float]
+
+
+class RulePipeline:
+    """
+    Filter and map stages followed by aggregates, compiled once.
+
+    Compilation produces:
+      * a fused scalar loop - one generated function that applies every
+        stage per value without any per-stage dispatch
+      * a vectorized prefix - the leading stages that have a vector_func,
+        run as whole-array operations when NumPy is available; any stages
+        after the first one without a vector form run through a fused loop
+        compiled for just that suffix
+    """
+
+    def __init__(self, stages: Iterable[Stage] = (), name: str = "pipeline"):
+        self.name = name
+        self.stages: List[Stage] = []
+        self.aggregates: List[AggregateStage] = []
+        for stage in stages:
+            self.add(stage, _compile=False)
+        self._compile()
+
+    @classmethod
+    def from_config(cls, config: Optional[DataProcessorConfig] = None,
+                    aggregates: Sequence[str] = ()) -> 'RulePipeline':
+        """
+        Compile the DataProcessor rules for a configuration.
+
+        Args:
+            config: Processing configuration (default: DataProcessorConfig())
+            aggregates: Names from BUILTIN_AGGREGATES to compute on the output
+
+        Returns:
+            Pipeline producing the same values as DataProcessor.process_numbers
+        """
+        config = config or DataProcessorConfig()
+        stages: List[Stage] = []
+        if not config.include_negative:
+            stages.append(FilterStage(
+                'exclude_negative', lambda x: not x < 0, lambda v: ~(v < 0),
+                expression='not x < 0'))
+        if not config.include_zero:
+            stages.append(FilterStage(
+                'exclude_zero', lambda x: x != 0, lambda v: v != 0,
+                expression='x != 0'))
+        even, odd = config.even_multiplier, config.odd_multiplier
+        stages.append(MapStage(
+            'even_odd_multiplier',
+            lambda x: float(x) if x <= 0 else x * (even if x % 2 == 0 else odd),
+            lambda v: multiply_by_parity(v, even, odd),
+            expression='float(x) if x <= 0 else x * ({even} if x % 2 == 0 else {odd})',
+            constants={'even': even, 'odd': odd}))
+        for aggregate in aggregates:
+            if aggregate not in BUILTIN_AGGREGATES:
+                available = ', '.join(BUILTIN_AGGREGATES)
+                raise ValueError(f"Invalid aggregate '{aggregate}'. Available: {available}")
+            stages.append(BUILTIN_AGGREGATES[aggregate])
+        return cls(stages, name="config")
+
+    def add(self, stage: Stage, _compile: bool = True) -> 'RulePipeline':
+        """
+        Append a stage and recompile.
+
+        Filters and maps run in the order added; aggregates always run on
+        the final values.
+
+        Raises:
+            ValueError: If the stage has neither func nor expression
+        """
+        if stage.func is None and stage.expression is None:
+            raise ValueError(f"Stage '{stage.name}' needs a func or an expression")
+        if isinstance(stage, AggregateStage):
+            self.aggregates.append(stage)
+        else:
+            self.stages.append(stage)
+        if _compile:
+            self._compile()
+        return self
+
+    def _compile(self) -> None:
+        self._scalar_loop = self._fuse(self.stages)
+        split = len(self.stages)
+        for i, stage in enumerate(self.stages):
+            if stage.vector_func is None:
+                split = i
+                break
+        self._vector_stages = self.stages[:split]
+        self._suffix_loop = self._fuse(self.stages[split:]) if split < len(self.stages) else None
+
+    def _fuse(self, stages: List[Stage]) -> Callable[[Iterable[Number]], List[float]]:
+        """Generate one loop that applies every stage to each value."""
+        namespace: Dict[str, Any] = {}
+        lines = [
+            "def fused(data):",
+            "    out = []",
+            "    append = out.append",
+            "    for x in data:",
+        ]
+        for i, stage in enumerate(stages):
+            if stage.expression is not None:
+                names = {key: f"_s{i}_{key}" for key in stage.constants}
+                for key, value in stage.constants.items():
+                    namespace[names[key]] = value
+                expression = stage.expression.format(**names)
+            else:
+                namespace[f"_s{i}"] = stage.func
+                expression = f"_s{i}(x)"
+            if stage.kind == 'filter':
+                lines.append(f"        if not ({expression}):")
+                lines.append("            continue")
+            else:
+                lines.append(f"        x = {expression}")
+        lines.append("        append(x)")
+        lines.append("    return out")
+
+        source = "\n".join(lines)
+        exec(compile(source, f"<rule pipeline {self.name}>", "exec"), namespace)
+        fused = namespace["fused"]
+        fused.source = source
+        return fused
+
+    @property
+    def source(self) -> str:
+        """Source code of the generated scalar loop."""
+        return self._scalar_loop.source
+
+    def describe(self) -> str:
+        """Human-readable summary of the compiled plan."""
+        vector = ', '.join(stage.name for stage in self._vector_stages) or '-'
+        rest = ', '.join(stage.name for stage in self.stages[len(self._vector_stages):]) or '-'
+        aggregates = ', '.join(stage.name for stage in self.aggregates) or '-'
+        return f"vectorized: [{vector}] | fused loop: [{rest}] | aggregates: [{aggregates}]"
+
+    def run_scalar(self, data: Iterable[Number]) -> List[float]:
+        """Apply filters and maps with the fused scalar loop."""
+        return self._scalar_loop(data)
+
+    def run_values(self, data: Sequence[Number]):
+        """
+        Apply filters and maps, vectorizing as much as the stages allow.
+
+        Data that no NumPy array holds exactly (ints beyond int64, or
+        beyond 2**53 next to floats) runs through the fused scalar loop, so
+        results always match DataProcessor.
+
+        Returns:
+            float64 ndarray when every stage ran vectorized, otherwise a list
+
+        Raises:
+            TypeError: If data contains non-numeric values
+        """
+        values = exact_array(data) if np is not None else None
+        if values is None:
+            return self._scalar_loop(data)
+
+        if values.dtype.kind == 'f':
+            values = values.astype(np.float64, copy=False)
+        for stage in self._vector_stages:
+            if stage.kind == 'filter':
+                values = values[stage.vector_func(values)]
+            else:
+                values = stage.vector_func(values)
+        if self._suffix_loop is not None:
+            return self._suffix_loop(values.tolist())
+        return values.astype(np.float64, copy=False)
+
+    def run(self, data: Sequence[Number]) -> PipelineResult:
+        """Apply every stage and compute the aggregates."""
+        values = self.run_values(data)
+        vectorized = np is not None and isinstance(values, np.ndarray)
+        aggregates = {}
+        for stage in self.aggregates:
+            func = stage.vector_func if vectorized and stage.vector_func is not None else stage.func
+            aggregates[stage.name] = func(values) if len(values) or stage.name == 'count' else 0.0
+        return PipelineResult(values, aggregates)
+
+
+class PipelineDataProcessor(DataProcessor):
+    """
+    DataProcessor whose rules are compiled into a RulePipeline once.
+
+    Extra stages passed in run after the configuration rules.
+    """
+
+    def __init__(self, config: Optional[DataProcessorConfig] = None,
+                 extra_stages: Iterable[Stage] = ()):
+        super().__init__(config)
+        self.pipeline = RulePipeline.from_config(self.config)
+        for stage in extra_stages:
+            self.pipeline.add(stage)
+
+    def process_numbers(self, data: List[Union[int, float]]) -> List[float]:
+        """
+        Process a list of numbers with the compiled pipeline.
+
+        Raises:
+            TypeError: If data contains non-numeric values
+            ValueError: If data is empty
+        """
+        if not len(data):
+            raise ValueError("Data list cannot be empty")
+        values = self.pipeline.run_values(data)
+        result = values.tolist() if not isinstance(values, list) else values
+        logger.info(f"Processed {len(data)} numbers, returned {len(result)} results")
+        return result
+
+
+def demonstrate_rule_pipeline():
+    """Demonstrate compiling configuration rules and custom stages."""
+    print("1. Compiled Rule Pipeline")
+    print("-" * 30)
+
+    config = DataProcessorConfig(even_multiplier=2.5, odd_multiplier=3.5, include_negative=True)
+    test_data = [1, 2, 3, 4, 5, -2, 0, 8, 9]
+
+    pipeline = RulePipeline.from_config(config, aggregates=('count', 'mean', 'max'))
+    result = pipeline.run(test_data)
+    print(f"Plan: {pipeline.describe()}")
+    print(f"Generated loop:\n{pipeline.source}")
+    print(f"DataProcessor: {DataProcessor(config).process_numbers(test_data)}")
+    print(f"Pipeline:      {list(map(float, result.values))}")
+    print(f"Aggregates:    {result.aggregates}")
+
+    # A custom stage with an array form keeps the pipeline fully vectorized
+    pipeline.add(FilterStage('below_30', lambda x: x < 30, lambda v: v < 30,
+                             expression='x < {limit}', constants={'limit': 30}))
+    print(f"\nWith a vectorizable custom filter: {pipeline.describe()}")
+    print(f"  {list(map(float, pipeline.run(test_data).values))}")
+
+    # A scalar-only stage runs in the fused loop after the vectorized prefix
+    pipeline.add(MapStage('round_half_up', lambda x: math.floor(x + 0.5)))
+    print(f"With a scalar-only custom map:     {pipeline.describe()}")
+    print(f"  {pipeline.run(test_data).values}")
+
+    print()
+
+
+def demonstrate_pipeline_performance():
+    """Compare per-element dispatch with the compiled pipeline."""
+    print("2. Per-Element Dispatch vs Compiled Pipeline")
+    print("-" * 50)
+
+    logging.getLogger('refactored_exercises').setLevel(logging.WARNING)
+    logger.setLevel(logging.WARNING)
+
+    random.seed(42)
+    data = [random.randint(-1000, 1000) for _ in range(1_000_000)]
+    config = DataProcessorConfig(include_negative=True)
+    original = DataProcessor(config)
+    pipeline = RulePipeline.from_config(config)
+
+    start = time.perf_counter()
+    expected = original.process_numbers(data)
+    original_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fused = pipeline.run_scalar(data)
+    fused_time = time.perf_counter() - start
+
+    array_input = np.array(data) if np is not None else data
+    start = time.perf_counter()
+    vectorized = pipeline.run_values(array_input)
+    vector_time = time.perf_counter() - start
+
+    print(f"{len(data):,} values:")
+    print(f"  DataProcessor.process_numbers: {original_time:.4f}s")
+    print(f"  Fused scalar loop:             {fused_time:.4f}s (match: {fused == expected})")
+    print(f"  Vectorized pipeline:           {vector_time:.4f}s "
+          f"(match: {list(map(float, vectorized)) == expected})")
+
+    print()
+
+
+def main():
+    """Main function demonstrating compiled rule pipelines."""
+    print("=== Day 7: Compiled Rule Pipelines ===")
+    print()
+
+    demonstrate_rule_pipeline()
+    demonstrate_pipeline_performance()
+
+    print("📚 Key Learning Points:")
+    print("• Decide on configuration once, not once per element")
+    print("• Generated code can fuse many small steps into one loop")
+    print("• Stages with array forms compose into whole-array operations")
+    print("• A stage registry keeps the pipeline open for extension")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+Day 7 Solution: Streaming Data Processing
+=========================================
+
+DataProcessor.process_numbers needs the whole input as a list, and
+get_statistics processes that list a second time before making separate
+passes for mean, median and standard deviation. This solution consumes any
+iterable in fixed-size chunks, transforms each chunk with the vectorized
+batch rules and folds it into running statistics as it goes, so unbounded
+inputs are processed in constant memory with a single pass for both the
+transform and the statistics.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import logging
+import math
+import random
+import statistics
+import time
+from array import array
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Optional, Iterable, Iterator, Union
+
+from refactored_exercises import DataProcessor, DataProcessorConfig
+from batch_processing import BatchDataProcessor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; chunks are then array('d')
+    np = None
+
+
+logger = logging.getLogger(__name__)
+
+Number = Union[int, float]
+
+
+@dataclass
+class RunningStatistics:
+    """
+    Count, sum, mean, variance and min/max accumulated chunk by chunk.
+
+    Each chunk is summarized on its own and combined with Chan et al.'s
+    parallel variance formula, so two accumulators can also be merged.
+    The median needs every value, so it is only tracked (in an array('d'),
+    8 bytes per value) when track_median is set.
+    """
+    count: int = 0
+    total: float = 0.0
+    mean: float = 0.0
+    m2: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+    track_median: bool = False
+    values: Optional[array] = None
+
+    def update(self, chunk) -> None:
+        """Fold in a chunk of values (array('d') or ndarray)."""
+        n = len(chunk)
+        if n == 0:
+            return
+        if np is not None and isinstance(chunk, np.ndarray):
+            chunk_total = float(chunk.sum())
+            chunk_mean = chunk_total / n
+            deviations = chunk - chunk_mean
+            chunk_m2 = float(np.dot(deviations, deviations))
+            chunk_min, chunk_max = float(chunk.min()), float(chunk.max())
+        else:
+            chunk_total = math.fsum(chunk)
+            chunk_mean = chunk_total / n
+            chunk_m2 = math.fsum((x - chunk_mean) ** 2 for x in chunk)
+            chunk_min, chunk_max = min(chunk), max(chunk)
+
+        if self.track_median:
+            if self.values is None:
+                self.values = array('d')
+            if isinstance(chunk, array):
+                self.values.extend(chunk)
+            else:
+                self.values.frombytes(chunk.tobytes())
+        self._combine(n, chunk_total, chunk_mean, chunk_m2, chunk_min, chunk_max)
+
+    def _combine(self, n: int, total: float, mean: float, m2: float,
+                 minimum: float, maximum: float) -> None:
+        count = self.count + n
+        delta = mean - self.mean
+        self.m2 += m2 + delta * delta * self.count * n / count
+        self.mean += delta * n / count
+        self.count = count
+        self.total += total
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+
+    def merge(self, other: 'RunningStatistics') -> 'RunningStatistics':
+        """Fold another accumulator into this one (in place) and return self."""
+        if other.count:
+            if self.track_median and other.values is not None:
+                if self.values is None:
+                    self.values = array('d')
+                self.values.extend(other.values)
+            self._combine(other.count, other.total, other.mean, other.m2,
+                          other.minimum, other.maximum)
+        return self
+
+    @property
+    def std_dev(self) -> float:
+        """Sample standard deviation (matches statistics.stdev)."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        """Statistics in the same shape as DataProcessor.get_statistics."""
+        if self.count == 0:
+            return {}
+        result = {
+            'count': self.count,
+            'sum': self.total,
+            'mean': self.mean,
+            'min': self.minimum,
+            'max': self.maximum,
+            'std_dev': self.std_dev
+        }
+        if self.track_median and self.values is not None:
+            result['median'] = statistics.median(self.values)
+        return result
+
+
+class StreamingDataProcessor(BatchDataProcessor):
+    """
+    DataProcessor that works on iterables of any length.
+
+    Input is read chunk_size values at a time; each chunk goes through the
+    vectorized rules of BatchDataProcessor and is yielded as soon as it is
+    processed. Only one chunk is held in memory at once.
+    """
+
+    def __init__(self, config: Optional[DataProcessorConfig] = None, chunk_size: int = 65_536):
+        super().__init__(config)
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        self.chunk_size = chunk_size
+
+    def iter_input_chunks(self, data: Iterable[Number]) -> Iterator:
+        """Split input into raw chunks (array slices are views, not copies)."""
+        if (np is not None and isinstance(data, np.ndarray)) or isinstance(data, array):
+            for start in range(0, len(data), self.chunk_size):
+                yield data[start:start + self.chunk_size]
+            return
+        iterator = iter(data)
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def process_stream(self, data: Iterable[Number],
+                       stats: Optional[RunningStatistics] = None) -> Iterator:
+        """
+        Process numbers chunk by chunk.
+
+        Args:
+            data: Any iterable of numbers (generator, file reader, array...)
+            stats: Optional accumulator updated with every processed chunk
+
+        Yields:
+            Processed chunks (ndarray with NumPy, otherwise array('d')),
+            in input order; a chunk may be empty if every value was excluded
+
+        Raises:
+            TypeError: If a chunk contains non-numeric values
+        """
+        consumed = produced = 0
+        for chunk in self.iter_input_chunks(data):
+            raw = self._as_array(chunk)
+            processed = self._process_scalar(chunk) if raw is None else self._apply_rules(raw)
+            consumed += len(chunk)
+            produced += len(processed)
+            if stats is not None:
+                stats.update(processed)
+            yield processed
+        logger.info(f"Streamed {consumed} numbers, returned {produced} results")
+
+    def get_statistics_stream(self, data: Iterable[Number],
+                              track_median: bool = False) -> Dict[str, float]:
+        """
+        Statistics of the processed data in a single pass.
+
+        Args:
+            data: Any iterable of numbers
+            track_median: Also compute the exact median (stores the values)
+
+        Returns:
+            Dictionary like get_statistics ('median' only when tracked)
+        """
+        stats = RunningStatistics(track_median=track_median)
+        for _ in self.process_stream(data, stats):
+            pass
+        return stats.as_dict()
+
+
+def demonstrate_streaming_processor():
+    """Demonstrate chunked processing with running statistics."""
+    print("1. Chunked Streaming Processing")
+    print("-" * 35)
+
+    config = DataProcessorConfig(even_multiplier=2.5, odd_multiplier=3.5, include_negative=True)
+    test_data = [1, 2, 3, 4, 5, -2, 0, 8, 9]
+    processor = StreamingDataProcessor(config, chunk_size=4)
+
+    stats = RunningStatistics(track_median=True)
+    for i, chunk in enumerate(processor.process_stream(iter(test_data), stats)):
+        print(f"Chunk {i}: {list(map(float, chunk))}")
+
+    expected = DataProcessor(config).get_statistics(test_data)
+    streamed = stats.as_dict()
+    print(f"get_statistics:        mean={expected['mean']:.4f}, median={expected['median']}, "
+          f"std_dev={expected['std_dev']:.4f}")
+    print(f"Running statistics:    mean={streamed['mean']:.4f}, median={streamed['median']}, "
+          f"std_dev={streamed['std_dev']:.4f}")
+    matches = all(math.isclose(expected[key], streamed[key]) for key in streamed)
+    print(f"All statistics match: {matches}")
+
+    print()
+
+
+def demonstrate_unbounded_input():
+    """Process a generator far larger than one chunk in fixed memory."""
+    print("2. Generator Input in Fixed Memory")
+    print("-" * 40)
+
+    logging.getLogger('refactored_exercises').setLevel(logging.WARNING)
+    logger.setLevel(logging.WARNING)
+
+    size = 2_000_000
+    processor = StreamingDataProcessor(DataProcessorConfig(include_negative=True))
+
+    def readings():
+        rng = random.Random(42)
+        for _ in range(size):
+            yield rng.randint(-1000, 1000)
+
+    start = time.perf_counter()
+    stats = processor.get_statistics_stream(readings())
+    stream_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = processor.get_statistics(list(readings()))
+    list_time = time.perf_counter() - start
+
+    print(f"{size:,} generated values, chunks of {processor.chunk_size:,}:")
+    print(f"  get_statistics (list):   {list_time:.4f}s")
+    print(f"  get_statistics_stream:   {stream_time:.4f}s")
+    print(f"  Mean {stats['mean']:.4f} vs {expected['mean']:.4f}, "
+          f"std_dev {stats['std_dev']:.4f} vs {expected['std_dev']:.4f}")
+    print(f"  Backend: {'NumPy' if np is not None else 'array module'}")
+
+    print()
+
+
+def main():
+    """Main function demonstrating streaming data processing."""
+    print("=== Day 7: Streaming Data Processing ===")
+    print()
+
+    demonstrate_streaming_processor()
+    demonstrate_unbounded_input()
+
+    print("📚 Key Learning Points:")
+    print("• Generators let processing start before all input exists")
+    print("• Fixed-size chunks keep memory constant and loops vectorized")
+    print("• Running statistics update per chunk instead of re-reading data")
+    print("• Mean and variance merge exactly; the median needs every value")
+
+
+if __name__ == "__main__":
+    main()
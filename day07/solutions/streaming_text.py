@@ -0,0 +1,391 @@
+"""
+Day 7 Solution: Streaming Text Processing
+=========================================
+
+Every StringUtils method takes a single str, so analyzing a multi-gigabyte
+file means reading all of it into memory with FileOperations.read_file. This
+solution reads files in fixed-size chunks - through a regular buffered reader
+or a memory-mapped view - and folds each chunk into a running analysis. The
+unfinished token at the end of a chunk is carried into the next one, so words
+and numbers that straddle a chunk boundary are counted exactly once, and the
+final result matches StringUtils.analyze_text on the whole file.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import codecs
+import io
+import logging
+import mmap
+import os
+import random
+import re
+import tempfile
+import time
+from typing import List, Dict, Union, Iterable, Iterator
+
+from refactored_exercises import StringUtils, FileOperations, NUMBER_PATTERN
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # 1 MiB
+DEFAULT_MAX_TOKEN_LENGTH = 1 << 20  # characters carried before a token is split
+
+# The last whitespace character of a string
+_LAST_WHITESPACE = re.compile(r'\s(?=\S*\Z)')
+
+
+def iter_file_chunks(filepath: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     encoding: str = 'utf-8', use_mmap: bool = False) -> Iterator[str]:
+    """
+    Read a text file as a sequence of decoded chunks.
+
+    Newlines are translated as in FileOperations.read_file. With use_mmap,
+    bytes are sliced from a memory map and decoded incrementally, so a
+    multi-byte character split across two slices is still decoded once.
+
+    Args:
+        filepath: Path to the file
+        chunk_size: Characters (reader) or bytes (mmap) per chunk
+        encoding: File encoding (default: utf-8)
+        use_mmap: Slice a memory-mapped view instead of a buffered reader
+
+    Yields:
+        Text chunks in file order
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        UnicodeDecodeError: If encoding issues
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    try:
+        if not use_mmap:
+            with open(filepath, 'r', encoding=encoding) as file:
+                while True:
+                    chunk = file.read(chunk_size)
+                    if not chunk:
+                        return
+                    yield chunk
+
+        with open(filepath, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return  # an empty file cannot be mapped
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder(encoding)(), translate=True)
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                size = len(mapped)
+                for start in range(0, size, chunk_size):
+                    end = min(start + chunk_size, size)
+                    chunk = decoder.decode(mapped[start:end], final=end == size)
+                    if chunk:
+                        yield chunk
+    except FileNotFoundError:
+        logger.error(f"File not found: {filepath}")
+        raise
+    except UnicodeDecodeError as e:
+        logger.error(f"Encoding error reading file {filepath}: {e}")
+        raise
+
+
+class _TokenCarry:
+    """
+    The unfinished token at the end of the text seen so far.
+
+    Pieces of the token are kept in a list and joined only once whitespace
+    ends it, so a long token costs linear time however many chunks it spans.
+    A token reaching max_length characters is released as it stands, which
+    keeps memory bounded but splits that token in two.
+    """
+
+    def __init__(self, max_length: int = DEFAULT_MAX_TOKEN_LENGTH):
+        if max_length < 1:
+            raise ValueError("Maximum token length must be at least 1")
+        self.max_length = max_length
+        self._parts: List[str] = []
+        self._length = 0
+
+    def push(self, chunk: str) -> str:
+        """Add the next chunk and return the text whose tokens are now complete."""
+        match = _LAST_WHITESPACE.search(chunk)
+        if match is None:
+            complete, tail = '', chunk
+        else:
+            self._parts.append(chunk[:match.end()])
+            complete = self.pop()
+            tail = chunk[match.end():]
+        if tail:
+            self._parts.append(tail)
+            self._length += len(tail)
+            if self._length >= self.max_length:
+                complete += self.pop()
+        return complete
+
+    def pop(self) -> str:
+        """Return the carried text and start empty."""
+        text = ''.join(self._parts)
+        self._parts, self._length = [], 0
+        return text
+
+
+def _is_cased_char(char: str) -> bool:
+    return char.isupper() or char.islower() or char.istitle()
+
+
+class StreamingTextAnalyzer:
+    """
+    Incremental equivalent of StringUtils.analyze_text.
+
+    Feed chunks in order with feed(), then call result(). Memory use is
+    bounded by the chunk size and max_token_length plus the set of distinct
+    words (and the numbers themselves when collect_numbers is set). Tokens
+    longer than max_token_length are counted as several tokens.
+    """
+
+    def __init__(self, collect_numbers: bool = False,
+                 max_token_length: int = DEFAULT_MAX_TOKEN_LENGTH):
+        self.collect_numbers = collect_numbers
+        self.character_count = 0
+        self.space_count = 0
+        self.word_count = 0
+        self.word_characters = 0
+        self.sentence_count = 0
+        self.number_count = 0
+        self.number_sum = 0.0
+        self.numbers: List[float] = []
+        self.unique_words = set()
+
+        self._carry = _TokenCarry(max_token_length)
+        self._segment_has_text = False  # current '.'-separated segment is non-blank
+        self._has_upper = False   # seen an uppercase or titlecase character
+        self._has_lower = False   # seen a lowercase or titlecase character
+        self._title_ok = True
+        self._previous_cased = False
+
+    def feed(self, chunk: str) -> None:
+        """Fold the next chunk of text into the analysis."""
+        if not isinstance(chunk, str):
+            raise TypeError("Input must be a string")
+        if not chunk:
+            return
+        self.character_count += len(chunk)
+        self.space_count += chunk.count(' ')
+        self._update_sentences(chunk)
+        self._update_case(chunk)
+
+        self._add_tokens(self._carry.push(chunk))
+
+    def _add_tokens(self, text: str) -> None:
+        words = text.split()
+        self.word_count += len(words)
+        self.word_characters += sum(map(len, words))
+        self.unique_words.update(word.lower() for word in words)
+
+        # Numbers never contain whitespace, so scanning whole tokens finds
+        # exactly the matches a scan of the full text would
+        matches = NUMBER_PATTERN.findall(text)
+        self.number_count += len(matches)
+        values = list(map(float, matches))
+        self.number_sum += sum(values)
+        if self.collect_numbers:
+            self.numbers.extend(values)
+
+    def _update_sentences(self, chunk: str) -> None:
+        segments = chunk.split('.')
+        for i, segment in enumerate(segments):
+            if i:
+                # A '.' closes the current segment
+                if self._segment_has_text:
+                    self.sentence_count += 1
+                self._segment_has_text = False
+            if segment and not segment.isspace():
+                self._segment_has_text = True
+
+    def _update_case(self, chunk: str) -> None:
+        # (chunk + 'a').islower() is false only if chunk has an upper/titlecase
+        # character; (chunk + 'A').isupper() likewise for lower/titlecase
+        has_upper = not (chunk + 'a').islower()
+        has_lower = not (chunk + 'A').isupper()
+        self._has_upper = self._has_upper or has_upper
+        self._has_lower = self._has_lower or has_lower
+
+        if self._title_ok:
+            # istitle() depends on whether the preceding character was cased;
+            # a leading 'A' reproduces that state at the chunk boundary
+            if self._previous_cased:
+                self._title_ok = ('A' + chunk).istitle()
+            else:
+                self._title_ok = chunk.istitle() or not (has_upper or has_lower)
+        self._previous_cased = _is_cased_char(chunk[-1])
+
+    def result(self) -> Dict[str, Union[int, float, bool, List[str], List[float]]]:
+        """
+        Analysis of everything fed so far, shaped like analyze_text.
+
+        'numbers_found' is only present when collect_numbers is set;
+        'number_count' and 'number_sum' are always present.
+        """
+        self._add_tokens(self._carry.pop())
+        sentences = self.sentence_count + (1 if self._segment_has_text else 0)
+        cased = self._has_upper or self._has_lower
+        result = {
+            'character_count': self.character_count,
+            'character_count_no_spaces': self.character_count - self.space_count,
+            'word_count': self.word_count,
+            'sentence_count': sentences,
+            'average_word_length': self.word_characters / self.word_count if self.word_count else 0,
+            'unique_words': list(self.unique_words),
+            'number_count': self.number_count,
+            'number_sum': self.number_sum,
+            'is_uppercase': cased and not self._has_lower,
+            'is_lowercase': cased and not self._has_upper,
+            'is_title_case': cased and self._title_ok
+        }
+        if self.collect_numbers:
+            result['numbers_found'] = list(self.numbers)
+        return result
+
+
+class StreamingStringUtils:
+    """StringUtils operations over chunked readers and memory-mapped files."""
+
+    @staticmethod
+    def iter_words(chunks: Iterable[str],
+                   max_token_length: int = DEFAULT_MAX_TOKEN_LENGTH) -> Iterator[str]:
+        """Yield whitespace-separated words, joining words split across chunks."""
+        carry = _TokenCarry(max_token_length)
+        for chunk in chunks:
+            yield from carry.push(chunk).split()
+        yield from carry.pop().split()
+
+    @staticmethod
+    def iter_numbers(chunks: Iterable[str],
+                     max_token_length: int = DEFAULT_MAX_TOKEN_LENGTH) -> Iterator[float]:
+        """Yield numbers as StringUtils.extract_numbers would, in constant memory."""
+        carry = _TokenCarry(max_token_length)
+        for chunk in chunks:
+            for match in NUMBER_PATTERN.findall(carry.push(chunk)):
+                yield float(match)
+        for match in NUMBER_PATTERN.findall(carry.pop()):
+            yield float(match)
+
+    @staticmethod
+    def analyze_chunks(chunks: Iterable[str], collect_numbers: bool = False
+                       ) -> Dict[str, Union[int, float, bool, List[str], List[float]]]:
+        """Run StreamingTextAnalyzer over an iterable of text chunks."""
+        analyzer = StreamingTextAnalyzer(collect_numbers=collect_numbers)
+        for chunk in chunks:
+            analyzer.feed(chunk)
+        return analyzer.result()
+
+    @staticmethod
+    def analyze_file(filepath: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     encoding: str = 'utf-8', use_mmap: bool = True,
+                     collect_numbers: bool = False
+                     ) -> Dict[str, Union[int, float, bool, List[str], List[float]]]:
+        """
+        Analyze a file of any size without loading it into memory.
+
+        Args:
+            filepath: Path to the file
+            chunk_size: Chunk size in characters (reader) or bytes (mmap)
+            encoding: File encoding (default: utf-8)
+            use_mmap: Read through a memory map instead of a buffered reader
+            collect_numbers: Also return every number found (grows with the file)
+
+        Returns:
+            Dictionary shaped like StringUtils.analyze_text
+        """
+        result = StreamingStringUtils.analyze_chunks(
+            iter_file_chunks(filepath, chunk_size, encoding, use_mmap), collect_numbers)
+        logger.info(f"Analyzed file: {filepath} ({result['character_count']} characters)")
+        return result
+
+    @staticmethod
+    def count_words_file(filepath: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         encoding: str = 'utf-8', use_mmap: bool = True) -> int:
+        """Count whitespace-separated words in a file."""
+        chunks = iter_file_chunks(filepath, chunk_size, encoding, use_mmap)
+        return sum(1 for _ in StreamingStringUtils.iter_words(chunks))
+
+
+def demonstrate_boundaries():
+    """Show words and numbers that straddle chunk boundaries."""
+    print("1. Chunk Boundaries")
+    print("-" * 20)
+
+    text = "Totals: 1234.56 units shipped. Returned -78 items. Net 1156.56."
+    chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+    print(f"Chunks: {chunks}")
+    print(f"Numbers (whole string): {StringUtils.extract_numbers(text)}")
+    print(f"Numbers (streamed):     {list(StreamingStringUtils.iter_numbers(chunks))}")
+
+    expected = StringUtils.analyze_text(text)
+    streamed = StreamingStringUtils.analyze_chunks(chunks, collect_numbers=True)
+    same = all(expected[key] == streamed[key] for key in expected if key != 'unique_words')
+    same = same and sorted(expected['unique_words']) == sorted(streamed['unique_words'])
+    print(f"Streamed analysis matches analyze_text: {same}")
+
+    print()
+
+
+def demonstrate_file_streaming():
+    """Analyze a generated file with the reader, mmap and read_file."""
+    print("2. Streaming a File")
+    print("-" * 20)
+
+    logging.getLogger('refactored_exercises').setLevel(logging.WARNING)
+    logger.setLevel(logging.WARNING)
+
+    rng = random.Random(42)
+    words = ["alpha", "Beta", "gamma", "café", "naïve", "DELTA", "epsilon"]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sample.txt")
+        with open(path, 'w', encoding='utf-8') as file:
+            for _ in range(200_000):
+                file.write(f"{rng.choice(words)} {rng.randint(-500, 500)} "
+                           f"{rng.uniform(0, 100):.2f}{rng.choice(['. ', ' ', chr(10)])}")
+        print(f"File size: {FileOperations.get_file_size(path) / 1e6:.1f} MB")
+
+        start = time.perf_counter()
+        expected = StringUtils.analyze_text(FileOperations.read_file(path))
+        read_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reader = StreamingStringUtils.analyze_file(path, chunk_size=64 * 1024, use_mmap=False)
+        reader_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        mapped = StreamingStringUtils.analyze_file(path, chunk_size=64 * 1024 + 1)
+        mmap_time = time.perf_counter() - start
+
+        keys = ['character_count', 'word_count', 'sentence_count', 'average_word_length']
+        print(f"  read_file + analyze_text: {read_time:.4f}s")
+        print(f"  Chunked reader:           {reader_time:.4f}s "
+              f"(match: {all(reader[k] == expected[k] for k in keys)})")
+        print(f"  Memory-mapped:            {mmap_time:.4f}s "
+              f"(match: {all(mapped[k] == expected[k] for k in keys)})")
+        print(f"  Numbers: {mapped['number_count']:,} (analyze_text: {len(expected['numbers_found']):,})")
+
+    print()
+
+
+def main():
+    """Main function demonstrating streaming text processing."""
+    print("=== Day 7: Streaming Text Processing ===")
+    print()
+
+    demonstrate_boundaries()
+    demonstrate_file_streaming()
+
+    print("📚 Key Learning Points:")
+    print("• Read large files in chunks instead of all at once")
+    print("• Carry the unfinished token into the next chunk")
+    print("• Incremental decoders handle characters split across byte chunks")
+    print("• Running state replaces whole-string checks like istitle()")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+"""
+Day 7 Solution: Bulk Text Analytics
+===================================
+
+StringUtils works on one string at a time, and analyze_text makes several
+passes over it: cleaning whitespace, splitting words, splitting sentences and
+scanning for numbers, each through a separate method call. This solution
+analyzes lists or streams of documents in bulk: every document is tokenized
+once and the same token list drives the word count, word lengths, vocabulary
+and normalized text, with the number and whitespace patterns compiled once
+at import. Large inputs are processed in chunks, optionally spread across a
+process pool, and per-chunk summaries merge into one corpus summary.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import logging
+import random
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import List, Dict, Union, Iterable, Iterator, Callable, Any
+
+from refactored_exercises import StringUtils, NUMBER_PATTERN
+
+
+logger = logging.getLogger(__name__)
+
+TextAnalysis = Dict[str, Union[int, float, bool, str, List[str], List[float]]]
+
+
+@dataclass
+class TextSummary:
+    """Corpus-level totals that merge across chunks and processes."""
+    documents: int = 0
+    characters: int = 0
+    words: int = 0
+    word_characters: int = 0
+    sentences: int = 0
+    numbers: int = 0
+    number_total: float = 0.0
+    vocabulary: Counter = field(default_factory=Counter)
+
+    def merge(self, other: 'TextSummary') -> 'TextSummary':
+        """Add another summary into this one (in place) and return self."""
+        self.documents += other.documents
+        self.characters += other.characters
+        self.words += other.words
+        self.word_characters += other.word_characters
+        self.sentences += other.sentences
+        self.numbers += other.numbers
+        self.number_total += other.number_total
+        self.vocabulary.update(other.vocabulary)
+        return self
+
+    @property
+    def average_word_length(self) -> float:
+        """Mean word length over the whole corpus."""
+        return self.word_characters / self.words if self.words else 0
+
+    def most_common(self, n: int = 10) -> List[tuple]:
+        """The n most frequent (lowercased) words."""
+        return self.vocabulary.most_common(n)
+
+
+def _check_text(text: str) -> None:
+    if not isinstance(text, str):
+        raise TypeError("Input must be a string")
+
+
+def _count_sentences(text: str) -> int:
+    # A segment counts when it has any non-whitespace character (s.strip())
+    return sum(1 for segment in text.split('.') if segment and not segment.isspace())
+
+
+class BulkStringUtils:
+    """
+    StringUtils operations over many documents.
+
+    Every method accepts any iterable of strings; the *_many methods return
+    lists in input order, while analyze_many and summarize consume their
+    input chunk by chunk and can use a process pool (workers > 1).
+    """
+
+    @staticmethod
+    def analyze_document(text: str) -> TextAnalysis:
+        """
+        Same result as StringUtils.analyze_text, from a single tokenization.
+
+        Args:
+            text: String to analyze
+
+        Returns:
+            Dictionary containing various text metrics
+        """
+        _check_text(text)
+        words = text.split()
+        return {
+            'character_count': len(text),
+            'character_count_no_spaces': len(text) - text.count(' '),
+            'word_count': len(words),
+            'sentence_count': _count_sentences(text),
+            'average_word_length': sum(map(len, words)) / len(words) if words else 0,
+            'unique_words': list({word.lower() for word in words}),
+            'numbers_found': [float(match) for match in NUMBER_PATTERN.findall(text)],
+            'is_uppercase': text.isupper(),
+            'is_lowercase': text.islower(),
+            'is_title_case': text.istitle()
+        }
+
+    @staticmethod
+    def clean_whitespace_many(texts: Iterable[str]) -> List[str]:
+        """Normalize whitespace in every document (one split + join each)."""
+        result = []
+        for text in texts:
+            _check_text(text)
+            result.append(' '.join(text.split()))
+        return result
+
+    @staticmethod
+    def extract_numbers_many(texts: Iterable[str]) -> List[List[float]]:
+        """Numbers found in every document."""
+        findall = NUMBER_PATTERN.findall
+        result = []
+        for text in texts:
+            _check_text(text)
+            result.append([float(match) for match in findall(text)])
+        return result
+
+    @staticmethod
+    def count_words_many(texts: Iterable[str]) -> List[int]:
+        """Whitespace-separated word count of every document."""
+        result = []
+        for text in texts:
+            _check_text(text)
+            result.append(len(text.split()))
+        return result
+
+    @staticmethod
+    def analyze_many(texts: Iterable[str], workers: int = 1,
+                     chunk_size: int = 2_000) -> Iterator[TextAnalysis]:
+        """
+        Analyze a stream of documents, yielding results in input order.
+
+        Args:
+            texts: Any iterable of strings (list, file object, generator)
+            workers: Number of worker processes (1 = in-process)
+            chunk_size: Documents sent to a worker at a time
+
+        Yields:
+            One analyze_text-style dictionary per document
+        """
+        if workers <= 1:
+            # In-process there is nothing to amortize; skip building chunks
+            if isinstance(texts, str):
+                raise TypeError("Expected an iterable of strings, got a single string")
+            analyze = BulkStringUtils.analyze_document
+            for text in texts:
+                yield analyze(text)
+            return
+        for results in _map_chunks(_analyze_chunk, texts, workers, chunk_size):
+            yield from results
+
+    @staticmethod
+    def summarize(texts: Iterable[str], workers: int = 1,
+                  chunk_size: int = 2_000) -> TextSummary:
+        """
+        Corpus totals for a stream of documents in a single pass.
+
+        Args:
+            texts: Any iterable of strings (list, file object, generator)
+            workers: Number of worker processes (1 = in-process)
+            chunk_size: Documents sent to a worker at a time
+
+        Returns:
+            Merged TextSummary
+        """
+        summary = TextSummary()
+        for partial in _map_chunks(_summarize_chunk, texts, workers, chunk_size):
+            summary.merge(partial)
+        logger.info(f"Summarized {summary.documents} documents, {summary.words} words")
+        return summary
+
+
+def _analyze_chunk(texts: List[str]) -> List[TextAnalysis]:
+    analyze = BulkStringUtils.analyze_document
+    return [analyze(text) for text in texts]
+
+
+def _summarize_chunk(texts: List[str]) -> TextSummary:
+    summary = TextSummary()
+    findall = NUMBER_PATTERN.findall
+    vocabulary = summary.vocabulary
+    for text in texts:
+        _check_text(text)
+        words = text.split()
+        numbers = findall(text)
+        summary.documents += 1
+        summary.characters += len(text)
+        summary.words += len(words)
+        summary.word_characters += sum(map(len, words))
+        summary.sentences += _count_sentences(text)
+        summary.numbers += len(numbers)
+        summary.number_total += sum(map(float, numbers))
+        vocabulary.update(word.lower() for word in words)
+    return summary
+
+
+def _chunked(texts: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    iterator = iter(texts)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _map_chunks(func: Callable[[List[str]], Any], texts: Iterable[str],
+                workers: int, chunk_size: int) -> Iterator[Any]:
+    """
+    Apply func to consecutive chunks, in order, optionally in worker processes.
+
+    At most two chunks per worker are in flight, so an unbounded stream is
+    never read far ahead of the results being consumed.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    if isinstance(texts, str):
+        raise TypeError("Expected an iterable of strings, got a single string")
+    chunks = _chunked(texts, chunk_size)
+    if workers <= 1:
+        for chunk in chunks:
+            yield func(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def generate_log_lines(count: int, seed: int = 42) -> List[str]:
+    """Generate sample log lines."""
+    rng = random.Random(seed)
+    levels = ["INFO", "WARNING", "ERROR", "DEBUG"]
+    actions = ["request served", "cache miss", "retrying upload", "user login", "disk usage"]
+    return [
+        f"2024-01-{rng.randint(1, 28):02d} {rng.choice(levels)}  {rng.choice(actions)} "
+        f"in {rng.uniform(0.1, 900):.1f} ms.  status={rng.choice([200, 404, 500])} "
+        f"bytes={rng.randint(0, 10_000)}"
+        for _ in range(count)
+    ]
+
+
+def demonstrate_bulk_analysis():
+    """Demonstrate bulk analysis and check it against StringUtils."""
+    print("1. Bulk Text Analysis")
+    print("-" * 25)
+
+    documents = [
+        "Hello World! This has 123 numbers and   extra    spaces.",
+        "Version 2.5 shipped. Tests: 40 passed, -3 flaky.",
+        "   ",
+        "ALL CAPS TEXT 7."
+    ]
+    for document, analysis in zip(documents, BulkStringUtils.analyze_many(documents)):
+        expected = StringUtils.analyze_text(document)
+        same = (sorted(analysis.pop('unique_words')) == sorted(expected.pop('unique_words'))
+                and analysis == expected)
+        print(f"{document!r:60} words={analysis['word_count']:2} "
+              f"numbers={analysis['numbers_found']} matches StringUtils: {same}")
+
+    print(f"Cleaned: {BulkStringUtils.clean_whitespace_many(documents[:2])}")
+
+    print()
+
+
+def demonstrate_bulk_performance():
+    """Compare per-document StringUtils calls with the bulk API."""
+    print("2. Log Line Throughput")
+    print("-" * 25)
+
+    logging.getLogger('refactored_exercises').setLevel(logging.WARNING)
+    logger.setLevel(logging.WARNING)
+
+    lines = generate_log_lines(100_000)
+
+    start = time.perf_counter()
+    for line in lines:
+        StringUtils.analyze_text(line)
+    baseline_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in BulkStringUtils.analyze_many(lines):
+        pass
+    bulk_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    summary = BulkStringUtils.summarize(lines)
+    summary_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel_summary = BulkStringUtils.summarize(iter(lines), workers=2, chunk_size=10_000)
+    parallel_time = time.perf_counter() - start
+
+    same_counts = all(
+        a['word_count'] == b['word_count'] and a['numbers_found'] == b['numbers_found']
+        for a, b in zip(map(StringUtils.analyze_text, lines[:1_000]),
+                        BulkStringUtils.analyze_many(lines[:1_000])))
+    print(f"{len(lines):,} log lines:")
+    print(f"  StringUtils.analyze_text per line: {baseline_time:.4f}s")
+    print(f"  BulkStringUtils.analyze_many:      {bulk_time:.4f}s (match: {same_counts})")
+    print(f"  BulkStringUtils.summarize:         {summary_time:.4f}s")
+    print(f"  summarize with 2 workers:          {parallel_time:.4f}s "
+          f"(same totals: {parallel_summary.words == summary.words})")
+    print(f"  {summary.words:,} words, {summary.numbers:,} numbers, "
+          f"top words: {summary.most_common(3)}")
+
+    print()
+
+
+def main():
+    """Main function demonstrating bulk text analytics."""
+    print("=== Day 7: Bulk Text Analytics ===")
+    print()
+
+    demonstrate_bulk_analysis()
+    demonstrate_bulk_performance()
+
+    print("📚 Key Learning Points:")
+    print("• Compile regular expressions once, at module level")
+    print("• Tokenize once and derive every metric from the same tokens")
+    print("• Chunking amortizes per-call and inter-process overhead")
+    print("• Mergeable summaries let workers run independently")
+
+
+if __name__ == "__main__":
+    main()
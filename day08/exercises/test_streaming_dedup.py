@@ -0,0 +1,60 @@
+"""
+Day 8 Tests: Streaming De-duplication
+=====================================
+
+Lists, Tuples & Collections - test_streaming_dedup.py
+
+Checks that the Bloom filter mode of solutions/streaming_dedup.py treats
+items as equal exactly when a set does, so it only ever drops new items by
+Bloom filter chance.
+
+Run with:
+    python -m pytest day08/exercises/test_streaming_dedup.py
+"""
+
+import os
+import sys
+from fractions import Fraction
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'solutions'))
+
+from streaming_dedup import BloomFilter, unique_bloom, unique_everseen  # noqa: E402
+
+
+class Token:
+    """Object compared by identity, with the default repr."""
+
+
+def test_equal_numbers_are_one_key():
+    items = [1, 1.0, True, Fraction(1), 1 + 0j, 1.5, Fraction(3, 2), 0, False, -0.0]
+    assert list(unique_bloom(items, 100)) == list(unique_everseen(items))
+
+
+def test_str_and_bytes_stay_distinct():
+    items = ['a', b'a', '1', 1, ('1', 'a'), ('1a',)]
+    assert list(unique_bloom(items, 100)) == items
+
+
+def test_colliding_hash_tuples():
+    # hash(-1) == hash(-2) in CPython, so these tuples share hash() values
+    points = [(i, j) for i in range(-500, 500) for j in (-1, -2)]
+    assert len({hash(point) for point in points}) < len(points)
+    assert len(list(unique_bloom(points, len(points), error_rate=1e-6))) == len(points)
+
+
+def test_nested_tuples_and_frozensets():
+    items = [((1, 2), 3), (1, (2, 3)), frozenset({1, 2}), frozenset({2.0, 1}), None, (None,)]
+    assert list(unique_bloom(items, 100)) == list(unique_everseen(items))
+
+
+def test_identity_objects():
+    token = Token()
+    items = [token, token, Token()]
+    assert list(unique_bloom(items, 100)) == list(unique_everseen(items))
+
+
+def test_no_false_negatives():
+    bloom = BloomFilter(1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(('id', i))
+    assert all(('id', i) in bloom for i in range(1000))
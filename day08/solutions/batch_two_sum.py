@@ -0,0 +1,302 @@
+"""
+Day 8 Solution: Batch Two-Sum and K-Sum
+=======================================
+
+ListAlgorithms.find_two_sum rebuilds its lookup dictionary on every call.
+This solution indexes the array once and then answers many targets against
+the same data, with hash, sort-plus-two-pointer and NumPy searchsorted
+variants, a general k-sum search and an "all pairs within tolerance" mode.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import random
+import time
+from bisect import bisect_left, bisect_right
+from typing import List, Tuple, Dict, Optional, Union, Iterable
+
+from list_operations import ListAlgorithms
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python methods always work
+    np = None
+
+
+Number = Union[int, float]
+
+
+class TwoSumIndex:
+    """
+    Reusable index for answering many two-sum style queries.
+
+    The array is indexed once: a value -> positions dictionary for hash
+    lookups and a sorted copy (with original positions) for two-pointer,
+    searchsorted, k-sum and tolerance queries. All results are pairs of
+    original indices (i, j) with i < j.
+    """
+
+    METHODS = ('hash', 'two_pointer', 'numpy')
+
+    def __init__(self, values: Iterable[Number]):
+        self.values: List[Number] = list(values)
+
+        self._positions: Dict[Number, List[int]] = {}
+        for i, value in enumerate(self.values):
+            self._positions.setdefault(value, []).append(i)
+
+        self._order: List[int] = sorted(range(len(self.values)), key=self.values.__getitem__)
+        self._sorted: List[Number] = [self.values[i] for i in self._order]
+
+        self._np_sorted = None
+        self._np_order = None
+        if np is not None:
+            self._np_sorted = np.asarray(self._sorted)
+            self._np_order = np.asarray(self._order, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _pair(self, a: int, b: int) -> Tuple[int, int]:
+        """Return two original indices in ascending order."""
+        return (a, b) if a < b else (b, a)
+
+    def find(self, target: Number, method: str = 'hash') -> Optional[Tuple[int, int]]:
+        """
+        Find two distinct positions whose values add up to target.
+
+        Args:
+            target: The desired sum
+            method: 'hash', 'two_pointer' or 'numpy'
+
+        Returns:
+            A pair of indices (i, j) with i < j, or None if no pair exists
+
+        Raises:
+            ValueError: If the method is unknown
+            ImportError: If method is 'numpy' and NumPy is not installed
+        """
+        if method == 'hash':
+            return self._find_hash(target)
+        elif method == 'two_pointer':
+            return self._find_two_pointer(target)
+        elif method == 'numpy':
+            return self._find_numpy(target)
+        raise ValueError(f"Invalid method '{method}'. Available: {', '.join(self.METHODS)}")
+
+    def find_many(self, targets: Iterable[Number],
+                  method: str = 'hash') -> List[Optional[Tuple[int, int]]]:
+        """Answer many targets against the same index."""
+        if method not in self.METHODS:
+            raise ValueError(f"Invalid method '{method}'. Available: {', '.join(self.METHODS)}")
+        return [self.find(target, method) for target in targets]
+
+    def _find_hash(self, target: Number) -> Optional[Tuple[int, int]]:
+        """Look up each distinct value's complement in the prebuilt dictionary."""
+        positions = self._positions
+        for value, indices in positions.items():
+            complement = target - value
+            other = positions.get(complement)
+            if other is None:
+                continue
+            if complement != value:
+                return self._pair(indices[0], other[0])
+            if len(indices) > 1:
+                return (indices[0], indices[1])
+        return None
+
+    def _find_two_pointer(self, target: Number) -> Optional[Tuple[int, int]]:
+        """Classic two-pointer scan over the pre-sorted values."""
+        data = self._sorted
+        left, right = 0, len(data) - 1
+        while left < right:
+            current = data[left] + data[right]
+            if current == target:
+                return self._pair(self._order[left], self._order[right])
+            elif current < target:
+                left += 1
+            else:
+                right -= 1
+        return None
+
+    def _find_numpy(self, target: Number) -> Optional[Tuple[int, int]]:
+        """Vectorized complement search with np.searchsorted."""
+        if np is None:
+            raise ImportError("NumPy is required for method='numpy'")
+        data = self._np_sorted
+        n = len(data)
+        if n < 2:
+            return None
+        complements = target - data
+        # Search strictly to the right of each element so i != j
+        pos = np.searchsorted(data, complements, side='left')
+        pos = np.maximum(pos, np.arange(1, n + 1))
+        valid = pos < n
+        hits = np.flatnonzero(valid & (data[np.minimum(pos, n - 1)] == complements))
+        if hits.size == 0:
+            return None
+        i = int(hits[0])
+        return self._pair(int(self._np_order[i]), int(self._np_order[pos[i]]))
+
+    def find_k_sum(self, target: Number, k: int) -> Optional[Tuple[int, ...]]:
+        """
+        Find k distinct positions whose values add up to target.
+
+        Reduces to a two-pointer scan over the sorted values, so the cost
+        is O(n^(k-1)).
+
+        Returns:
+            A tuple of k ascending indices, or None if no combination exists
+
+        Raises:
+            ValueError: If k is less than 2
+        """
+        if k < 2:
+            raise ValueError("k must be at least 2")
+        found = self._k_sum(target, k, 0)
+        if found is None:
+            return None
+        return tuple(sorted(self._order[i] for i in found))
+
+    def _k_sum(self, target: Number, k: int, start: int) -> Optional[List[int]]:
+        data = self._sorted
+        n = len(data)
+        if n - start < k:
+            return None
+        if k == 2:
+            left, right = start, n - 1
+            while left < right:
+                current = data[left] + data[right]
+                if current == target:
+                    return [left, right]
+                elif current < target:
+                    left += 1
+                else:
+                    right -= 1
+            return None
+
+        for i in range(start, n - k + 1):
+            if i > start and data[i] == data[i - 1]:
+                continue  # Same value already tried at this depth
+            rest = self._k_sum(target - data[i], k - 1, i + 1)
+            if rest is not None:
+                return [i] + rest
+        return None
+
+    def pairs_within_tolerance(self, target: Number,
+                               tolerance: float) -> List[Tuple[int, int]]:
+        """
+        Find all pairs whose sum is within tolerance of target.
+
+        Useful for matching amounts that differ by rounding or small fees.
+
+        Returns:
+            Sorted list of index pairs (i, j) with i < j
+        """
+        if tolerance < 0:
+            raise ValueError("Tolerance cannot be negative")
+        data = self._sorted
+        order = self._order
+        pairs = []
+        for i, value in enumerate(data):
+            low = bisect_left(data, target - tolerance - value, lo=i + 1)
+            high = bisect_right(data, target + tolerance - value, lo=i + 1)
+            for j in range(low, high):
+                pairs.append(self._pair(order[i], order[j]))
+        pairs.sort()
+        return pairs
+
+
+def demonstrate_batch_two_sum():
+    """Demonstrate indexing once and answering many targets."""
+    print("1. Batch Two-Sum")
+    print("-" * 20)
+
+    numbers = [2, 7, 11, 15, -3, 4]
+    index = TwoSumIndex(numbers)
+    targets = [9, 26, 1, 100]
+
+    print(f"Numbers: {numbers}")
+    for method in TwoSumIndex.METHODS:
+        if method == 'numpy' and np is None:
+            print(f"  {method:11}: skipped (NumPy not installed)")
+            continue
+        print(f"  {method:11}: {index.find_many(targets, method)}")
+    print(f"  find_two_sum: {[ListAlgorithms.find_two_sum(numbers, t) for t in targets]}")
+
+    print()
+
+
+def demonstrate_k_sum_and_tolerance():
+    """Demonstrate k-sum search and tolerance matching."""
+    print("2. K-Sum and Tolerance Matching")
+    print("-" * 35)
+
+    amounts = [120.00, 35.50, 64.49, 99.99, 20.01, 15.00, 55.00]
+    index = TwoSumIndex(amounts)
+
+    print(f"Transaction amounts: {amounts}")
+    triple = index.find_k_sum(155.50, 3)
+    print(f"Three amounts summing to 155.50: {triple}"
+          f" -> {[amounts[i] for i in triple] if triple else None}")
+
+    pairs = index.pairs_within_tolerance(120.00, 0.02)
+    print(f"Pairs within $0.02 of $120.00:")
+    for i, j in pairs:
+        print(f"  {amounts[i]:.2f} + {amounts[j]:.2f} = {amounts[i] + amounts[j]:.2f}")
+
+    print()
+
+
+def demonstrate_batch_performance():
+    """Compare repeated find_two_sum calls against a shared index."""
+    print("3. Batch Performance")
+    print("-" * 25)
+
+    random.seed(42)
+    transactions = [random.randint(1, 1_000_000) for _ in range(20_000)]
+    targets = [random.randint(1, 2_000_000) for _ in range(200)]
+
+    start = time.perf_counter()
+    baseline = [ListAlgorithms.find_two_sum(transactions, t) for t in targets]
+    baseline_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = TwoSumIndex(transactions)
+    build_time = time.perf_counter() - start
+
+    print(f"{len(targets)} targets over {len(transactions):,} transactions")
+    print(f"  find_two_sum per call: {baseline_time:.4f}s")
+    print(f"  Index build (once):    {build_time:.4f}s")
+    for method in TwoSumIndex.METHODS:
+        if method == 'numpy' and np is None:
+            continue
+        start = time.perf_counter()
+        results = index.find_many(targets, method)
+        elapsed = time.perf_counter() - start
+        matched = sum(r is not None for r in results)
+        print(f"  {method:21}: {elapsed:.4f}s ({matched} matched,"
+              f" baseline {sum(r is not None for r in baseline)})")
+
+    print()
+
+
+def main():
+    """Main function demonstrating batch two-sum queries."""
+    print("=== Day 8: Batch Two-Sum and K-Sum ===")
+    print()
+
+    demonstrate_batch_two_sum()
+    demonstrate_k_sum_and_tolerance()
+    demonstrate_batch_performance()
+
+    print("📚 Key Learning Points:")
+    print("• Build an index once when many queries hit the same data")
+    print("• Sorting enables two-pointer and bisect-based searches")
+    print("• k-sum reduces to repeated two-sum on sorted data")
+    print("• Tolerance matching handles rounding in financial amounts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,464 @@
+"""
+Day 8 Solution: Benchmark Suite
+===============================
+
+Single time.time() measurements are noisy and not comparable between runs.
+This solution provides a small reusable benchmark harness with warmup runs,
+automatically sized repeated timing pooled from several fresh processes,
+median/IQR reporting, peak memory via tracemalloc, JSON output and
+comparison against a saved baseline. It ships suites for
+ListAlgorithms, ListAnalyzer, StockPriceAnalyzer and the Day 4 factorial
+variants.
+
+Usage:
+    python benchmark_suite.py                          # run every suite
+    python benchmark_suite.py --suite list_algorithms  # run one suite
+    python benchmark_suite.py --output baseline.json   # save results
+    python benchmark_suite.py --baseline baseline.json # fail on regressions
+    python benchmark_suite.py --processes 1            # sample in this process only
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import argparse
+import gc
+import json
+import math
+import multiprocessing
+import operator
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+import tracemalloc
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from functools import lru_cache, reduce
+from typing import List, Dict, Optional, Callable, Any
+
+from list_operations import ListAlgorithms, ListAnalyzer
+from stock_prices import StockPriceAnalyzer, generate_sample_stock_data
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing and memory statistics for one benchmark."""
+    name: str
+    repeat: int
+    number: int
+    median: float
+    iqr: float
+    minimum: float
+    maximum: float
+    mean: float
+    peak_memory: Optional[int] = None
+    times: List[float] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class Comparison:
+    """Comparison of a benchmark against its baseline."""
+    name: str
+    baseline_median: Optional[float]
+    current_median: float
+    ratio: Optional[float]
+    status: str  # 'regression', 'improvement', 'unchanged' or 'new'
+
+
+def run_benchmark(name: str, func: Callable[[], Any], warmup: int = 2, repeat: int = 7,
+                  number: Optional[int] = None, measure_memory: bool = True) -> BenchmarkResult:
+    """
+    Time a zero-argument callable.
+
+    Each of the repeat samples times number consecutive calls with
+    time.perf_counter and records the per-call average. By default number
+    is chosen with timeit.Timer.autorange, so every sample lasts at least
+    0.2 seconds and fast functions are not dominated by timer and
+    scheduling noise. Garbage collection is disabled while timing, as
+    timeit does. Peak memory is measured in a separate call so tracemalloc
+    overhead does not distort the timings.
+
+    Args:
+        name: Benchmark name used in reports and baselines
+        func: Callable to benchmark
+        warmup: Untimed calls made first to warm caches
+        repeat: Number of timed samples
+        number: Calls per sample (default: sized automatically)
+        measure_memory: Whether to record the tracemalloc peak
+
+    Returns:
+        BenchmarkResult with per-call times in seconds
+    """
+    if repeat < 1 or (number is not None and number < 1):
+        raise ValueError("repeat and number must be at least 1")
+
+    for _ in range(warmup):
+        func()
+    if number is None:
+        number, _ = timeit.Timer(func).autorange()
+
+    times = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                func()
+            times.append((time.perf_counter() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    peak_memory = None
+    if measure_memory:
+        already_tracing = tracemalloc.is_tracing()
+        if not already_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline_memory = tracemalloc.get_traced_memory()[0]
+        func()
+        peak_memory = tracemalloc.get_traced_memory()[1] - baseline_memory
+        if not already_tracing:
+            tracemalloc.stop()
+
+    return _summarize(name, times, number, peak_memory)
+
+
+def _summarize(name: str, times: List[float], number: int,
+               peak_memory: Optional[int] = None) -> BenchmarkResult:
+    """Build a BenchmarkResult from per-call sample times."""
+    if len(times) > 1:
+        q1, _, q3 = statistics.quantiles(times, n=4)
+        iqr = q3 - q1
+    else:
+        iqr = 0.0
+
+    return BenchmarkResult(
+        name=name,
+        repeat=len(times),
+        number=number,
+        median=statistics.median(times),
+        iqr=iqr,
+        minimum=min(times),
+        maximum=max(times),
+        mean=statistics.mean(times),
+        peak_memory=peak_memory,
+        times=times
+    )
+
+
+class BenchmarkSuite:
+    """A named collection of benchmarks sharing default run settings."""
+
+    def __init__(self, name: str, warmup: int = 2, repeat: int = 7):
+        self.name = name
+        self.warmup = warmup
+        self.repeat = repeat
+        self._benchmarks: List[Dict[str, Any]] = []
+
+    def add(self, name: str, func: Callable[[], Any], number: Optional[int] = None) -> None:
+        """Register a zero-argument callable (number: calls per sample, default automatic)."""
+        self._benchmarks.append({'name': f"{self.name}.{name}", 'func': func, 'number': number})
+
+    def run(self, repeat: Optional[int] = None, measure_memory: bool = True,
+            verbose: bool = True) -> List[BenchmarkResult]:
+        """Run every benchmark in the suite."""
+        results = []
+        for bench in self._benchmarks:
+            result = run_benchmark(bench['name'], bench['func'], warmup=self.warmup,
+                                   repeat=repeat or self.repeat, number=bench['number'],
+                                   measure_memory=measure_memory)
+            results.append(result)
+            if verbose:
+                print(format_result(result))
+        return results
+
+
+def _run_suites(suite_names: List[str], repeat: Optional[int],
+                measure_memory: bool) -> List[BenchmarkResult]:
+    """Build and run suites quietly (the body of each worker process)."""
+    results = []
+    for suite_name in suite_names:
+        suite = SUITES[suite_name]()
+        results.extend(suite.run(repeat=repeat, measure_memory=measure_memory, verbose=False))
+    return results
+
+
+def merge_results(runs: List[List[BenchmarkResult]]) -> List[BenchmarkResult]:
+    """
+    Pool the samples of the same benchmarks measured in separate runs.
+
+    Timings shift between processes (memory layout, hash seeds, CPU
+    frequency and neighbours), often by more than the spread within one
+    process; pooled samples carry that drift into the IQR, which
+    compare_results treats as noise.
+    """
+    merged = []
+    for results in zip(*runs):
+        times = [t for result in results for t in result.times]
+        peaks = [result.peak_memory for result in results if result.peak_memory is not None]
+        merged.append(_summarize(results[0].name, times, min(result.number for result in results),
+                                 max(peaks) if peaks else None))
+    return merged
+
+
+def run_in_processes(suite_names: List[str], processes: int = 3, repeat: Optional[int] = None,
+                     measure_memory: bool = True) -> List[BenchmarkResult]:
+    """
+    Run suites once in each of several fresh processes, one after another,
+    and merge their samples.
+    """
+    context = multiprocessing.get_context('spawn')
+    runs = []
+    with context.Pool(processes=1, maxtasksperchild=1) as pool:
+        for _ in range(processes):
+            runs.append(pool.apply(_run_suites, (suite_names, repeat, measure_memory)))
+    return merge_results(runs)
+
+
+def format_result(result: BenchmarkResult) -> str:
+    """Format one result as a report line."""
+    memory = f"{result.peak_memory / 1024:10.1f} KiB" if result.peak_memory is not None else ""
+    return (f"{result.name:<45} median {result.median * 1000:10.4f} ms"
+            f"  IQR {result.iqr * 1000:8.4f} ms{memory}")
+
+
+def save_results(results: List[BenchmarkResult], filepath: str) -> None:
+    """Write results plus machine metadata as JSON."""
+    payload = {
+        'created': datetime.now().isoformat(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'results': [result.to_dict() for result in results]
+    }
+    with open(filepath, 'w', encoding='utf-8') as file:
+        json.dump(payload, file, indent=2)
+
+
+def load_results(filepath: str) -> Dict[str, BenchmarkResult]:
+    """Load a JSON results file keyed by benchmark name."""
+    with open(filepath, 'r', encoding='utf-8') as file:
+        payload = json.load(file)
+    return {item['name']: BenchmarkResult(**item) for item in payload['results']}
+
+
+def compare_results(current: List[BenchmarkResult], baseline: Dict[str, BenchmarkResult],
+                    threshold: float = 0.10) -> List[Comparison]:
+    """
+    Compare current medians against a baseline.
+
+    A benchmark counts as a regression when its median is more than
+    threshold slower than the baseline, the difference is larger than the
+    combined IQR noise of both runs, and its fastest sample is also more
+    than threshold slower than the baseline's fastest. Noise only ever adds
+    time, so the minimum is the statistic least affected by it; improvements
+    are judged the same way.
+    """
+    comparisons = []
+    for result in current:
+        base = baseline.get(result.name)
+        if base is None:
+            comparisons.append(Comparison(result.name, None, result.median, None, 'new'))
+            continue
+
+        ratio = result.median / base.median if base.median > 0 else math.inf
+        minimum_ratio = result.minimum / base.minimum if base.minimum > 0 else math.inf
+        noise = result.iqr + base.iqr
+        difference = result.median - base.median
+        if ratio > 1 + threshold and minimum_ratio > 1 + threshold and difference > noise:
+            status = 'regression'
+        elif ratio < 1 - threshold and minimum_ratio < 1 - threshold and -difference > noise:
+            status = 'improvement'
+        else:
+            status = 'unchanged'
+        comparisons.append(Comparison(result.name, base.median, result.median, ratio, status))
+    return comparisons
+
+
+# Benchmark suites
+def build_list_algorithms_suite(size: int = 2_000) -> BenchmarkSuite:
+    """Benchmarks for ListAlgorithms."""
+    random.seed(42)
+    data = [random.randint(0, size * 10) for _ in range(size)]
+    sorted_data = sorted(data)
+    small = data[:300]
+
+    suite = BenchmarkSuite('list_algorithms')
+    suite.add('bubble_sort_300', lambda: ListAlgorithms.bubble_sort(small))
+    suite.add('quick_sort', lambda: ListAlgorithms.quick_sort(data))
+    suite.add('merge_sort', lambda: ListAlgorithms.merge_sort(data))
+    suite.add('binary_search', lambda: ListAlgorithms.binary_search(sorted_data, sorted_data[-1]))
+    suite.add('find_two_sum', lambda: ListAlgorithms.find_two_sum(data, -1))
+    suite.add('remove_duplicates', lambda: ListAlgorithms.remove_duplicates(data))
+    suite.add('rotate_list', lambda: ListAlgorithms.rotate_list(data, size // 3))
+    return suite
+
+
+def build_list_analyzer_suite(size: int = 5_000) -> BenchmarkSuite:
+    """Benchmarks for ListAnalyzer."""
+    random.seed(42)
+    numbers = [random.gauss(100, 15) for _ in range(size)]
+    words = [random.choice('abcdefgh') for _ in range(size)]
+
+    suite = BenchmarkSuite('list_analyzer')
+    suite.add('get_statistics', lambda: ListAnalyzer.get_statistics(numbers))
+    suite.add('find_outliers_iqr', lambda: ListAnalyzer.find_outliers(numbers, 'iqr'))
+    suite.add('find_outliers_zscore', lambda: ListAnalyzer.find_outliers(numbers, 'zscore'))
+    suite.add('group_by_frequency', lambda: ListAnalyzer.group_by_frequency(words))
+    suite.add('find_patterns', lambda: ListAnalyzer.find_patterns(words, 3))
+    return suite
+
+
+def build_stock_prices_suite(days: int = 500) -> BenchmarkSuite:
+    """Benchmarks for StockPriceAnalyzer."""
+    random.seed(42)
+    analyzer = StockPriceAnalyzer('BENCH')
+    analyzer.add_multiple_prices(generate_sample_stock_data('BENCH', days))
+
+    suite = BenchmarkSuite('stock_prices')
+    suite.add('moving_average_20', lambda: analyzer.calculate_moving_average(20))
+    suite.add('moving_average_50', lambda: analyzer.calculate_moving_average(50))
+    suite.add('volatility', lambda: analyzer.calculate_volatility())
+    suite.add('support_resistance', lambda: analyzer.find_support_resistance())
+    suite.add('comprehensive_analysis', lambda: analyzer.get_comprehensive_analysis())
+    return suite
+
+
+# Factorial variants from day04/solutions/factorial.py (which prompts for
+# input at import time, so the implementations are mirrored here)
+def factorial_iterative(n: int) -> int:
+    """Iterative for loop."""
+    result = 1
+    for i in range(1, n + 1):
+        result *= i
+    return result
+
+
+def factorial_recursive(n: int) -> int:
+    """Plain recursion."""
+    return 1 if n <= 1 else n * factorial_recursive(n - 1)
+
+
+@lru_cache(maxsize=None)
+def factorial_memoized(n: int) -> int:
+    """Recursion with lru_cache."""
+    return 1 if n <= 1 else n * factorial_memoized(n - 1)
+
+
+def factorial_memoized_cold(n: int) -> int:
+    """Memoized recursion starting from an empty cache each call."""
+    factorial_memoized.cache_clear()
+    return factorial_memoized(n)
+
+
+def factorial_while(n: int) -> int:
+    """While loop."""
+    result = 1
+    i = 1
+    while i <= n:
+        result *= i
+        i += 1
+    return result
+
+
+def factorial_reduce(n: int) -> int:
+    """functools.reduce with operator.mul."""
+    return reduce(operator.mul, range(1, n + 1), 1)
+
+
+def build_factorial_suite(n: int = 300) -> BenchmarkSuite:
+    """Benchmarks for the factorial variants."""
+    suite = BenchmarkSuite('factorial')
+    suite.add('iterative', lambda: factorial_iterative(n))
+    suite.add('recursive', lambda: factorial_recursive(n))
+    suite.add('memoized_cold', lambda: factorial_memoized_cold(n))
+    suite.add('memoized_warm', lambda: factorial_memoized(n))
+    suite.add('while_loop', lambda: factorial_while(n))
+    suite.add('math_factorial', lambda: math.factorial(n))
+    suite.add('reduce', lambda: factorial_reduce(n))
+    return suite
+
+
+SUITES: Dict[str, Callable[[], BenchmarkSuite]] = {
+    'list_algorithms': build_list_algorithms_suite,
+    'list_analyzer': build_list_analyzer_suite,
+    'stock_prices': build_stock_prices_suite,
+    'factorial': build_factorial_suite,
+}
+
+
+def print_comparisons(comparisons: List[Comparison]) -> None:
+    """Print a baseline comparison table."""
+    print(f"\n{'Benchmark':<45} {'Baseline':>12} {'Current':>12} {'Ratio':>7}  Status")
+    print("-" * 90)
+    for comp in comparisons:
+        base = f"{comp.baseline_median * 1000:.4f}ms" if comp.baseline_median is not None else "-"
+        ratio = f"{comp.ratio:.2f}x" if comp.ratio is not None else "-"
+        marker = {'regression': '❌', 'improvement': '✅'}.get(comp.status, '  ')
+        print(f"{comp.name:<45} {base:>12} {comp.current_median * 1000:>10.4f}ms "
+              f"{ratio:>7}  {marker} {comp.status}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark suites from the command line."""
+    parser = argparse.ArgumentParser(description="Day 8 benchmark suite")
+    parser.add_argument('--suite', action='append', choices=sorted(SUITES),
+                        help="Suite to run (repeatable; default: all)")
+    parser.add_argument('--repeat', type=int, default=None,
+                        help="Timed samples per benchmark in each process")
+    parser.add_argument('--processes', type=int, default=3,
+                        help="Fresh processes to sample in (default 3; 1 runs in this process)")
+    parser.add_argument('--no-memory', action='store_true', help="Skip tracemalloc peaks")
+    parser.add_argument('--output', help="Write results to this JSON file")
+    parser.add_argument('--baseline', help="Compare against this JSON file")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Relative slowdown counted as a regression (default 0.10)")
+    args = parser.parse_args(argv)
+
+    print("=== Day 8: Benchmark Suite ===")
+    print(f"Python {sys.version.split()[0]} on {platform.platform()}")
+    print()
+
+    suite_names = args.suite or list(SUITES)
+    results: List[BenchmarkResult] = []
+    if args.processes > 1:
+        results = run_in_processes(suite_names, args.processes, args.repeat, not args.no_memory)
+        for suite_name in suite_names:
+            print(f"[{suite_name}]")
+            for result in results:
+                if result.name.startswith(f"{suite_name}."):
+                    print(format_result(result))
+            print()
+    else:
+        for suite_name in suite_names:
+            print(f"[{suite_name}]")
+            suite = SUITES[suite_name]()
+            results.extend(suite.run(repeat=args.repeat, measure_memory=not args.no_memory))
+            print()
+
+    if args.output:
+        save_results(results, args.output)
+        print(f"Saved {len(results)} results to {args.output}")
+
+    if args.baseline:
+        comparisons = compare_results(results, load_results(args.baseline), args.threshold)
+        print_comparisons(comparisons)
+        regressions = [c for c in comparisons if c.status == 'regression']
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) detected")
+            return 1
+        print("\nNo regressions detected")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,338 @@
+"""
+Day 8 Solution: Columnar Employee Table
+=======================================
+
+demonstrate_advanced_named_tuples filters and averages lists of Employee
+NamedTuples with one generator step per row. This solution converts the rows
+into columns once - ids, names, dictionary-encoded departments, salaries and
+active flags - and then answers filters, group-by aggregates and sorts with
+whole-column operations that pass around index arrays instead of copying
+rows. NumPy is used when installed; otherwise the same API runs on
+array('d') columns with builtin helpers.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import random
+import time
+from array import array
+from itertools import compress
+from typing import List, Dict, Optional, Iterable, Sequence, Union
+
+from tuple_examples import Employee
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the table falls back to array columns
+    np = None
+
+
+Indices = Union['np.ndarray', List[int]]
+
+
+class EmployeeTable:
+    """
+    Column-oriented store of Employee records.
+
+    Departments are dictionary-encoded as small integer codes, so grouping
+    is a bincount over one integer column. Filter methods return index
+    arrays that can be chained, aggregated or sorted without materializing
+    Employee objects until rows() is called.
+    """
+
+    NUMERIC_COLUMNS = ('employee_id', 'salary')
+
+    def __init__(self, rows: Iterable[Employee] = ()):
+        self.departments: List[str] = []
+        self._department_codes: Dict[str, int] = {}
+
+        ids = array('q')
+        salaries = array('d')
+        codes = array('i')
+        active = array('b')
+        names: List[str] = []
+        for row in rows:
+            ids.append(row.employee_id)
+            names.append(row.name)
+            codes.append(self._encode_department(row.department))
+            salaries.append(row.salary)
+            active.append(1 if row.is_active else 0)
+
+        self.names = names
+        if np is not None:
+            self.employee_id = np.frombuffer(ids, dtype=np.int64).copy()
+            self.salary = np.frombuffer(salaries, dtype=np.float64).copy()
+            self.department_code = np.frombuffer(codes, dtype=np.int32).copy()
+            self.is_active = np.frombuffer(active, dtype=np.int8).astype(bool)
+        else:
+            self.employee_id = ids
+            self.salary = salaries
+            self.department_code = codes
+            self.is_active = active
+
+    def _encode_department(self, department: str) -> int:
+        code = self._department_codes.get(department)
+        if code is None:
+            code = len(self.departments)
+            self._department_codes[department] = code
+            self.departments.append(department)
+        return code
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def all_indices(self) -> Indices:
+        """Indices of every row."""
+        if np is not None:
+            return np.arange(len(self))
+        return list(range(len(self)))
+
+    def filter(self, department: Optional[str] = None, is_active: Optional[bool] = None,
+               min_salary: Optional[float] = None, max_salary: Optional[float] = None,
+               indices: Optional[Indices] = None) -> Indices:
+        """
+        Select rows matching every given condition.
+
+        Args:
+            department: Keep only this department
+            is_active: Keep only active (True) or inactive (False) employees
+            min_salary: Minimum monthly salary (inclusive)
+            max_salary: Maximum monthly salary (inclusive)
+            indices: Restrict to these rows (for chaining filters)
+
+        Returns:
+            Index array of the matching rows, in table order
+        """
+        code = None
+        if department is not None:
+            code = self._department_codes.get(department, -1)
+
+        if np is not None:
+            mask = np.ones(len(self), dtype=bool)
+            if code is not None:
+                mask &= self.department_code == code
+            if is_active is not None:
+                mask &= self.is_active == is_active
+            if min_salary is not None:
+                mask &= self.salary >= min_salary
+            if max_salary is not None:
+                mask &= self.salary <= max_salary
+            if indices is not None:
+                indices = np.asarray(indices, dtype=np.intp)
+                return indices[mask[indices]]
+            return np.flatnonzero(mask)
+
+        selected = list(range(len(self))) if indices is None else list(indices)
+        if code is not None:
+            selected = list(compress(selected, [self.department_code[i] == code for i in selected]))
+        if is_active is not None:
+            flag = 1 if is_active else 0
+            selected = list(compress(selected, [self.is_active[i] == flag for i in selected]))
+        if min_salary is not None:
+            selected = list(compress(selected, [self.salary[i] >= min_salary for i in selected]))
+        if max_salary is not None:
+            selected = list(compress(selected, [self.salary[i] <= max_salary for i in selected]))
+        return selected
+
+    def _column(self, column: str):
+        if column not in self.NUMERIC_COLUMNS:
+            raise ValueError(f"Invalid column '{column}'. Available: {', '.join(self.NUMERIC_COLUMNS)}")
+        return getattr(self, column)
+
+    def mean(self, column: str = 'salary', indices: Optional[Indices] = None) -> float:
+        """Average of a numeric column over the selected rows (0.0 if none)."""
+        values = self._column(column)
+        if np is not None:
+            selected = values if indices is None else values[indices]
+            return float(selected.mean()) if len(selected) else 0.0
+        selected = values if indices is None else [values[i] for i in indices]
+        return sum(selected) / len(selected) if len(selected) else 0.0
+
+    def group_by_department(self, column: str = 'salary', agg: str = 'mean',
+                            active_only: bool = False) -> Dict[str, float]:
+        """
+        Aggregate a numeric column per department.
+
+        Args:
+            column: Numeric column to aggregate
+            agg: 'mean', 'sum' or 'count'
+            active_only: Only include active employees
+
+        Returns:
+            Dictionary of department -> aggregate (departments with no rows omitted)
+        """
+        if agg not in ('mean', 'sum', 'count'):
+            raise ValueError(f"Invalid aggregate '{agg}'. Available: mean, sum, count")
+        values = self._column(column)
+        n_groups = len(self.departments)
+
+        if np is not None:
+            codes = self.department_code
+            if active_only:
+                codes = codes[self.is_active]
+                values = values[self.is_active]
+            counts = np.bincount(codes, minlength=n_groups)
+            sums = np.bincount(codes, weights=values, minlength=n_groups)
+            counts_list, sums_list = counts.tolist(), sums.tolist()
+        else:
+            counts_list = [0] * n_groups
+            sums_list = [0.0] * n_groups
+            rows = self.filter(is_active=True) if active_only else range(len(self))
+            codes = self.department_code
+            for i in rows:
+                counts_list[codes[i]] += 1
+                sums_list[codes[i]] += values[i]
+
+        result = {}
+        for code, department in enumerate(self.departments):
+            count = counts_list[code]
+            if count == 0:
+                continue
+            if agg == 'count':
+                result[department] = count
+            elif agg == 'sum':
+                result[department] = sums_list[code]
+            else:
+                result[department] = sums_list[code] / count
+        return result
+
+    def sort_indices(self, by: str = 'salary', descending: bool = False,
+                     indices: Optional[Indices] = None) -> Indices:
+        """
+        Order rows by a column without moving any data.
+
+        Args:
+            by: 'salary', 'employee_id' or 'name'
+            descending: Sort largest first
+            indices: Restrict to these rows
+
+        Returns:
+            Index array in sorted order (stable)
+        """
+        if by == 'name':
+            keys: Sequence = self.names
+        else:
+            keys = self._column(by)
+
+        if np is not None:
+            selected = self.all_indices() if indices is None else np.asarray(indices, dtype=np.intp)
+            if by == 'name':
+                # Strings have no NumPy column; sort in Python, return an array like the others
+                ordered = sorted(selected.tolist(), key=keys.__getitem__, reverse=descending)
+                return np.array(ordered, dtype=np.intp)
+            column = keys[selected]
+            order = np.argsort(-column if descending else column, kind='stable')
+            return selected[order]
+
+        selected = list(range(len(self))) if indices is None else list(indices)
+        return sorted(selected, key=keys.__getitem__, reverse=descending)
+
+    def row(self, index: int) -> Employee:
+        """Materialize one row as an Employee."""
+        return Employee(
+            employee_id=int(self.employee_id[index]),
+            name=self.names[index],
+            department=self.departments[self.department_code[index]],
+            salary=float(self.salary[index]),
+            is_active=bool(self.is_active[index])
+        )
+
+    def rows(self, indices: Optional[Indices] = None) -> List[Employee]:
+        """Materialize the selected rows as Employee tuples."""
+        selected = range(len(self)) if indices is None else indices
+        return [self.row(int(i)) for i in selected]
+
+
+def generate_employees(count: int, seed: int = 42) -> List[Employee]:
+    """Generate sample Employee records."""
+    random.seed(seed)
+    departments = ["Engineering", "Marketing", "Sales", "Finance", "Support"]
+    return [
+        Employee(1000 + i, f"Employee {i}", random.choice(departments),
+                 round(random.uniform(4000, 12000), 2), random.random() > 0.1)
+        for i in range(count)
+    ]
+
+
+def demonstrate_employee_table():
+    """Demonstrate filters, group-by and sorting on the columnar table."""
+    print("1. Columnar Employee Table")
+    print("-" * 30)
+
+    employees = [
+        Employee(1001, "Alice Johnson", "Engineering", 8500.0),
+        Employee(1002, "Bob Smith", "Marketing", 6200.0),
+        Employee(1003, "Carol Davis", "Engineering", 9200.0, False),
+        Employee(1004, "David Wilson", "Sales", 5800.0)
+    ]
+    table = EmployeeTable(employees)
+
+    active = table.filter(is_active=True)
+    engineering = table.filter(department="Engineering")
+    print(f"Active employees: {len(active)}")
+    print(f"Engineering employees: {len(engineering)}")
+    print(f"Average active employee salary: ${table.mean('salary', active):,.2f}")
+
+    print("\nAverage salary by department (active only):")
+    for department, average in table.group_by_department(active_only=True).items():
+        print(f"  {department:12}: ${average:,.2f}")
+
+    print("\nTop earners:")
+    for emp in table.rows(table.sort_indices('salary', descending=True)[:3]):
+        print(f"  {emp.get_info()}")
+
+    print()
+
+
+def demonstrate_table_performance():
+    """Compare row-wise generator expressions with column operations."""
+    print("2. Row-wise vs Columnar Performance")
+    print("-" * 40)
+
+    employees = generate_employees(200_000)
+
+    start = time.perf_counter()
+    by_department: Dict[str, List[float]] = {}
+    for emp in employees:
+        if emp.is_active:
+            by_department.setdefault(emp.department, []).append(emp.salary)
+    rowwise = {d: sum(s) / len(s) for d, s in by_department.items()}
+    rowwise_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    table = EmployeeTable(employees)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columnar = table.group_by_department(active_only=True)
+    columnar_time = time.perf_counter() - start
+
+    matches = all(abs(rowwise[d] - columnar[d]) < 1e-6 for d in rowwise)
+    print(f"{len(employees):,} employees, avg active salary by department:")
+    print(f"  Row-wise loop:   {rowwise_time:.4f}s")
+    print(f"  Table build:     {build_time:.4f}s (once)")
+    print(f"  Columnar query:  {columnar_time:.4f}s")
+    print(f"  Results match:   {matches}")
+    print(f"  Backend: {'NumPy' if np is not None else 'array module'}")
+
+    print()
+
+
+def main():
+    """Main function demonstrating the columnar employee table."""
+    print("=== Day 8: Columnar Employee Table ===")
+    print()
+
+    demonstrate_employee_table()
+    demonstrate_table_performance()
+
+    print("📚 Key Learning Points:")
+    print("• Row tuples are convenient; columns are fast for analytics")
+    print("• Dictionary-encoding turns string groups into integer codes")
+    print("• Index arrays let filters and sorts avoid copying records")
+    print("• Materialize NamedTuples only for the rows you display")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,9 @@ Date: 2024
 """
 
 import random
-import time
-from typing import List, Tuple, Optional, Union, Callable, Any
+import statistics
+import timeit
+from typing import List, Tuple, Dict, Optional, Union, Callable, Any
 from collections import Counter, deque
 import copy
 
@@ -125,12 +126,13 @@ def demonstrate_list_performance():
     """Analyze performance characteristics of different list operations."""
     print("3. List Performance Analysis")
     print("-" * 35)
+    print("(median of 5 runs; see benchmark_suite.py for full benchmarks)")
     
-    def time_operation(operation_func: Callable, *args) -> float:
-        """Time a function operation."""
-        start = time.time()
-        operation_func(*args)
-        return time.time() - start
+    def time_operation(operation_func: Callable, *args, repeat: int = 5) -> float:
+        """Time a function operation (median of several runs after a warmup)."""
+        operation_func(*args)  # Warmup run
+        timings = timeit.repeat(lambda: operation_func(*args), repeat=repeat, number=1)
+        return statistics.median(timings)
     
     # Test different list sizes
     sizes = [1000, 10000, 100000]
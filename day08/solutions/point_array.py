@@ -0,0 +1,346 @@
+"""
+Day 8 Solution: Array-Backed Point Storage
+==========================================
+
+CoordinateSystem stores points as a list of 2-tuples, which costs roughly
+100 bytes per point (list slot, tuple header and two float objects). This
+solution stores coordinates interleaved in a single array('d') at 16 bytes
+per point and computes centroid, bounding box, batch distances and blocked
+pairwise distance matrices over the whole array at once - with NumPy when it
+is installed and with C-level builtins over array slices otherwise.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import math
+import random
+import sys
+import time
+from array import array
+from typing import Tuple, List, Optional, Iterable, Iterator, Union
+
+from tuple_examples import CoordinateSystem
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; array('d') fallbacks are always available
+    np = None
+
+
+Point = Tuple[float, float]
+
+
+class PointArray:
+    """
+    Compact sequence of 2D points stored as [x0, y0, x1, y1, ...].
+
+    Behaves like a list of (x, y) tuples for indexing, iteration, append
+    and extend, so existing CoordinateSystem code keeps working, while the
+    bulk operations work on the raw buffer.
+    """
+
+    def __init__(self, points: Optional[Iterable[Point]] = None):
+        self._data = array('d')
+        if points is not None:
+            self.extend(points)
+
+    @classmethod
+    def from_buffer(cls, coordinates: Iterable[float]) -> 'PointArray':
+        """Create from a flat interleaved sequence of coordinates."""
+        store = cls()
+        store._data = array('d', coordinates)
+        if len(store._data) % 2:
+            raise ValueError("Interleaved coordinates must have even length")
+        return store
+
+    def append(self, point: Point) -> None:
+        """Add one (x, y) point."""
+        x, y = point
+        self._data.append(x)
+        self._data.append(y)
+
+    def extend(self, points: Iterable[Point]) -> None:
+        """Add many points."""
+        if isinstance(points, PointArray):
+            self._data.extend(points._data)
+            return
+        data = self._data
+        for x, y in points:
+            data.append(x)
+            data.append(y)
+
+    def remove(self, point: Point) -> None:
+        """
+        Remove the first occurrence of a point.
+
+        Raises:
+            ValueError: If the point is not present
+        """
+        x, y = point
+        data = self._data
+        for i in range(0, len(data), 2):
+            if data[i] == x and data[i + 1] == y:
+                del data[i:i + 2]
+                return
+        raise ValueError(f"{point!r} not in PointArray")
+
+    def clear(self) -> None:
+        """Remove all points."""
+        del self._data[:]
+
+    def __len__(self) -> int:
+        return len(self._data) // 2
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Point, List[Point]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("PointArray index out of range")
+        return (self._data[2 * index], self._data[2 * index + 1])
+
+    def __iter__(self) -> Iterator[Point]:
+        data = self._data
+        return zip(data[0::2], data[1::2])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PointArray):
+            return self._data == other._data
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"PointArray({list(self)!r})"
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the coordinate buffer."""
+        return len(self._data) * self._data.itemsize
+
+    def xs(self) -> array:
+        """All x coordinates (a new array)."""
+        return self._data[0::2]
+
+    def ys(self) -> array:
+        """All y coordinates (a new array)."""
+        return self._data[1::2]
+
+    def as_numpy(self):
+        """
+        Return a zero-copy (n, 2) NumPy view of the buffer.
+
+        The buffer cannot grow while a view exists, so release the view
+        before calling append or extend.
+        """
+        if np is None:
+            raise ImportError("NumPy is required for as_numpy()")
+        return np.frombuffer(self._data, dtype=np.float64).reshape(-1, 2)
+
+    def centroid(self) -> Optional[Point]:
+        """Mean of all points."""
+        n = len(self)
+        if n == 0:
+            return None
+        if np is not None:
+            cx, cy = self.as_numpy().mean(axis=0)
+            return (float(cx), float(cy))
+        return (math.fsum(self._data[0::2]) / n, math.fsum(self._data[1::2]) / n)
+
+    def bounding_box(self) -> Optional[Tuple[Point, Point]]:
+        """((min_x, min_y), (max_x, max_y)) of all points."""
+        if len(self) == 0:
+            return None
+        if np is not None:
+            view = self.as_numpy()
+            (min_x, min_y), (max_x, max_y) = view.min(axis=0), view.max(axis=0)
+            return ((float(min_x), float(min_y)), (float(max_x), float(max_y)))
+        xs = self._data[0::2]
+        ys = self._data[1::2]
+        return ((min(xs), min(ys)), (max(xs), max(ys)))
+
+    def distances_to(self, point: Point) -> array:
+        """Euclidean distance from point to every stored point."""
+        px, py = point
+        if np is not None:
+            view = self.as_numpy()
+            result = np.hypot(view[:, 0] - px, view[:, 1] - py)
+            return array('d', result.tobytes())
+        hypot = math.hypot
+        data = self._data
+        return array('d', map(lambda x, y: hypot(x - px, y - py), data[0::2], data[1::2]))
+
+    def distance_blocks(self, block_size: int = 1024,
+                        other: Optional['PointArray'] = None) -> Iterator[Tuple[int, object]]:
+        """
+        Yield the pairwise distance matrix one block of rows at a time.
+
+        Only block_size rows are held in memory at once, so even very
+        large point sets can be processed in bounded memory.
+
+        Args:
+            block_size: Number of rows per block
+            other: Column points (default: this array)
+
+        Yields:
+            (row_start, block) where block is an ndarray of shape
+            (rows, len(other)) with NumPy, else a list of array('d') rows
+        """
+        if block_size < 1:
+            raise ValueError("Block size must be at least 1")
+        other = self if other is None else other
+        n = len(self)
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            if np is not None:
+                rows = self.as_numpy()[start:stop]
+                cols = other.as_numpy()
+                dx = rows[:, 0:1] - cols[:, 0]
+                dy = rows[:, 1:2] - cols[:, 1]
+                block = np.hypot(dx, dy)
+                del rows, cols
+                yield start, block
+            else:
+                yield start, [other.distances_to(self[i]) for i in range(start, stop)]
+
+    def distance_matrix(self, other: Optional['PointArray'] = None):
+        """Full pairwise distance matrix (n * m * 8 bytes - use distance_blocks for large n)."""
+        other = self if other is None else other
+        if np is not None:
+            blocks = [block for _, block in self.distance_blocks(other=other)]
+            return np.vstack(blocks) if blocks else np.empty((0, len(other)))
+        return [row for _, block in self.distance_blocks(other=other) for row in block]
+
+
+def batch_distances(points1: Iterable[Point], points2: Iterable[Point]) -> array:
+    """Element-wise distances between two equally long sequences of points."""
+    first = points1 if isinstance(points1, PointArray) else PointArray(points1)
+    second = points2 if isinstance(points2, PointArray) else PointArray(points2)
+    if len(first) != len(second):
+        raise ValueError("Point sequences must have the same length")
+    if np is not None:
+        a, b = first.as_numpy(), second.as_numpy()
+        result = np.hypot(a[:, 0] - b[:, 0], a[:, 1] - b[:, 1])
+        return array('d', result.tobytes())
+    hypot = math.hypot
+    return array('d', (hypot(x2 - x1, y2 - y1)
+                       for (x1, y1), (x2, y2) in zip(first, second)))
+
+
+class ArrayCoordinateSystem(CoordinateSystem):
+    """
+    CoordinateSystem whose points live in a PointArray.
+
+    The inherited methods keep working because PointArray behaves like a
+    list of tuples. Full aggregate recomputes (after a removal, or when
+    points are assigned directly) run over the whole buffer at once.
+    """
+
+    @property
+    def points(self) -> PointArray:
+        return self._store
+
+    @points.setter
+    def points(self, points: Iterable[Point]) -> None:
+        self._store = points if isinstance(points, PointArray) else PointArray(points)
+        self.refresh_aggregates()
+
+    def refresh_aggregates(self) -> None:
+        """Recompute sums and bounds over the whole buffer at once."""
+        self._reset_aggregates()
+        n = len(self._store)
+        if n:
+            cx, cy = self._store.centroid()
+            self._sum_x, self._sum_y = cx * n, cy * n
+            self._aggregated = n
+            (self._min_x, self._min_y), (self._max_x, self._max_y) = self._store.bounding_box()
+
+    def get_distances(self, point: Tuple[float, float]) -> array:
+        """Distances from point to every stored point."""
+        return self.points.distances_to(point)
+
+
+def demonstrate_point_array():
+    """Demonstrate array-backed coordinate storage."""
+    print("1. Array-Backed Coordinate System")
+    print("-" * 40)
+
+    coord_sys = ArrayCoordinateSystem()
+    coord_sys.add_points([(0, 0), (3, 4), (1, 1), (5, 2), (2, 6), (8, 1), (4, 5)])
+    coord_sys.add_point(7, 7)
+
+    print(f"Points: {list(coord_sys.points)}")
+    print(f"Centroid: {coord_sys.get_centroid()}")
+    print(f"Bounding box: {coord_sys.get_bounding_box()}")
+    print(f"Distances from origin: {[round(d, 2) for d in coord_sys.get_distances((0, 0))]}")
+    p1, p2, d = coord_sys.find_closest_points()
+    print(f"Closest points (inherited method): {p1}, {p2} at {d:.2f}")
+
+    pairs = batch_distances([(0, 0), (1, 1)], [(3, 4), (4, 5)])
+    print(f"Batch distances: {list(pairs)}")
+    print(f"Backend: {'NumPy' if np is not None else 'array module'}")
+
+    print()
+
+
+def demonstrate_memory_and_speed():
+    """Compare list-of-tuples storage with PointArray."""
+    print("2. Memory and Speed")
+    print("-" * 25)
+
+    random.seed(42)
+    n = 200_000
+    points = [(random.uniform(0, 1000), random.uniform(0, 1000)) for _ in range(n)]
+
+    tuple_bytes = sys.getsizeof(points) + sum(
+        sys.getsizeof(p) + sys.getsizeof(p[0]) + sys.getsizeof(p[1]) for p in points)
+    store = PointArray(points)
+
+    print(f"{n:,} points:")
+    print(f"  List of tuples: {tuple_bytes / n:6.1f} bytes/point")
+    print(f"  PointArray:     {store.nbytes / n:6.1f} bytes/point")
+
+    baseline = CoordinateSystem()
+    baseline.add_points(points)
+    start = time.perf_counter()
+    baseline.get_centroid()
+    baseline.get_bounding_box()
+    tuple_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    store.centroid()
+    store.bounding_box()
+    array_time = time.perf_counter() - start
+
+    print(f"  Centroid + bounding box (tuples):     {tuple_time:.4f}s")
+    print(f"  Centroid + bounding box (PointArray): {array_time:.4f}s")
+
+    sample = PointArray(points[:2_000])
+    rows = 0
+    for _, block in sample.distance_blocks(block_size=256):
+        rows += len(block)
+    print(f"  2,000 x 2,000 distance matrix streamed in blocks of 256 rows: {rows:,} rows")
+
+    print()
+
+
+def main():
+    """Main function demonstrating array-backed points."""
+    print("=== Day 8: Array-Backed Point Storage ===")
+    print()
+
+    demonstrate_point_array()
+    demonstrate_memory_and_speed()
+
+    print("📚 Key Learning Points:")
+    print("• Every tuple and float is a separate Python object with overhead")
+    print("• array('d') stores raw 8-byte doubles contiguously")
+    print("• Whole-array operations avoid per-point Python loops")
+    print("• Blocked distance matrices keep memory bounded")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""
+Day 8 Solution: Ring Buffers and Zero-Copy Rotation
+===================================================
+
+ListAlgorithms.rotate_list builds two slices and concatenates them, copying
+the whole list on every call. This solution shows two alternatives: a
+ring-buffer sequence whose rotation is just an offset change, and an in-place
+reversal-based rotate for lists and arrays.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import time
+from array import array
+from collections.abc import MutableSequence as MutableSequenceABC
+from typing import List, Iterable, Iterator, MutableSequence, Optional, Any, Union
+
+from list_operations import ListAlgorithms
+
+
+def _reverse_range(seq: MutableSequence, lo: int, hi: int) -> None:
+    """Reverse seq[lo:hi] in place by swapping elements."""
+    hi -= 1
+    while lo < hi:
+        seq[lo], seq[hi] = seq[hi], seq[lo]
+        lo += 1
+        hi -= 1
+
+
+def rotate_in_place(seq: MutableSequence, k: int) -> MutableSequence:
+    """
+    Rotate a mutable sequence to the right by k positions without copying.
+
+    Uses the three-reversal trick: reverse the whole sequence, then reverse
+    the first k and the remaining n - k elements. Works on lists,
+    array.array, bytearray and any other mutable sequence.
+
+    Args:
+        seq: Sequence to rotate (modified in place)
+        k: Number of positions to rotate right (negative rotates left)
+
+    Returns:
+        The same sequence, for convenience
+    """
+    n = len(seq)
+    if n == 0:
+        return seq
+    k %= n
+    if k == 0:
+        return seq
+    _reverse_range(seq, 0, n)
+    _reverse_range(seq, 0, k)
+    _reverse_range(seq, k, n)
+    return seq
+
+
+class RingBuffer(MutableSequenceABC):
+    """
+    Fixed-capacity circular sequence with O(1) rotation.
+
+    Elements live in a fixed storage block and logical index i maps to
+    physical slot (start + i) % capacity. Rotating a full buffer only moves
+    the start offset; appending to a full buffer overwrites the oldest
+    element, which suits rolling schedules and price windows.
+    """
+
+    def __init__(self, iterable: Optional[Iterable[Any]] = None,
+                 capacity: Optional[int] = None):
+        items = list(iterable) if iterable is not None else []
+        if capacity is None:
+            capacity = len(items)
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if len(items) > capacity:
+            items = items[-capacity:]  # Keep the newest elements
+        self._storage: MutableSequence = items + [None] * (capacity - len(items))
+        self._capacity = capacity
+        self._start = 0
+        self._size = len(items)
+        self._owns_storage = True
+
+    @classmethod
+    def wrap(cls, sequence: MutableSequence) -> 'RingBuffer':
+        """
+        Create a full ring buffer that uses an existing sequence as storage.
+
+        No data is copied: rotations only change the view's offset, while
+        item assignment writes through to the wrapped sequence.
+        """
+        if len(sequence) == 0:
+            raise ValueError("Cannot wrap an empty sequence")
+        buffer = cls.__new__(cls)
+        buffer._storage = sequence
+        buffer._capacity = len(sequence)
+        buffer._start = 0
+        buffer._size = len(sequence)
+        buffer._owns_storage = False
+        return buffer
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of elements held."""
+        return self._capacity
+
+    def is_full(self) -> bool:
+        """Return True when the buffer holds capacity elements."""
+        return self._size == self._capacity
+
+    def _physical(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("RingBuffer index out of range")
+        return (self._start + index) % self._capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        return self._storage[self._physical(index)]
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        if isinstance(index, slice):
+            raise TypeError("RingBuffer does not support slice assignment")
+        self._storage[self._physical(index)] = value
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        """
+        Remove elements, closing the gap from whichever end is nearer.
+
+        Deleting at either end is O(1), so pop(), popleft() and remove() of
+        an element near the ends stay cheap; a middle element costs up to
+        len/2 moves.
+        """
+        if isinstance(index, slice):
+            for i in sorted(range(*index.indices(self._size)), reverse=True):
+                del self[i]
+            return
+        self._physical(index)  # Validate the index
+        if index < 0:
+            index += self._size
+        if index < self._size // 2:
+            # Shift the older elements one slot towards the newer end
+            for i in range(index, 0, -1):
+                self[i] = self[i - 1]
+            self._release(self._start)
+            self._start = (self._start + 1) % self._capacity
+        else:
+            for i in range(index, self._size - 1):
+                self[i] = self[i + 1]
+            self._release((self._start + self._size - 1) % self._capacity)
+        self._size -= 1
+
+    def _release(self, slot: int) -> None:
+        """Drop the reference held by a vacated slot (wrapped sequences are left as is)."""
+        if self._owns_storage:
+            self._storage[slot] = None
+
+    def insert(self, index: int, value: Any) -> None:
+        """Only appending at the end is supported."""
+        if index != self._size:
+            raise TypeError("RingBuffer only supports appending at the end")
+        self.append(value)
+
+    def __iter__(self) -> Iterator[Any]:
+        storage = self._storage
+        capacity = self._capacity
+        start = self._start
+        for i in range(self._size):
+            yield storage[(start + i) % capacity]
+
+    def append(self, value: Any) -> None:
+        """Add a value at the end, overwriting the oldest element when full."""
+        if self._size < self._capacity:
+            self._storage[(self._start + self._size) % self._capacity] = value
+            self._size += 1
+        else:
+            self._storage[self._start] = value
+            self._start = (self._start + 1) % self._capacity
+
+    def popleft(self) -> Any:
+        """
+        Remove and return the oldest element.
+
+        Raises:
+            IndexError: If the buffer is empty
+        """
+        if self._size == 0:
+            raise IndexError("pop from an empty RingBuffer")
+        value = self._storage[self._start]
+        self._release(self._start)
+        self._start = (self._start + 1) % self._capacity
+        self._size -= 1
+        return value
+
+    def clear(self) -> None:
+        """Remove all elements in one step instead of popping them one by one."""
+        if self._owns_storage:
+            self._storage[:] = [None] * self._capacity
+        self._start = 0
+        self._size = 0
+
+    def rotate(self, k: int) -> None:
+        """
+        Rotate to the right by k positions (negative rotates left).
+
+        O(1) when the buffer is full, the usual state for rolling windows;
+        a partially filled buffer is rotated in place with reversals.
+        """
+        if self._size == 0:
+            return
+        k %= self._size
+        if k == 0:
+            return
+        if self.is_full():
+            self._start = (self._start - k) % self._capacity
+        else:
+            rotate_in_place(self, k)
+
+    def to_list(self) -> List[Any]:
+        """Materialize the logical order as a new list."""
+        return list(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RingBuffer):
+            return self.to_list() == other.to_list()
+        if isinstance(other, list):
+            return self.to_list() == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RingBuffer({self.to_list()!r}, capacity={self._capacity})"
+
+
+def demonstrate_ring_buffer():
+    """Demonstrate O(1) rotation and rolling windows."""
+    print("1. Ring Buffer Rotation")
+    print("-" * 25)
+
+    original = [1, 2, 3, 4, 5, 6, 7]
+    view = RingBuffer.wrap(original)
+    view.rotate(3)
+    print(f"rotate_list:      {ListAlgorithms.rotate_list(original, 3)}")
+    print(f"RingBuffer view:  {view.to_list()}")
+    print(f"Underlying list unchanged: {original}")
+
+    # Rolling on-call schedule
+    schedule = RingBuffer(["Alice", "Bob", "Carol", "David"])
+    print(f"\nThis week's rota:  {schedule.to_list()}")
+    schedule.rotate(-1)
+    print(f"Next week's rota:  {schedule.to_list()}")
+
+    # Rolling price window
+    window = RingBuffer(capacity=5)
+    for price in [101.2, 102.5, 100.9, 103.1, 104.0, 105.2, 104.8]:
+        window.append(price)
+    average = sum(window) / len(window)
+    print(f"\nLast 5 prices: {window.to_list()} (avg {average:.2f})")
+
+    print()
+
+
+def demonstrate_in_place_rotation():
+    """Demonstrate reversal-based rotation on lists and arrays."""
+    print("2. In-Place Rotation")
+    print("-" * 25)
+
+    numbers = [1, 2, 3, 4, 5, 6, 7]
+    print(f"Before: {numbers}")
+    rotate_in_place(numbers, 3)
+    print(f"After rotate_in_place(3): {numbers}")
+
+    prices = array('d', [10.0, 11.0, 12.0, 13.0])
+    rotate_in_place(prices, -1)
+    print(f"array('d') rotated left by 1: {prices.tolist()}")
+
+    print()
+
+
+def demonstrate_rotation_performance():
+    """Compare slicing rotation with offset-based rotation."""
+    print("3. Rotation Performance")
+    print("-" * 25)
+
+    size = 1_000_000
+    rotations = 200
+    data = list(range(size))
+
+    start = time.perf_counter()
+    rotated = data
+    for _ in range(rotations):
+        rotated = ListAlgorithms.rotate_list(rotated, 1)
+    slicing_time = time.perf_counter() - start
+
+    buffer = RingBuffer.wrap(data)
+    start = time.perf_counter()
+    for _ in range(rotations):
+        buffer.rotate(1)
+    ring_time = time.perf_counter() - start
+
+    print(f"{rotations} rotations of {size:,} elements:")
+    print(f"  rotate_list (copies):  {slicing_time:.4f}s")
+    print(f"  RingBuffer.rotate:     {ring_time:.6f}s")
+    print(f"  Same result: {buffer[0] == rotated[0] and buffer[-1] == rotated[-1]}")
+
+    print()
+
+
+def main():
+    """Main function demonstrating ring buffers."""
+    print("=== Day 8: Ring Buffers and Zero-Copy Rotation ===")
+    print()
+
+    demonstrate_ring_buffer()
+    demonstrate_in_place_rotation()
+    demonstrate_rotation_performance()
+
+    print("📚 Key Learning Points:")
+    print("• Slicing always copies - rotation by slicing is O(n)")
+    print("• A ring buffer rotates by moving an offset in O(1)")
+    print("• Three reversals rotate any mutable sequence in place")
+    print("• Fixed-capacity buffers give rolling windows without growth")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,406 @@
+"""
+Day 8 Solution: Indexed Search Structures
+=========================================
+
+This solution extends ListAlgorithms.binary_search with reusable search
+structures for read-heavy workloads: a bucketed sorted list that keeps itself
+ordered under inserts and deletes, and an Eytzinger-layout array that lays the
+binary search tree out in breadth-first order for cache-friendly lookups.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import random
+import time
+from bisect import bisect_left, bisect_right, insort
+from typing import List, Iterable, Iterator, Optional, Any
+
+from list_operations import ListAlgorithms
+
+
+# Example 1: Sorted Container with bisect-based updates
+class SortedList:
+    """
+    A list that stays sorted under inserts and deletes.
+
+    Values are stored in a list of small sorted buckets, so an insert or
+    delete only shifts one bucket instead of the whole list. Searches use
+    bisect on the bucket maxima and then on a single bucket, giving
+    O(log n) lookups without re-sorting after each update.
+    """
+
+    DEFAULT_LOAD = 1000
+
+    def __init__(self, iterable: Optional[Iterable[Any]] = None, load: int = DEFAULT_LOAD):
+        if load < 2:
+            raise ValueError("Bucket load must be at least 2")
+        self._load = load
+        self._lists: List[List[Any]] = []
+        self._maxes: List[Any] = []
+        self._offsets: List[int] = []
+        self._len = 0
+        if iterable is not None:
+            self.update(iterable)
+
+    def update(self, iterable: Iterable[Any]) -> None:
+        """Add many values at once, rebuilding the buckets in one pass."""
+        values = sorted(list(self) + list(iterable))
+        load = self._load
+        self._lists = [values[i:i + load] for i in range(0, len(values), load)]
+        self._maxes = [bucket[-1] for bucket in self._lists]
+        self._len = len(values)
+        self._offsets = []
+
+    def add(self, value: Any) -> None:
+        """Insert a value, keeping the list sorted."""
+        if not self._lists:
+            self._lists.append([value])
+            self._maxes.append(value)
+        else:
+            pos = bisect_right(self._maxes, value)
+            if pos == len(self._maxes):
+                pos -= 1
+                self._lists[pos].append(value)
+                self._maxes[pos] = value
+            else:
+                insort(self._lists[pos], value)
+            self._split(pos)
+        self._len += 1
+        self._offsets = []
+
+    def remove(self, value: Any) -> None:
+        """
+        Remove one occurrence of a value.
+
+        Raises:
+            ValueError: If the value is not present
+        """
+        if not self.discard(value):
+            raise ValueError(f"{value!r} not in SortedList")
+
+    def discard(self, value: Any) -> bool:
+        """Remove one occurrence of a value if present; return True if removed."""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        bucket = self._lists[pos]
+        idx = bisect_left(bucket, value)
+        if bucket[idx] != value:
+            return False
+        del bucket[idx]
+        self._len -= 1
+        if bucket:
+            self._maxes[pos] = bucket[-1]
+        else:
+            del self._lists[pos]
+            del self._maxes[pos]
+        self._offsets = []
+        return True
+
+    def _split(self, pos: int) -> None:
+        """Split a bucket in two once it grows past twice the load."""
+        bucket = self._lists[pos]
+        if len(bucket) > 2 * self._load:
+            half = bucket[self._load:]
+            del bucket[self._load:]
+            self._maxes[pos] = bucket[-1]
+            self._lists.insert(pos + 1, half)
+            self._maxes.insert(pos + 1, half[-1])
+
+    def _bucket_offsets(self) -> List[int]:
+        """Cumulative start index of each bucket, rebuilt lazily after updates."""
+        if len(self._offsets) != len(self._lists):
+            offsets = []
+            total = 0
+            for bucket in self._lists:
+                offsets.append(total)
+                total += len(bucket)
+            self._offsets = offsets
+        return self._offsets
+
+    def lower_bound(self, value: Any) -> int:
+        """Return the index of the first element >= value."""
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._bucket_offsets()[pos] + bisect_left(self._lists[pos], value)
+
+    def upper_bound(self, value: Any) -> int:
+        """Return the index of the first element > value."""
+        pos = bisect_right(self._maxes, value)
+        if pos == len(self._maxes):
+            return self._len
+        return self._bucket_offsets()[pos] + bisect_right(self._lists[pos], value)
+
+    def index(self, value: Any) -> int:
+        """
+        Return the index of the first occurrence of value.
+
+        Raises:
+            ValueError: If the value is not present
+        """
+        idx = self.lower_bound(value)
+        if idx < self._len and self[idx] == value:
+            return idx
+        raise ValueError(f"{value!r} not in SortedList")
+
+    def count(self, value: Any) -> int:
+        """Count occurrences of a value."""
+        return self.upper_bound(value) - self.lower_bound(value)
+
+    def irange(self, minimum: Any = None, maximum: Any = None,
+               inclusive: tuple = (True, True)) -> Iterator[Any]:
+        """
+        Lazily iterate over values between minimum and maximum.
+
+        Args:
+            minimum: Lower bound (None means unbounded)
+            maximum: Upper bound (None means unbounded)
+            inclusive: Whether (minimum, maximum) are included
+        """
+        if minimum is None:
+            start = 0
+        else:
+            start = self.lower_bound(minimum) if inclusive[0] else self.upper_bound(minimum)
+        if maximum is None:
+            stop = self._len
+        else:
+            stop = self.upper_bound(maximum) if inclusive[1] else self.lower_bound(maximum)
+        if start >= stop:
+            return
+
+        offsets = self._bucket_offsets()
+        pos = bisect_right(offsets, start) - 1
+        idx = start - offsets[pos]
+        remaining = stop - start
+        while remaining > 0:
+            bucket = self._lists[pos]
+            chunk = bucket[idx:idx + remaining]
+            yield from chunk
+            remaining -= len(chunk)
+            pos += 1
+            idx = 0
+
+    def contains_many(self, values: Iterable[Any]) -> List[bool]:
+        """Batch membership test for many values."""
+        return [self._contains(value) for value in values]
+
+    def index_many(self, values: Iterable[Any]) -> List[int]:
+        """Batch lookup returning the index of each value, or -1 if absent."""
+        result = []
+        for value in values:
+            idx = self.lower_bound(value)
+            result.append(idx if idx < self._len and self[idx] == value else -1)
+        return result
+
+    def _contains(self, value: Any) -> bool:
+        pos = bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        bucket = self._lists[pos]
+        return bucket[bisect_left(bucket, value)] == value
+
+    def __contains__(self, value: Any) -> bool:
+        return self._contains(value)
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedList index out of range")
+        offsets = self._bucket_offsets()
+        pos = bisect_right(offsets, index) - 1
+        return self._lists[pos][index - offsets[pos]]
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Any]:
+        for bucket in self._lists:
+            yield from bucket
+
+    def __repr__(self) -> str:
+        preview = list(self.irange())[:10]
+        suffix = ", ..." if self._len > 10 else ""
+        return f"SortedList({preview!r}{suffix}, len={self._len})"
+
+
+# Example 2: Eytzinger (breadth-first) layout for cache-friendly search
+class EytzingerArray:
+    """
+    A read-only sorted array stored in Eytzinger (BFS heap) order.
+
+    Element k has children at 2k and 2k+1, so the first few levels of every
+    search touch the same small prefix of memory. Build once from any
+    iterable, then answer lower_bound queries in O(log n).
+    """
+
+    def __init__(self, iterable: Iterable[Any]):
+        values = sorted(iterable)
+        n = len(values)
+        self._n = n
+        # Slot 0 is unused so that children of k are 2k and 2k + 1
+        self._tree: List[Any] = [None] * (n + 1)
+        self._rank: List[int] = [0] * (n + 1)
+        self._slot: List[int] = [0] * n
+        self._build(values)
+
+    def _build(self, values: List[Any]) -> None:
+        """Fill the tree with an iterative in-order traversal."""
+        i = 0
+        k = 1
+        stack = []
+        n = self._n
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k = 2 * k
+            k = stack.pop()
+            self._tree[k] = values[i]
+            self._rank[k] = i
+            self._slot[i] = k
+            i += 1
+            k = 2 * k + 1
+
+    def lower_bound(self, value: Any) -> int:
+        """Return the sorted index of the first element >= value (n if none)."""
+        tree = self._tree
+        n = self._n
+        k = 1
+        while k <= n:
+            k = 2 * k + (tree[k] < value)
+        # Undo the trailing right turns plus one left turn
+        k >>= ((~k) & (k + 1)).bit_length()
+        return self._rank[k] if k else n
+
+    def search(self, value: Any) -> int:
+        """Return the sorted index of value, or -1 if not found."""
+        idx = self.lower_bound(value)
+        if idx < self._n and self[idx] == value:
+            return idx
+        return -1
+
+    def search_many(self, values: Iterable[Any]) -> List[int]:
+        """Batch version of search."""
+        return [self.search(value) for value in values]
+
+    def __getitem__(self, index: int) -> Any:
+        """Return the element at a sorted index."""
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("EytzingerArray index out of range")
+        return self._tree[self._slot[index]]
+
+    def __contains__(self, value: Any) -> bool:
+        return self.search(value) != -1
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __iter__(self) -> Iterator[Any]:
+        tree = self._tree
+        return (tree[k] for k in self._slot)
+
+
+def demonstrate_sorted_list():
+    """Demonstrate SortedList updates, bounds and range iteration."""
+    print("1. SortedList with bisect-based updates")
+    print("-" * 40)
+
+    prices = SortedList([105.5, 99.0, 101.25, 110.0, 99.0], load=4)
+    print(f"Initial: {list(prices)}")
+
+    prices.add(103.0)
+    prices.add(98.5)
+    prices.remove(110.0)
+    print(f"After add/remove: {list(prices)}")
+
+    print(f"lower_bound(99.0): {prices.lower_bound(99.0)}")
+    print(f"upper_bound(99.0): {prices.upper_bound(99.0)}")
+    print(f"count(99.0): {prices.count(99.0)}")
+    print(f"Prices in [100, 104]: {list(prices.irange(100, 104))}")
+    print(f"Batch contains [98.5, 100, 103]: {prices.contains_many([98.5, 100, 103])}")
+    print(f"Batch index [98.5, 100, 103]: {prices.index_many([98.5, 100, 103])}")
+
+    print()
+
+
+def demonstrate_eytzinger_array():
+    """Demonstrate Eytzinger layout search."""
+    print("2. Eytzinger Layout Array")
+    print("-" * 30)
+
+    sorted_data = [1, 3, 5, 7, 9, 11, 13, 15, 17, 19]
+    eytzinger = EytzingerArray(sorted_data)
+
+    print(f"Sorted data: {sorted_data}")
+    print(f"BFS layout:  {eytzinger._tree[1:]}")
+    for target in (7, 8, 19, 0):
+        print(f"  search({target}) -> {eytzinger.search(target)}"
+              f" (binary_search: {ListAlgorithms.binary_search(sorted_data, target)})")
+
+    print()
+
+
+def demonstrate_search_performance():
+    """Compare lookups against a linear scan and repeated re-sorting."""
+    print("3. Search Performance")
+    print("-" * 25)
+
+    random.seed(42)
+    size = 200_000
+    data = [random.randint(0, size * 10) for _ in range(size)]
+    queries = [random.randint(0, size * 10) for _ in range(2_000)]
+
+    start = time.perf_counter()
+    sorted_list = SortedList(data)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sorted_hits = sum(sorted_list.contains_many(queries))
+    sorted_time = time.perf_counter() - start
+
+    eytzinger = EytzingerArray(data)
+    start = time.perf_counter()
+    eytzinger_hits = sum(idx != -1 for idx in eytzinger.search_many(queries))
+    eytzinger_time = time.perf_counter() - start
+
+    sample = queries[:50]
+    start = time.perf_counter()
+    linear_hits = sum(q in data for q in sample)
+    linear_time = (time.perf_counter() - start) * len(queries) / len(sample)
+
+    print(f"Built SortedList of {size:,} values in {build_time:.4f}s")
+    print(f"  SortedList lookups:  {sorted_time:.4f}s ({sorted_hits} hits)")
+    print(f"  Eytzinger lookups:   {eytzinger_time:.4f}s ({eytzinger_hits} hits)")
+    print(f"  Linear 'in' (est.):  {linear_time:.4f}s ({linear_hits} hits in sample)")
+
+    start = time.perf_counter()
+    for value in queries[:1_000]:
+        sorted_list.add(value)
+    insert_time = time.perf_counter() - start
+    print(f"  1,000 inserts without re-sorting: {insert_time:.4f}s")
+
+    print()
+
+
+def main():
+    """Main function demonstrating indexed search structures."""
+    print("=== Day 8: Indexed Search Structures ===")
+    print()
+
+    demonstrate_sorted_list()
+    demonstrate_eytzinger_array()
+    demonstrate_search_performance()
+
+    print("📚 Key Learning Points:")
+    print("• bisect gives O(log n) search on any sorted list")
+    print("• Bucketing keeps inserts and deletes cheap without re-sorting")
+    print("• lower_bound/upper_bound answer range and count queries")
+    print("• Eytzinger layout keeps the hot top of the search tree together in memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,417 @@
+"""
+Day 8 Solution: Spatial Index for Coordinate Systems
+====================================================
+
+CoordinateSystem.find_closest_points compares every pair of points, which is
+O(n²). This solution adds the classic O(n log n) divide-and-conquer
+closest-pair algorithm and a uniform grid index supporting nearest-neighbour,
+k-nearest and radius queries. IndexedCoordinateSystem keeps the grid updated
+as points are added.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import heapq
+import math
+import random
+import time
+from typing import Tuple, List, Dict, Optional, Iterable, Iterator
+
+from tuple_examples import CoordinateSystem
+
+
+Point = Tuple[float, float]
+ClosestPair = Tuple[Point, Point, float]
+
+
+def _distance(p: Point, q: Point) -> float:
+    return math.hypot(q[0] - p[0], q[1] - p[1])
+
+
+def closest_pair(points: Iterable[Point]) -> Optional[ClosestPair]:
+    """
+    Find the two closest points with divide and conquer in O(n log n).
+
+    Returns:
+        (point1, point2, distance) like CoordinateSystem.find_closest_points,
+        or None if there are fewer than two points
+    """
+    by_x = sorted(points)
+    if len(by_x) < 2:
+        return None
+    best, _ = _closest_pair_rec(by_x, 0, len(by_x))
+    return best
+
+
+def _closest_pair_rec(by_x: List[Point], lo: int, hi: int) -> Tuple[ClosestPair, List[Point]]:
+    """Return the best pair in by_x[lo:hi] and those points sorted by y."""
+    n = hi - lo
+    if n <= 3:
+        best = None
+        for i in range(lo, hi):
+            for j in range(i + 1, hi):
+                d = _distance(by_x[i], by_x[j])
+                if best is None or d < best[2]:
+                    best = (by_x[i], by_x[j], d)
+        return best, sorted(by_x[lo:hi], key=lambda p: p[1])
+
+    mid = (lo + hi) // 2
+    mid_x = by_x[mid][0]
+    left_best, left_y = _closest_pair_rec(by_x, lo, mid)
+    right_best, right_y = _closest_pair_rec(by_x, mid, hi)
+    best = left_best if left_best[2] <= right_best[2] else right_best
+
+    # Merge the two y-sorted halves
+    by_y = list(heapq.merge(left_y, right_y, key=lambda p: p[1]))
+
+    # Only points within best distance of the dividing line can do better,
+    # and each needs comparing with at most a handful of successors
+    strip = [p for p in by_y if abs(p[0] - mid_x) < best[2]]
+    for i, p in enumerate(strip):
+        for j in range(i + 1, len(strip)):
+            q = strip[j]
+            if q[1] - p[1] >= best[2]:
+                break
+            d = _distance(p, q)
+            if d < best[2]:
+                best = (p, q, d)
+    return best, by_y
+
+
+class GridIndex:
+    """
+    Uniform grid spatial index with incremental inserts.
+
+    Points are bucketed into square cells of side cell_size. Queries only
+    visit cells near the query point, expanding ring by ring until no
+    unvisited cell can hold a closer point. Works best when cell_size is
+    close to the typical spacing between points.
+    """
+
+    def __init__(self, cell_size: float = 1.0):
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[Point]] = {}
+        self._count = 0
+        self._min_cell: Optional[List[int]] = None
+        self._max_cell: Optional[List[int]] = None
+
+    @classmethod
+    def from_points(cls, points: Iterable[Point], cell_size: Optional[float] = None) -> 'GridIndex':
+        """Build an index, choosing a cell size from the point density if not given."""
+        points = list(points)
+        if cell_size is None:
+            cell_size = suggest_cell_size(points)
+        index = cls(cell_size)
+        index.extend(points)
+        return index
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert(self, point: Point) -> None:
+        """Add a single point."""
+        cell = self._cell(point[0], point[1])
+        bucket = self._cells.get(cell)
+        if bucket is None:
+            self._cells[cell] = [point]
+        else:
+            bucket.append(point)
+        self._count += 1
+
+        if self._min_cell is None:
+            self._min_cell = list(cell)
+            self._max_cell = list(cell)
+        else:
+            self._min_cell[0] = min(self._min_cell[0], cell[0])
+            self._min_cell[1] = min(self._min_cell[1], cell[1])
+            self._max_cell[0] = max(self._max_cell[0], cell[0])
+            self._max_cell[1] = max(self._max_cell[1], cell[1])
+
+    def extend(self, points: Iterable[Point]) -> None:
+        """Add many points."""
+        for point in points:
+            self.insert(point)
+
+    def remove(self, point: Point) -> None:
+        """
+        Remove one occurrence of a point.
+
+        The occupied-cell extent is left as is; it only bounds how far
+        queries search, so a slightly larger extent is harmless.
+
+        Raises:
+            ValueError: If the point is not indexed
+        """
+        cell = self._cell(point[0], point[1])
+        bucket = self._cells.get(cell)
+        if not bucket or point not in bucket:
+            raise ValueError(f"{point!r} not in GridIndex")
+        bucket.remove(point)
+        if not bucket:
+            del self._cells[cell]
+        self._count -= 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _ring(self, cx: int, cy: int, r: int) -> Iterator[List[Point]]:
+        """Yield the non-empty cells at Chebyshev distance r from (cx, cy)."""
+        cells = self._cells
+        if r == 0:
+            bucket = cells.get((cx, cy))
+            if bucket:
+                yield bucket
+            return
+        for dx in range(-r, r + 1):
+            for dy in (-r, r):
+                bucket = cells.get((cx + dx, cy + dy))
+                if bucket:
+                    yield bucket
+        for dy in range(-r + 1, r):
+            for dx in (-r, r):
+                bucket = cells.get((cx + dx, cy + dy))
+                if bucket:
+                    yield bucket
+
+    def _ring_bounds(self, cx: int, cy: int) -> Tuple[int, int]:
+        """First and last ring radius around (cx, cy) that can hold occupied cells."""
+        if self._min_cell is None:
+            return 0, -1
+        (min_x, min_y), (max_x, max_y) = self._min_cell, self._max_cell
+        first = max(min_x - cx, cx - max_x, min_y - cy, cy - max_y, 0)
+        last = max(cx - min_x, max_x - cx, cy - min_y, max_y - cy)
+        return first, last
+
+    def k_nearest(self, query: Point, k: int = 1) -> List[Tuple[float, Point]]:
+        """
+        Find the k points closest to query.
+
+        Rings start at the edge of the occupied cells, so queries far outside
+        the data skip the empty space. Once a ring would hold more cells than
+        are occupied, the remaining occupied cells are scanned directly.
+
+        Returns:
+            List of (distance, point) sorted by distance
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        qx, qy = query
+        cx, cy = self._cell(qx, qy)
+        heap: List[Tuple[float, int, Point]] = []  # Max-heap via negated distance
+        counter = 0
+
+        def consider(bucket: List[Point]) -> None:
+            nonlocal counter
+            for point in bucket:
+                d = math.hypot(point[0] - qx, point[1] - qy)
+                if len(heap) < k:
+                    heapq.heappush(heap, (-d, counter, point))
+                elif d < -heap[0][0]:
+                    heapq.heapreplace(heap, (-d, counter, point))
+                counter += 1
+
+        r, max_ring = self._ring_bounds(cx, cy)
+        occupied = len(self._cells)
+        while r <= max_ring:
+            if 8 * r > occupied:
+                # Rings are now bigger than the occupied set: visit whatever
+                # is left in one pass over the occupied cells
+                for (x, y), bucket in self._cells.items():
+                    if max(abs(x - cx), abs(y - cy)) >= r:
+                        consider(bucket)
+                break
+            for bucket in self._ring(cx, cy, r):
+                consider(bucket)
+            # Every point outside rings 0..r is at least r * cell_size away
+            if len(heap) == k and -heap[0][0] <= r * self.cell_size:
+                break
+            r += 1
+
+        return sorted((-neg_d, point) for neg_d, _, point in heap)
+
+    def nearest(self, query: Point) -> Optional[Tuple[float, Point]]:
+        """Return (distance, point) for the closest point, or None if empty."""
+        result = self.k_nearest(query, 1)
+        return result[0] if result else None
+
+    def within_radius(self, query: Point, radius: float) -> List[Tuple[float, Point]]:
+        """
+        Find all points within radius of query.
+
+        Visits the cells of the radius square that overlap the occupied
+        cells, or every occupied cell if there are fewer of those.
+
+        Returns:
+            List of (distance, point) sorted by distance
+        """
+        if radius < 0:
+            raise ValueError("Radius cannot be negative")
+        found: List[Tuple[float, Point]] = []
+        if self._min_cell is None:
+            return found
+        qx, qy = query
+        min_cx, min_cy = self._cell(qx - radius, qy - radius)
+        max_cx, max_cy = self._cell(qx + radius, qy + radius)
+        min_cx, min_cy = max(min_cx, self._min_cell[0]), max(min_cy, self._min_cell[1])
+        max_cx, max_cy = min(max_cx, self._max_cell[0]), min(max_cy, self._max_cell[1])
+        if min_cx > max_cx or min_cy > max_cy:
+            return found
+
+        cells = self._cells
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(cells):
+            buckets = [bucket for (x, y), bucket in cells.items()
+                       if min_cx <= x <= max_cx and min_cy <= y <= max_cy]
+        else:
+            buckets = [cells.get((x, y), ()) for x in range(min_cx, max_cx + 1)
+                       for y in range(min_cy, max_cy + 1)]
+        for bucket in buckets:
+            for point in bucket:
+                d = math.hypot(point[0] - qx, point[1] - qy)
+                if d <= radius:
+                    found.append((d, point))
+        found.sort()
+        return found
+
+
+def suggest_cell_size(points: List[Point]) -> float:
+    """Pick a cell size giving roughly one point per cell."""
+    if len(points) < 2:
+        return 1.0
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    width = max(xs) - min(xs)
+    height = max(ys) - min(ys)
+    area = width * height
+    if area <= 0:
+        return max(width, height, 1.0) / len(points)
+    return math.sqrt(area / len(points))
+
+
+class IndexedCoordinateSystem(CoordinateSystem):
+    """
+    CoordinateSystem backed by a grid index.
+
+    add_point, add_points and remove_point keep the index in sync, closest
+    pair uses divide and conquer, and nearest/k-nearest/radius queries
+    avoid scanning every point.
+    """
+
+    def __init__(self, cell_size: float = 1.0):
+        super().__init__()
+        self.index = GridIndex(cell_size)
+
+    def add_point(self, x: float, y: float) -> None:
+        """Add a point and index it."""
+        super().add_point(x, y)
+        self.index.insert(self.points[-1])
+
+    def add_points(self, points: List[Tuple[float, float]]) -> None:
+        """Add multiple points and index them."""
+        start = len(self.points)
+        super().add_points(points)
+        self.index.extend(self.points[start:])
+
+    def remove_point(self, x: float, y: float) -> None:
+        """Remove a point and drop it from the index."""
+        super().remove_point(x, y)
+        self.index.remove((x, y))
+
+    def find_closest_points(self) -> Optional[Tuple[Tuple[float, float], Tuple[float, float], float]]:
+        """Find the two closest points in O(n log n)."""
+        return closest_pair(self.points)
+
+    def nearest(self, x: float, y: float) -> Optional[Tuple[float, Point]]:
+        """Closest stored point to (x, y)."""
+        return self.index.nearest((x, y))
+
+    def k_nearest(self, x: float, y: float, k: int) -> List[Tuple[float, Point]]:
+        """The k closest stored points to (x, y)."""
+        return self.index.k_nearest((x, y), k)
+
+    def within_radius(self, x: float, y: float, radius: float) -> List[Tuple[float, Point]]:
+        """All stored points within radius of (x, y)."""
+        return self.index.within_radius((x, y), radius)
+
+
+def demonstrate_spatial_queries():
+    """Demonstrate closest pair and grid index queries."""
+    print("1. Spatial Queries")
+    print("-" * 20)
+
+    points = [(0, 0), (3, 4), (1, 1), (5, 2), (2, 6), (8, 1), (4, 5)]
+    coord_sys = IndexedCoordinateSystem(cell_size=2.0)
+    coord_sys.add_points(points)
+    coord_sys.add_point(7, 7)
+
+    brute = CoordinateSystem()
+    brute.add_points(coord_sys.points)
+
+    print(f"Points: {coord_sys.points}")
+    p1, p2, d = coord_sys.find_closest_points()
+    print(f"Closest pair (divide & conquer): {p1}, {p2}, distance {d:.2f}")
+    p1, p2, d = brute.find_closest_points()
+    print(f"Closest pair (brute force):      {p1}, {p2}, distance {d:.2f}")
+
+    d, point = coord_sys.nearest(6, 6)
+    print(f"Nearest to (6, 6): {point} at {d:.2f}")
+    print(f"3 nearest to (2, 2): {[p for _, p in coord_sys.k_nearest(2, 2, 3)]}")
+    print(f"Within 3.0 of (4, 4): {[p for _, p in coord_sys.within_radius(4, 4, 3.0)]}")
+
+    print()
+
+
+def demonstrate_spatial_performance():
+    """Compare brute force with the indexed approach."""
+    print("2. Spatial Performance")
+    print("-" * 25)
+
+    random.seed(42)
+    n = 2_000
+    points = [(random.uniform(0, 1000), random.uniform(0, 1000)) for _ in range(n)]
+
+    brute = CoordinateSystem()
+    brute.add_points(points)
+    start = time.perf_counter()
+    brute_result = brute.find_closest_points()
+    brute_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dc_result = closest_pair(points)
+    dc_time = time.perf_counter() - start
+
+    indexed = IndexedCoordinateSystem(cell_size=suggest_cell_size(points))
+    indexed.add_points(points)
+    queries = [(random.uniform(0, 1000), random.uniform(0, 1000)) for _ in range(1_000)]
+    start = time.perf_counter()
+    for qx, qy in queries:
+        indexed.nearest(qx, qy)
+    query_time = time.perf_counter() - start
+
+    print(f"Closest pair of {n:,} points:")
+    print(f"  Brute force O(n²):           {brute_time:.4f}s (distance {brute_result[2]:.4f})")
+    print(f"  Divide & conquer O(n log n): {dc_time:.4f}s (distance {dc_result[2]:.4f})")
+    print(f"  1,000 nearest queries:       {query_time:.4f}s")
+
+    print()
+
+
+def main():
+    """Main function demonstrating spatial indexing."""
+    print("=== Day 8: Spatial Index ===")
+    print()
+
+    demonstrate_spatial_queries()
+    demonstrate_spatial_performance()
+
+    print("📚 Key Learning Points:")
+    print("• Brute-force pair comparison grows quadratically")
+    print("• Divide and conquer finds the closest pair in O(n log n)")
+    print("• A grid index restricts queries to nearby cells")
+    print("• Tuples make convenient hashable cell keys")
+
+
+if __name__ == "__main__":
+    main()
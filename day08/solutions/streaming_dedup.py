@@ -0,0 +1,290 @@
+"""
+Day 8 Solution: Streaming De-duplication
+========================================
+
+ListAlgorithms.remove_duplicates keeps every item in a set and returns a
+full list. This solution turns de-duplication into a generator that works on
+any iterable, with an exact mode (optionally keyed) and a probabilistic
+Bloom filter mode whose memory is fixed up front by the expected number of
+items and the acceptable false-positive rate.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import hashlib
+import math
+import numbers
+import struct
+import sys
+from typing import Iterable, Iterator, Callable, Optional, Any
+
+from list_operations import ListAlgorithms
+
+
+def _join_keys(tag: bytes, parts: Iterable[bytes]) -> bytes:
+    """Concatenate encoded parts, each prefixed with its length so the result is unambiguous."""
+    return tag + b''.join(len(part).to_bytes(8, 'little') + part for part in parts)
+
+
+def _encode_number(item: numbers.Number) -> bytes:
+    """Encode a number so that numbers comparing equal share one encoding."""
+    if isinstance(item, complex):
+        if item.imag:
+            return _join_keys(b'c', (_encode_number(item.real), _encode_number(item.imag)))
+        item = item.real
+    try:
+        as_int = int(item)
+    except (TypeError, ValueError, OverflowError):  # NaN, infinities, complex-like
+        as_int = None
+    if as_int is not None and as_int == item:
+        return b'i' + as_int.to_bytes(as_int.bit_length() // 8 + 1, 'little', signed=True)
+    try:
+        as_float = float(item)
+    except (TypeError, ValueError, OverflowError):
+        as_float = None
+    if as_float is not None and (as_float == item or (as_float != as_float and item != item)):
+        return b'f' + struct.pack('<d', as_float)
+    if hasattr(item, 'as_integer_ratio'):  # e.g. Fraction(1, 3), Decimal('0.1')
+        return _join_keys(b'r', (_encode_number(part) for part in item.as_integer_ratio()))
+    return b'h' + hash(item).to_bytes(8, 'little', signed=True)
+
+
+def _encode_key(item: Any) -> bytes:
+    """
+    Encode an item for hashing so that items equal in a set give equal bytes.
+
+    Strings, bytes, numbers, None, tuples and frozensets are encoded by
+    value with a type tag, recursively, so distinct keys only share bits by
+    Bloom filter chance: 1, 1.0 and True are one key while 'a' and b'a' are
+    two. Objects compared by identity are keyed by id() and other hashable
+    objects by hash(), so for those equal hashes also count as duplicates;
+    neither encoding is stable across processes.
+    """
+    if isinstance(item, str):
+        return b's' + item.encode('utf-8', 'surrogatepass')
+    if isinstance(item, bytes):
+        return b'b' + item
+    if isinstance(item, tuple):
+        return _join_keys(b't', map(_encode_key, item))
+    if isinstance(item, numbers.Number):
+        return _encode_number(item)
+    if item is None:
+        return b'n'
+    if isinstance(item, frozenset):
+        return _join_keys(b'z', sorted(map(_encode_key, item)))
+    cls = type(item)
+    if cls.__hash__ is object.__hash__ and cls.__eq__ is object.__eq__:
+        return b'o' + id(item).to_bytes(8, 'little')
+    return b'h' + hash(item).to_bytes(8, 'little', signed=True)
+
+
+class BloomFilter:
+    """
+    Space-efficient probabilistic set membership.
+
+    A Bloom filter never reports a seen item as new, but may report a new
+    item as seen with probability close to error_rate as long as no more
+    than capacity items have been added. Memory is fixed at construction.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("Error rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # Optimal bit count m and hash count k for n items at rate p
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    @staticmethod
+    def _to_bytes(item: Any) -> bytes:
+        """Encode an item so that equal items give equal bytes (see _encode_key)."""
+        return _encode_key(item)
+
+    def _positions(self, item: Any) -> Iterator[int]:
+        """Derive k bit positions from one digest using double hashing."""
+        digest = hashlib.blake2b(self._to_bytes(item), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        m = self.num_bits
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % m
+
+    def add(self, item: Any) -> bool:
+        """
+        Add an item.
+
+        Returns:
+            True if the item was (probably) already present
+        """
+        bits = self._bits
+        present = True
+        for pos in self._positions(item):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                present = False
+                bits[byte] |= mask
+        if not present:
+            self.count += 1
+        return present
+
+    def __contains__(self, item: Any) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self) -> int:
+        """Approximate number of distinct items added."""
+        return self.count
+
+    def memory_bytes(self) -> int:
+        """Size of the bit array in bytes."""
+        return len(self._bits)
+
+    def estimated_error_rate(self) -> float:
+        """Current false-positive probability given the items added so far."""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+
+def unique_everseen(iterable: Iterable[Any],
+                    key: Optional[Callable[[Any], Any]] = None) -> Iterator[Any]:
+    """
+    Yield unique items in first-seen order, exactly.
+
+    Memory grows with the number of distinct keys, not the stream length.
+
+    Args:
+        iterable: Any iterable, including generators and file objects
+        key: Optional function computing the identity of each item
+    """
+    seen = set()
+    seen_add = seen.add
+    if key is None:
+        for item in iterable:
+            if item not in seen:
+                seen_add(item)
+                yield item
+    else:
+        for item in iterable:
+            k = key(item)
+            if k not in seen:
+                seen_add(k)
+                yield item
+
+
+def unique_bloom(iterable: Iterable[Any], capacity: int, error_rate: float = 0.001,
+                 key: Optional[Callable[[Any], Any]] = None) -> Iterator[Any]:
+    """
+    Yield probably-unique items using a fixed-size Bloom filter.
+
+    Duplicates are always removed; a small fraction (about error_rate) of
+    genuinely new items may also be dropped. Memory does not grow.
+
+    Args:
+        iterable: Any iterable
+        capacity: Expected number of distinct items
+        error_rate: Acceptable false-positive rate
+        key: Optional function computing the identity of each item
+    """
+    bloom = BloomFilter(capacity, error_rate)
+    for item in iterable:
+        if not bloom.add(item if key is None else key(item)):
+            yield item
+
+
+def dedup_stream(iterable: Iterable[Any], mode: str = 'exact',
+                 key: Optional[Callable[[Any], Any]] = None,
+                 capacity: int = 1_000_000, error_rate: float = 0.001) -> Iterator[Any]:
+    """
+    De-duplicate a stream as a pipeline stage.
+
+    Args:
+        iterable: Any iterable
+        mode: 'exact' (set-based) or 'bloom' (fixed memory, probabilistic)
+        key: Optional function computing the identity of each item
+        capacity: Expected distinct items (bloom mode only)
+        error_rate: Acceptable false-positive rate (bloom mode only)
+
+    Raises:
+        ValueError: If mode is unknown
+    """
+    if mode == 'exact':
+        return unique_everseen(iterable, key)
+    elif mode == 'bloom':
+        return unique_bloom(iterable, capacity, error_rate, key)
+    raise ValueError(f"Invalid mode '{mode}'. Available: exact, bloom")
+
+
+def demonstrate_exact_dedup():
+    """Demonstrate exact generator-based de-duplication."""
+    print("1. Exact Streaming De-duplication")
+    print("-" * 40)
+
+    with_duplicates = [1, 2, 2, 3, 4, 4, 5, 1, 6]
+    print(f"remove_duplicates: {ListAlgorithms.remove_duplicates(with_duplicates)}")
+    print(f"unique_everseen:   {list(unique_everseen(with_duplicates))}")
+
+    emails = ["Alice@Example.com", "bob@example.com", "alice@example.com", "BOB@example.com "]
+    unique_emails = list(dedup_stream(emails, key=lambda e: e.strip().lower()))
+    print(f"Case-insensitive emails: {unique_emails}")
+
+    # Works lazily on generators - only the items needed for the first 4 are read
+    squares_mod = (i * i % 7 for i in range(10 ** 9))
+    first_unique = []
+    for value in unique_everseen(squares_mod):
+        first_unique.append(value)
+        if len(first_unique) == 4:
+            break
+    print(f"First unique squares mod 7 from a huge generator: {first_unique}")
+
+    print()
+
+
+def demonstrate_bloom_dedup():
+    """Demonstrate fixed-memory probabilistic de-duplication."""
+    print("2. Bloom Filter De-duplication")
+    print("-" * 35)
+
+    n = 200_000
+    stream = (f"txn-{i % (n // 2)}" for i in range(n))  # Every ID appears twice
+
+    bloom = BloomFilter(capacity=n // 2, error_rate=0.01)
+    kept = 0
+    for txn_id in stream:
+        if not bloom.add(txn_id):
+            kept += 1
+
+    exact_set = {f"txn-{i}" for i in range(n // 2)}
+    set_bytes = sys.getsizeof(exact_set) + sum(sys.getsizeof(s) for s in exact_set)
+
+    print(f"Stream of {n:,} IDs with {n // 2:,} distinct")
+    print(f"  Kept: {kept:,} (dropped {n // 2 - kept} new IDs as false positives)")
+    print(f"  Bloom filter: {bloom.memory_bytes():,} bytes, {bloom.num_hashes} hashes")
+    print(f"  Exact set:    {set_bytes:,} bytes")
+    print(f"  Estimated false-positive rate: {bloom.estimated_error_rate():.4f}")
+
+    print()
+
+
+def main():
+    """Main function demonstrating streaming de-duplication."""
+    print("=== Day 8: Streaming De-duplication ===")
+    print()
+
+    demonstrate_exact_dedup()
+    demonstrate_bloom_dedup()
+
+    print("📚 Key Learning Points:")
+    print("• Generators let de-duplication run as a lazy pipeline stage")
+    print("• Key functions define what counts as a duplicate")
+    print("• Exact de-duplication needs memory for every distinct key")
+    print("• Bloom filters trade a small false-positive rate for fixed memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,454 @@
+"""
+Day 8 Solution: Streaming Number Analysis
+=========================================
+
+analyze_numbers and find_min_max_with_indices in tuple_examples.py take a
+materialized list and walk it several times. This solution computes the same
+tuples in a single pass over any iterable or buffer-protocol object (array,
+bytes, mmap, NumPy array), using Welford's algorithm for mean and standard
+deviation. Partial results merge associatively, so large inputs can also be
+split into chunks and reduced in parallel across processes.
+
+Author: Python Learning Assistant
+Date: 2024
+"""
+
+import heapq
+import math
+import os
+import random
+import statistics
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Tuple, List, Optional, Iterable, Iterator, Union, TextIO
+
+from tuple_examples import analyze_numbers, find_min_max_with_indices
+
+
+Number = Union[int, float]
+
+# Values read per block when keeping them for an exact median
+MEDIAN_BLOCK_SIZE = 1 << 16
+
+
+def iter_numbers(data: Union[Iterable[Number], bytes, memoryview]) -> Iterator[Number]:
+    """
+    Iterate over numbers from an iterable or a buffer-protocol object.
+
+    Buffers (array.array, NumPy arrays...) are read through a flat
+    memoryview, so no intermediate list is built. For a file of raw
+    doubles pass memoryview(mmap_object).cast('d').
+    """
+    if isinstance(data, str):
+        raise TypeError("Expected numbers, got a string")
+    if isinstance(data, (list, tuple, range)) or not _supports_buffer(data):
+        return iter(data)
+    view = memoryview(data)
+    if view.ndim != 1:
+        view = view.cast('B').cast(view.format)
+    return iter(view)
+
+
+def _supports_buffer(data: object) -> bool:
+    try:
+        memoryview(data)
+    except TypeError:
+        return False
+    return True
+
+
+def iter_text_numbers(file: TextIO) -> Iterator[float]:
+    """Yield one float per non-blank line of a text file."""
+    for line in file:
+        line = line.strip()
+        if line:
+            yield float(line)
+
+
+class P2Quantile:
+    """
+    P² (Jain & Chlamtac) streaming quantile estimator in constant memory.
+
+    Tracks five markers whose heights approximate the requested quantile
+    without storing the observations.
+    """
+
+    def __init__(self, quantile: float = 0.5):
+        if not 0 < quantile < 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        self.p = quantile
+        self._initial: List[float] = []
+        self._heights: List[float] = []
+        self._positions: List[int] = []
+        self._desired: List[float] = []
+        self._increments = [0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0]
+
+    def add(self, x: float) -> None:
+        """Add one observation."""
+        if len(self._initial) < 5:
+            self._initial.append(x)
+            if len(self._initial) == 5:
+                self._initial.sort()
+                p = self.p
+                self._heights = list(self._initial)
+                self._positions = [1, 2, 3, 4, 5]
+                self._desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+            return
+
+        q = self._heights
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        n = self._positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not q[i - 1] < candidate < q[i + 1]:
+                    candidate = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = candidate
+                n[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+    def value(self) -> float:
+        """Current estimate (exact while fewer than five observations)."""
+        if len(self._initial) < 5:
+            if not self._initial:
+                return 0.0
+            ordered = sorted(self._initial)
+            position = self.p * (len(ordered) - 1)
+            low = int(position)
+            high = min(low + 1, len(ordered) - 1)
+            return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+        return self._heights[2]
+
+
+@dataclass
+class RunningStats:
+    """
+    Single-pass accumulator for count, sum, mean, variance and min/max.
+
+    Two accumulators over consecutive chunks merge associatively (Chan et
+    al.'s parallel variance formula), so chunks can be reduced in any
+    grouping. The total is added up value by value like sum(), so it stays
+    an exact int while every value is an int; mean is Welford's running
+    mean, used for the variance.
+    """
+    count: int = 0
+    total: Number = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min_index: int = 0
+    min_value: Optional[Number] = None
+    max_index: int = 0
+    max_value: Optional[Number] = None
+
+    def add(self, value: Number) -> None:
+        """Fold in one value (its index is the current count)."""
+        index = self.count
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.min_value is None or value < self.min_value:
+            self.min_value, self.min_index = value, index
+        if self.max_value is None or value > self.max_value:
+            self.max_value, self.max_index = value, index
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """Combine with the stats of the chunk that immediately follows this one."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return RunningStats(**other.__dict__)
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        merged = RunningStats(
+            count=count,
+            total=self.total + other.total,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2 + other.m2 + delta * delta * self.count * other.count / count,
+            min_index=self.min_index, min_value=self.min_value,
+            max_index=self.max_index, max_value=self.max_value
+        )
+        # Strict comparisons keep the first occurrence, like the list version
+        if other.min_value < self.min_value:
+            merged.min_value, merged.min_index = other.min_value, other.min_index + self.count
+        if other.max_value > self.max_value:
+            merged.max_value, merged.max_index = other.max_value, other.max_index + self.count
+        return merged
+
+    @property
+    def std_dev(self) -> float:
+        """Sample standard deviation (matches statistics.stdev)."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+def _middle_of_sorted(runs: List[Iterable[float]], count: int) -> float:
+    """Exact median from sorted runs, merging only up to the midpoint."""
+    merged = heapq.merge(*runs)
+    lower = (count - 1) // 2
+    for i, value in enumerate(merged):
+        if i == lower:
+            if count % 2:
+                return value
+            return (value + next(merged)) / 2
+    return 0.0
+
+
+class _MedianValues:
+    """
+    Values kept for an exact median, as compactly as they stay exact.
+
+    Like the sorted runs of _reduce_chunk: array('q') while every value is
+    an int that fits in 64 bits, array('d') while every value is a float,
+    and a plain list (of the original objects) otherwise, so big ints and
+    mixed inputs give the same median as statistics.median on a list.
+    """
+
+    def __init__(self):
+        self.values: Union[array, List[Number], None] = None
+
+    def extend(self, block: List[Number]) -> None:
+        """Add a block of values, checking their types once per block."""
+        values = self.values
+        if not isinstance(values, list):
+            typecode = values.typecode if values is not None else None
+            kinds = set(map(type, block))
+            try:
+                if kinds == {int} and typecode in (None, 'q'):
+                    block = array('q', block)
+                elif kinds == {float} and typecode in (None, 'd'):
+                    block = array('d', block)
+                else:
+                    values = list(values or ())
+            except OverflowError:  # an int beyond 64 bits
+                values = list(values or ())
+        if values is None:
+            values = block
+        else:
+            values.extend(block)
+        self.values = values
+
+    def median(self) -> Number:
+        return statistics.median(self.values) if self.values else 0.0
+
+
+def analyze_numbers_stream(numbers: Iterable[Number],
+                           exact_median: bool = True) -> Tuple[float, float, float, int, float]:
+    """
+    Single-pass version of analyze_numbers for any iterable or buffer.
+
+    Args:
+        numbers: Iterable, generator, file stream or buffer of numbers
+        exact_median: Keep the values (in a compact array when they are all
+            ints or all floats) for an exact median, the same as
+            analyze_numbers gives; if False, estimate it in constant memory
+            with P²
+
+    Returns:
+        Tuple containing (mean, median, std_dev, count, sum)
+    """
+    stats = RunningStats()
+    if exact_median:
+        values = _MedianValues()
+        iterator = iter_numbers(numbers)
+        for block in iter(lambda: list(islice(iterator, MEDIAN_BLOCK_SIZE)), []):
+            for value in block:
+                stats.add(value)
+            values.extend(block)
+        median = values.median()
+    else:
+        estimator = P2Quantile(0.5)
+        for value in iter_numbers(numbers):
+            stats.add(value)
+            estimator.add(value)
+        median = estimator.value()
+
+    if stats.count == 0:
+        return (0.0, 0.0, 0.0, 0, 0.0)
+    return (stats.total / stats.count, median, stats.std_dev, stats.count, stats.total)
+
+
+def find_min_max_stream(data: Iterable[Number]) -> Tuple[Tuple[int, Number], Tuple[int, Number]]:
+    """
+    Single-pass version of find_min_max_with_indices for any iterable or buffer.
+
+    Returns:
+        Tuple containing ((min_index, min_value), (max_index, max_value))
+    """
+    stats = RunningStats()
+    for value in iter_numbers(data):
+        stats.add(value)
+    if stats.count == 0:
+        return ((0, 0), (0, 0))
+    return ((stats.min_index, stats.min_value), (stats.max_index, stats.max_value))
+
+
+def _chunks(numbers: Iterable[Number], chunk_size: int) -> Iterator[List[Number]]:
+    iterator = iter_numbers(numbers)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _reduce_chunk(chunk: List[Number]) -> Tuple[RunningStats, Union[array, List[Number]]]:
+    """Worker: stats for one chunk plus the chunk sorted for the median."""
+    stats = RunningStats()
+    for value in chunk:
+        stats.add(value)
+    ordered = sorted(chunk)
+    # Hand sorted runs back compactly, keeping ints as ints
+    try:
+        if all(isinstance(value, int) for value in ordered):
+            return stats, array('q', ordered)
+        return stats, array('d', ordered)
+    except (OverflowError, TypeError):
+        return stats, ordered
+
+
+def analyze_numbers_parallel(numbers: Iterable[Number], chunk_size: int = 1_000_000,
+                             workers: Optional[int] = None
+                             ) -> Tuple[Tuple[float, float, float, int, float],
+                                        Tuple[Tuple[int, Number], Tuple[int, Number]]]:
+    """
+    Chunked parallel reduction across processes.
+
+    Each worker reduces one chunk and sorts it; partial stats are merged in
+    chunk order and the exact median is found by merging the sorted chunks
+    up to the midpoint. At most two chunks per worker are in flight, so the
+    input is not read far ahead of the workers; the sorted chunks are kept
+    for the median.
+
+    Integer inputs give the same sum and mean as analyze_numbers. For
+    floats the chunk sums are added in a different grouping than sum(), so
+    the sum and mean may differ from analyze_numbers in the last bits.
+
+    Returns:
+        (analyze_numbers tuple, find_min_max_with_indices tuple)
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+    workers = workers or os.cpu_count() or 1
+
+    total = RunningStats()
+    runs: List[Union[array, List[Number]]] = []
+
+    def collect(future) -> None:
+        nonlocal total
+        stats, sorted_chunk = future.result()
+        total = total.merge(stats)
+        runs.append(sorted_chunk)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in _chunks(numbers, chunk_size):
+            pending.append(executor.submit(_reduce_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                collect(pending.popleft())
+        while pending:
+            collect(pending.popleft())
+
+    if total.count == 0:
+        return (0.0, 0.0, 0.0, 0, 0.0), ((0, 0), (0, 0))
+    median = _middle_of_sorted(runs, total.count)
+    analysis = (total.total / total.count, median, total.std_dev, total.count, total.total)
+    min_max = ((total.min_index, total.min_value), (total.max_index, total.max_value))
+    return analysis, min_max
+
+
+def demonstrate_streaming_analysis():
+    """Demonstrate single-pass analysis on lists, generators and buffers."""
+    print("1. Single-Pass Analysis")
+    print("-" * 25)
+
+    test_numbers = [23, 45, 12, 78, 34, 56, 89, 23, 67, 45]
+    print(f"analyze_numbers:        {analyze_numbers(test_numbers)}")
+    print(f"analyze_numbers_stream: {analyze_numbers_stream(iter(test_numbers))}")
+    print(f"find_min_max_with_indices: {find_min_max_with_indices(test_numbers)}")
+    print(f"find_min_max_stream:       {find_min_max_stream(array('d', test_numbers))}")
+
+    approx = analyze_numbers_stream((random.gauss(50, 10) for _ in range(100_000)),
+                                    exact_median=False)
+    print(f"Generator of 100,000 values (P² median): mean={approx[0]:.2f}, "
+          f"median≈{approx[1]:.2f}, std={approx[2]:.2f}")
+
+    print()
+
+
+def demonstrate_parallel_analysis():
+    """Compare list-based, streaming and parallel analysis."""
+    print("2. Chunked Parallel Reduction")
+    print("-" * 35)
+
+    random.seed(42)
+    data = array('d', (random.uniform(0, 1000) for _ in range(1_000_000)))
+
+    start = time.perf_counter()
+    as_list = data.tolist()
+    baseline = analyze_numbers(as_list), find_min_max_with_indices(as_list)
+    baseline_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    streamed = analyze_numbers_stream(data), find_min_max_stream(data)
+    stream_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = analyze_numbers_parallel(data, chunk_size=250_000)
+    parallel_time = time.perf_counter() - start
+
+    def close(a, b):
+        return all(math.isclose(x, y, rel_tol=1e-9) for x, y in zip(a, b))
+
+    print(f"{len(data):,} values:")
+    print(f"  List functions:     {baseline_time:.4f}s")
+    print(f"  Single pass:        {stream_time:.4f}s (match: {close(baseline[0], streamed[0])})")
+    print(f"  Parallel ({os.cpu_count()} cpus):  {parallel_time:.4f}s "
+          f"(match: {close(baseline[0], parallel[0]) and baseline[1] == parallel[1]})")
+
+    print()
+
+
+def main():
+    """Main function demonstrating streaming number analysis."""
+    print("=== Day 8: Streaming Number Analysis ===")
+    print()
+
+    demonstrate_streaming_analysis()
+    demonstrate_parallel_analysis()
+
+    print("📚 Key Learning Points:")
+    print("• Welford's algorithm gives mean and variance in one pass")
+    print("• memoryview reads array, mmap and NumPy buffers without copying")
+    print("• Mergeable partial results make chunked parallelism possible")
+    print("• An exact median needs the values; P² estimates it in constant memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -145,18 +145,77 @@ def demonstrate_advanced_named_tuples():
 
 # Example 4: Coordinate System with Tuples
 class CoordinateSystem:
-    """A coordinate system using tuples for points."""
+    """
+    A coordinate system using tuples for points.
+    
+    Running sums and min/max values are maintained as points are added, so
+    get_centroid and get_bounding_box are O(1). Removing a point marks the
+    aggregates stale; they are recomputed lazily on the next query, since
+    subtracting from a float sum can lose the remaining points to
+    cancellation. Points appended to self.points directly are noticed by
+    the count check, but points edited in place are not - call
+    refresh_aggregates() after doing that.
+    """
     
     def __init__(self):
         self.points: List[Tuple[float, float]] = []
+        self._reset_aggregates()
+    
+    def _reset_aggregates(self) -> None:
+        """Clear the running sums and bounds."""
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._min_x = self._min_y = float('inf')
+        self._max_x = self._max_y = float('-inf')
+        self._aggregated = 0  # points folded into the aggregates
+        self._stale = False
+    
+    def _include_point(self, x: float, y: float) -> None:
+        """Fold a new point into the running aggregates."""
+        self._aggregated += 1
+        self._sum_x += x
+        self._sum_y += y
+        if x < self._min_x:
+            self._min_x = x
+        if x > self._max_x:
+            self._max_x = x
+        if y < self._min_y:
+            self._min_y = y
+        if y > self._max_y:
+            self._max_y = y
     
     def add_point(self, x: float, y: float) -> None:
         """Add a point to the coordinate system."""
         self.points.append((x, y))
+        self._include_point(x, y)
     
     def add_points(self, points: List[Tuple[float, float]]) -> None:
         """Add multiple points."""
+        start = len(self.points)
         self.points.extend(points)
+        for x, y in self.points[start:]:
+            self._include_point(x, y)
+    
+    def remove_point(self, x: float, y: float) -> None:
+        """
+        Remove one occurrence of a point.
+        
+        Raises:
+            ValueError: If the point is not in the system
+        """
+        self.points.remove((x, y))
+        self._stale = True
+    
+    def refresh_aggregates(self) -> None:
+        """Recompute all aggregates from scratch (e.g. after editing self.points directly)."""
+        self._reset_aggregates()
+        for x, y in self.points:
+            self._include_point(x, y)
+    
+    def _current_aggregates(self) -> None:
+        """Recompute the aggregates if a removal or direct edit invalidated them."""
+        if self._stale or self._aggregated != len(self.points):
+            self.refresh_aggregates()
     
     def get_distance(self, point1: Tuple[float, float], point2: Tuple[float, float]) -> float:
         """Calculate Euclidean distance between two points."""
@@ -182,12 +241,13 @@ class CoordinateSystem:
         return closest_pair
     
     def get_centroid(self) -> Optional[Tuple[float, float]]:
-        """Calculate the centroid of all points."""
+        """Calculate the centroid of all points from the running sums."""
         if not self.points:
             return None
         
-        avg_x = sum(point[0] for point in self.points) / len(self.points)
-        avg_y = sum(point[1] for point in self.points) / len(self.points)
+        self._current_aggregates()
+        avg_x = self._sum_x / len(self.points)
+        avg_y = self._sum_y / len(self.points)
         
         return (avg_x, avg_y)
     
@@ -196,12 +256,9 @@ class CoordinateSystem:
         if not self.points:
             return None
         
-        min_x = min(point[0] for point in self.points)
-        max_x = max(point[0] for point in self.points)
-        min_y = min(point[1] for point in self.points)
-        max_y = max(point[1] for point in self.points)
+        self._current_aggregates()
         
-        return ((min_x, min_y), (max_x, max_y))
+        return ((self._min_x, self._min_y), (self._max_x, self._max_y))
 
 
 def demonstrate_coordinate_system():
@@ -238,6 +295,11 @@ def demonstrate_coordinate_system():
         min_point, max_point = bbox
         print(f"Bounding box: {min_point} to {max_point}")
     
+    # Removing a corner point marks the bounds stale until the next query
+    coord_sys.remove_point(8, 1)
+    min_point, max_point = coord_sys.get_bounding_box()
+    print(f"After removing (8, 1): bounding box {min_point} to {max_point}")
+    
     print()
 
 